@@ -0,0 +1,137 @@
+"""İmleç eylem iş parçacığı: kamera hızından bağımsız, yüksek hızlı hareket
+
+Kontrolcü her yeni karede filtrelenmiş hedefi set_target() ile verir.
+Eylem iş parçacığı ekran yenileme hızında (ör. 120-240 Hz) çalışır ve imleci
+bir kare süresinde hedefe doğru ara değerler. Hedef zaten filtrede gecikme
+kadar ileri kestirilmiştir; burada yalnızca yeni hedef gecikirse kısa süre
+son hızla devam edilir, sonra beklenir. Tıklamalar ara noktada değil, imleç
+hedefe oturtulduktan sonra gönderilir. Fare olayları
+(hareket, tıklama, kaydırma) InputInjector kuyruğu üzerinden gönderilir;
+işletim sistemine giden tek yol budur.
+
+rate=0 ise iş parçacıkları kurulmaz, her çağrı hemen uygulanır (ölçüm için).
+"""
+import threading
+import time
+
+from injection import InputInjector
+
+
+class CursorActuator:
+    def __init__(self, screen_width, screen_height, rate=120, max_extrapolation=0.05,
+                 backend=None):
+        self.screen_width = screen_width
+        self.screen_height = screen_height
+        self.rate = rate
+        self.max_extrapolation = max_extrapolation  # Hedef gelmezse en fazla bu kadar ileri (s)
+        self.injector = InputInjector(backend, threaded=bool(rate))
+
+        self._lock = threading.Lock()
+        self._send_lock = threading.Lock()  # Hareket ile tık sırası karışmasın
+        self._target = None       # (varış zamanı, x, y)
+        self._velocity = (0.0, 0.0)
+        self._segment = None      # (başlangıç zamanı, başlangıç x, y, bitiş x, y, süre)
+        self._interval = 1.0 / 30  # Hedefler arası süre (üstel ortalama)
+        self.position = None
+        self.last_sent = None
+
+        self.moves = 0
+        self.ticks = 0
+        self.running = False
+        self.thread = None
+
+    def start(self):
+        if self.running or not self.rate:
+            return
+        self.injector.start()
+        self.running = True
+        self.thread = threading.Thread(target=self._loop, daemon=True)
+        self.thread.start()
+
+    def stop(self, timeout=1.0):
+        self.running = False
+        if self.thread is not None:
+            self.thread.join(timeout)
+            self.thread = None
+        self.injector.stop()
+
+    def set_target(self, x, y):
+        now = time.perf_counter()
+        if not self.running:
+            self._move(x, y)
+            return
+        with self._lock:
+            if self._target is not None:
+                t0, x0, y0 = self._target
+                dt = now - t0
+                if dt > 0:
+                    self._interval += 0.2 * (min(dt, 0.25) - self._interval)
+                    self._velocity = ((x - x0) / dt, (y - y0) / dt)
+            self._target = (now, x, y)
+            # Şu anki konumdan hedefin kendisine, bir kare süresinde git
+            start = self.position if self.position is not None else (x, y)
+            self._segment = (now, start[0], start[1], x, y, self._interval)
+
+    def press(self, button):
+        with self._send_lock:
+            self._snap()
+            self.injector.press(button)
+
+    def release(self, button):
+        with self._send_lock:
+            self._snap()
+            self.injector.release(button)
+
+    def _snap(self):
+        # İmleci son hedefe oturt: tık ara değer noktasında değil hedefte olsun
+        with self._lock:
+            if self._target is None:
+                return
+            now, x, y = time.perf_counter(), self._target[1], self._target[2]
+            self._segment = (now, x, y, x, y, 0.0)
+            self._velocity = (0.0, 0.0)
+        self._move(x, y, skip_same=True)
+
+    def scroll(self, amount):
+        self.injector.scroll(amount)
+
+    def _sample(self, now):
+        # Segment boyunca doğrusal ara değer; sonraki hedef gecikirse sınırlı ileri kestirim
+        with self._lock:
+            if self._segment is None:
+                return None
+            t0, x0, y0, x1, y1, duration = self._segment
+            vx, vy = self._velocity
+        elapsed = now - t0
+        if elapsed <= duration:
+            a = elapsed / duration if duration > 0 else 1.0
+            return x0 + (x1 - x0) * a, y0 + (y1 - y0) * a
+        extra = min(elapsed - duration, self.max_extrapolation)
+        return x1 + vx * extra, y1 + vy * extra
+
+    def _move(self, x, y, skip_same=False):
+        self.position = (x, y)
+        x = max(0, min(self.screen_width - 1, int(x)))
+        y = max(0, min(self.screen_height - 1, int(y)))
+        if skip_same and (x, y) == self.last_sent:
+            return
+        self.injector.move(x, y)
+        self.last_sent = (x, y)
+        self.moves += 1
+
+    def _loop(self):
+        period = 1.0 / self.rate
+        next_tick = time.perf_counter()
+        while self.running:
+            with self._send_lock:
+                point = self._sample(time.perf_counter())
+                if point is not None:
+                    self._move(*point, skip_same=True)
+            self.ticks += 1
+
+            next_tick += period
+            delay = next_tick - time.perf_counter()
+            if delay > 0:
+                time.sleep(delay)
+            else:
+                next_tick = time.perf_counter()  # Geride kaldıysak yetişmeye çalışma
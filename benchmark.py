@@ -0,0 +1,576 @@
+"""El-fare yolu için gecikme ölçümü (ekransız çalışır)
+
+Kamera ve pyautogui yerel sahte nesnelerle değiştirilir; kareler kayıtlı bir
+videodan ya da sentetik olarak üretilip HandMouseController'dan geçirilir.
+
+    python benchmark.py --frames 600
+    python benchmark.py --video kayit.mp4 --hands mediapipe
+    python benchmark.py --replay kayitlar/oturum1 --hands mediapipe
+    python benchmark.py --mode pipeline --fps 60 --max-p95-ms 25
+    python benchmark.py --replay kayitlar/oturum1 --compare-filters
+    python benchmark.py --idle --idle-after 1
+"""
+import argparse
+import json
+import math
+import sys
+import time
+import types
+from types import SimpleNamespace
+
+import numpy as np
+
+
+class ActuationRecorder:
+    """pyautogui yerine geçen modül: çağrıları zaman damgasıyla kaydeder"""
+    def __init__(self):
+        self.events = []
+        self.last_move_time = None
+        self.module = types.ModuleType('pyautogui')
+        self.module.FAILSAFE = False
+        self.module.MINIMUM_DURATION = 0
+        self.module.MINIMUM_SLEEP = 0
+        self.module.PAUSE = 0
+        self.module.moveTo = self.move_to
+        self.module.mouseDown = self.mouse_down
+        self.module.mouseUp = self.mouse_up
+        self.module.scroll = self.scroll
+        self.module.position = self.position
+        self.module.size = lambda: (1920, 1080)
+
+    def move_to(self, x, y, duration=0, _pause=True):
+        self.last_move_time = time.perf_counter()
+        self.events.append(('move', self.last_move_time))
+
+    def mouse_down(self, button='left', _pause=True):
+        self.events.append(('down', time.perf_counter()))
+
+    def mouse_up(self, button='left', _pause=True):
+        self.events.append(('up', time.perf_counter()))
+
+    def scroll(self, clicks, _pause=True):
+        self.events.append(('scroll', time.perf_counter()))
+
+    def position(self):
+        return (0, 0)
+
+
+class ReplayCamera:
+    """cv2.VideoCapture yerine: bellekteki kareleri döngüyle verir"""
+    def __init__(self, frames, fps=None):
+        self.frames = frames
+        self.interval = 1.0 / fps if fps else 0
+        self.index = 0
+        self.next_time = None
+
+    def read(self):
+        if self.interval:
+            now = time.perf_counter()
+            if self.next_time is not None and now < self.next_time:
+                time.sleep(self.next_time - now)
+            self.next_time = max(now, self.next_time or now) + self.interval
+        frame = self.frames[self.index % len(self.frames)]
+        self.index += 1
+        return True, frame
+
+    def set(self, prop, value):
+        return False
+
+    def isOpened(self):
+        return True
+
+    def release(self):
+        pass
+
+
+class SyntheticHands:
+    """mp.solutions.hands yerine: daire çizen ve aralıklı çimdikleyen el
+
+    noise > 0 ise işaret parmağı ucuna normalize birimde Gauss gürültüsü eklenir
+    (filtre titreşim ölçümü için). present=False iken el bulunamaz
+    (boşta modu ölçümü için).
+    """
+    def __init__(self, cost_ms=0.0, period=120, noise=0.0, seed=0):
+        self.cost = cost_ms / 1000.0
+        self.period = period
+        self.noise = noise
+        self.rng = np.random.default_rng(seed)
+        self.frame = 0
+        self.present = True
+        self.calls = 0
+
+    def process(self, rgb):
+        self.calls += 1
+        if self.cost:
+            end = time.perf_counter() + self.cost
+            while time.perf_counter() < end:
+                pass
+        if not self.present:
+            return SimpleNamespace(multi_hand_landmarks=None)
+        phase = 2 * math.pi * (self.frame % self.period) / self.period
+        self.frame += 1
+        cx = 0.5 + 0.2 * math.cos(phase)
+        cy = 0.5 + 0.2 * math.sin(phase)
+        points = [SimpleNamespace(x=cx, y=cy + 0.1, z=0.0) for _ in range(21)]
+        points[0] = SimpleNamespace(x=cx, y=cy + 0.3, z=0.0)  # Bilek: avuç boyu 0.2
+        nx, ny = self.rng.normal(0.0, self.noise, 2) if self.noise else (0.0, 0.0)
+        points[8] = SimpleNamespace(x=cx + nx, y=cy + ny, z=0.0)
+        # Her periyodun ilk çeyreğinde baş-işaret parmağı çimdiği
+        pinch = (self.frame % self.period) < self.period // 4
+        points[4] = SimpleNamespace(x=cx + (0.01 if pinch else 0.08), y=cy, z=0.0)
+        points[12] = SimpleNamespace(x=cx - 0.08, y=cy, z=0.0)
+        hand = SimpleNamespace(landmark=points)
+        return SimpleNamespace(multi_hand_landmarks=[hand])
+
+
+class Timed:
+    """Bir çağrının son süresini ölçen sarmalayıcı"""
+    def __init__(self, func):
+        self.func = func
+        self.last = 0.0
+
+    def __call__(self, *args, **kwargs):
+        start = time.perf_counter()
+        try:
+            return self.func(*args, **kwargs)
+        finally:
+            self.last = time.perf_counter() - start
+
+
+class FilterTrace:
+    """update_target çağrılarını (zaman, ham x, ham y, çıktı x, çıktı y) olarak kaydeder"""
+    def __init__(self, func):
+        self.func = func
+        self.samples = []
+
+    def __call__(self, target_x, target_y, captured=None):
+        out = self.func(target_x, target_y, captured)
+        timestamp = time.perf_counter() if captured is None else captured
+        self.samples.append((timestamp, target_x, target_y) + tuple(out))
+        return out
+
+    def clear(self):
+        self.samples = []
+
+    def metrics(self):
+        from filters import jitter_lag
+        if len(self.samples) < 2:
+            return jitter_lag([], [], 0.0)
+        samples = np.asarray(self.samples)
+        interval = float(np.median(np.diff(samples[:, 0])))
+        return jitter_lag(samples[:, 1:3], samples[:, 3:5], interval)
+
+
+def synthetic_frames(count, width, height, seed=0, static=0.0):
+    # static: karelerin bu oranında görüntü bir öncekiyle aynı kalır
+    rng = np.random.default_rng(seed)
+    base = rng.integers(0, 256, size=(height, width, 3), dtype=np.uint8)
+    steps = np.floor(np.arange(count) * (1.0 - static)).astype(int)
+    return [np.roll(base, int(step) * 3, axis=1) for step in steps]
+
+
+def video_frames(path, width, height, limit):
+    import cv2
+    cap = cv2.VideoCapture(path)
+    frames = []
+    while len(frames) < limit:
+        ret, frame = cap.read()
+        if not ret:
+            break
+        frames.append(cv2.resize(frame, (width, height)))
+    cap.release()
+    if not frames:
+        raise SystemExit(f"Video okunamadı: {path}")
+    return frames
+
+
+def replay_frames(path, width, height):
+    from framesource import ReplaySource
+    source = ReplaySource(path, speed='max')
+    if not len(source):
+        raise SystemExit(f"Kayıt boş: {path}")
+    if (source.width, source.height) == (width, height):
+        return source.frames
+    import cv2
+    return [cv2.resize(frame, (width, height)) for frame in source.frames]
+
+
+def install_standins():
+    recorder = ActuationRecorder()
+    sys.modules['pyautogui'] = recorder.module
+    return recorder
+
+
+def percentiles(values):
+    if not values:
+        return {'p50': None, 'p95': None, 'p99': None, 'mean': None}
+    arr = np.asarray(values) * 1000
+    p50, p95, p99 = np.percentile(arr, [50, 95, 99])
+    return {'p50': float(p50), 'p95': float(p95), 'p99': float(p99),
+            'mean': float(arr.mean())}
+
+
+def build_controller(args):
+    import parmakkontrol
+    from filters import parse_params
+    from motiongate import MotionGate
+    # Sentetik modda MediaPipe hiç içe aktarılmaz
+    hands = None
+    if args.hands == 'synthetic':
+        hands = SyntheticHands(cost_ms=args.fake_cost_ms, noise=args.fake_noise)
+    controller = parmakkontrol.HandMouseController(args.screen_width, args.screen_height,
+                                                   roi_mode=args.roi, smoothing=args.filter,
+                                                   predict=args.predict,
+                                                   filter_params=parse_params(args.filter_param),
+                                                   cursor_rate=args.cursor_rate,
+                                                   motion_gate=MotionGate() if args.motion_gate else None,
+                                                   hands=hands)
+    from pipeline import StageStats
+    controller.gestures.stats = StageStats(window=args.frames)
+    mouse = controller.mouse_controller
+    mouse.update_target = FilterTrace(mouse.update_target)
+    controller.filter_trace = mouse.update_target
+    return controller
+
+
+def instrument(controller):
+    # Aşama sürelerini ölçmek için kontrolcü metodlarını sar
+    timers = {
+        'detect': Timed(controller.detect),
+        'act': Timed(controller.act),
+        'hands': Timed(controller.hands.process),
+        'smoothing': Timed(controller.mouse_controller.update_target),
+    }
+    controller.detect = timers['detect']
+    controller.act = timers['act']
+    controller.hands.process = timers['hands']
+    controller.mouse_controller.update_target = timers['smoothing']
+    return timers
+
+
+def run_serial(args, frames, recorder):
+    import cv2
+    controller = build_controller(args)
+    timers = instrument(controller)
+    camera = ReplayCamera(frames, fps=args.fps)
+    stages = {'color': [], 'hands.process': [], 'smoothing': [], 'actuation': []}
+    latencies = []
+
+    for _ in range(args.warmup):
+        ret, frame = camera.read()
+        controller.process_hand(frame)
+    controller.filter_trace.clear()
+    controller.gestures.stats.reset()
+
+    start = time.perf_counter()
+    for _ in range(args.frames):
+        for timer in timers.values():
+            timer.last = 0.0
+        recorder.last_move_time = None
+        ret, frame = camera.read()
+        landed = time.perf_counter()
+        if args.mirror:
+            frame = cv2.flip(frame, 1)
+        controller.process_hand(frame, landed)
+
+        stages['color'].append(timers['detect'].last - timers['hands'].last)
+        stages['hands.process'].append(timers['hands'].last)
+        if recorder.last_move_time is not None:
+            stages['smoothing'].append(timers['smoothing'].last)
+            stages['actuation'].append(timers['act'].last - timers['smoothing'].last)
+            latencies.append(recorder.last_move_time - landed)
+    elapsed = time.perf_counter() - start
+    return latencies, stages, args.frames / elapsed, controller
+
+
+def run_pipeline(args, frames, recorder):
+    from pipeline import HandPipeline, StageStats
+    controller = build_controller(args)
+    camera = ReplayCamera(frames, fps=args.fps)
+    pipeline = HandPipeline(camera, controller, mirror=lambda: args.mirror)
+    pipeline.stats = StageStats(window=args.frames)
+
+    controller.start()
+    pipeline.start()
+    time.sleep(args.warmup / args.fps)
+    pipeline.stats.reset()
+    controller.filter_trace.clear()
+    controller.gestures.stats.reset()
+    moves_before = sum(1 for e in recorder.events if e[0] == 'move')
+    start = time.perf_counter()
+    time.sleep(args.frames / args.fps)
+    elapsed = time.perf_counter() - start
+    pipeline.stop()
+    controller.stop()
+
+    latencies = pipeline.stats.values('latency')
+    stages = {stage: pipeline.stats.values(stage)
+              for stage in ('capture', 'inference', 'actuation')}
+    moves = sum(1 for e in recorder.events if e[0] == 'move') - moves_before
+    controller.cursor_moves_per_s = moves / elapsed
+    controller.frame_allocations = pipeline.flip_ring.allocations
+    # İmleç iş parçacığı açıksa hareket sayısı kare hızını değil imleç hızını gösterir
+    throughput = len(latencies) / elapsed if args.cursor_rate else moves / elapsed
+    return latencies, stages, throughput, controller
+
+
+def run_idle(args, frames, recorder):
+    """Boşta modu: etkin/boşta CPU payı ve elin gerçek görünme anından uyanma gecikmesi"""
+    from pipeline import HandPipeline, IdleMonitor
+    controller = build_controller(args)
+    hands = controller.hands
+    camera = ReplayCamera(frames, fps=args.fps)
+    idle = IdleMonitor(args.idle_after, args.idle_rate)
+    pipeline = HandPipeline(camera, controller, mirror=lambda: args.mirror, idle=idle)
+
+    def measure(seconds):
+        calls, cpu, wall = hands.calls, time.process_time(), time.perf_counter()
+        time.sleep(seconds)
+        wall = time.perf_counter() - wall
+        return {'cpu_pct': 100 * (time.process_time() - cpu) / wall,
+                'model_calls_per_s': (hands.calls - calls) / wall}
+
+    controller.start()
+    pipeline.start()
+    time.sleep(args.warmup / args.fps)
+    active = measure(args.idle_phase)
+    hands.present = False
+    while not idle.idle:
+        time.sleep(0.01)
+    idle_phase = measure(args.idle_phase)
+
+    appeared = time.perf_counter()
+    hands.present = True
+    woke = None
+    while woke is None and time.perf_counter() - appeared < 2.0:
+        time.sleep(0.001)
+        woke = next((e[1] for e in reversed(recorder.events)
+                     if e[0] == 'move' and e[1] >= appeared), None)
+    pipeline.stop()
+    controller.stop()
+    return {
+        'idle_after_s': args.idle_after,
+        'idle_rate_hz': args.idle_rate,
+        'active': active,
+        'idle': idle_phase,
+        'wake_latency_ms': 1000 * (woke - appeared) if woke is not None else None,
+        'monitor': idle.stats(),
+    }
+
+
+def print_idle_report(report):
+    print(f"Boşta modu: {report['idle_after_s']:.1f} s sonra, {report['idle_rate_hz']:.1f} Hz kontrol")
+    print(f"{'':<16}{'CPU %':>10}{'model/s':>10}")
+    for name, label in (('active', 'etkin'), ('idle', 'boşta')):
+        phase = report[name]
+        print(f"{label:<16}{phase['cpu_pct']:10.1f}{phase['model_calls_per_s']:10.1f}")
+    wake = report['wake_latency_ms']
+    monitor = report['monitor']['wake_latency_ms']
+    print(f"Uyanma: el görünmesinden imlece {wake:.1f} ms" if wake is not None
+          else "Uyanma: el 2 s içinde bulunamadı")
+    if monitor is not None:
+        print(f"  (eli bulan kareden imlece {monitor:.1f} ms, "
+              f"kontrol aralığı {report['monitor']['presence_interval_ms']:.0f} ms)")
+
+
+def run_benchmark(args, frames, recorder):
+    runner = run_serial if args.mode == 'serial' else run_pipeline
+    latencies, stages, throughput, controller = runner(args, frames, recorder)
+    stages['gestures'] = controller.gestures.stats.values('gestures')
+    report = {
+        'mode': args.mode,
+        'hands': args.hands,
+        'roi': args.roi,
+        'filter': args.filter,
+        'predict': args.predict,
+        'frames': args.frames,
+        'actuated_frames': len(latencies),
+        'throughput_fps': throughput,
+        'latency_ms': percentiles(latencies),
+        'stages_ms': {name: percentiles(values) for name, values in stages.items()},
+        'smoothing': controller.filter_trace.metrics(),
+    }
+    if controller.region is not None:
+        report['roi_stats'] = controller.region.stats()
+    report['injection'] = controller.actuator.injector.stats()
+    if controller.motion_gate is not None:
+        report['motion_gate'] = controller.motion_gate.stats()
+    if args.cursor_rate and args.mode == 'pipeline':
+        report['cursor_moves_per_s'] = controller.cursor_moves_per_s
+    if args.mode == 'pipeline':
+        report['frame_allocations'] = controller.frame_allocations
+    return report
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="El-fare gecikme ölçümü")
+    parser.add_argument('--mode', choices=('serial', 'pipeline'), default='serial')
+    parser.add_argument('--video', help="Sentetik kareler yerine kayıtlı video")
+    parser.add_argument('--replay', help="framesource ile kaydedilmiş klasör")
+    parser.add_argument('--hands', choices=('synthetic', 'mediapipe'),
+                        help="El modeli (varsayılan: video varsa mediapipe)")
+    parser.add_argument('--fake-cost-ms', type=float, default=8.0,
+                        help="Sentetik modelin kare başına çıkarım maliyeti")
+    parser.add_argument('--fake-noise', type=float, default=0.0,
+                        help="Sentetik parmak ucu gürültüsü (normalize, ör. 0.003)")
+    parser.add_argument('--frames', type=int, default=600)
+    parser.add_argument('--warmup', type=int, default=30)
+    parser.add_argument('--fps', type=float, default=None,
+                        help="Kamera hızı (boşsa serial modda sınırsız)")
+    parser.add_argument('--width', type=int, default=320)
+    parser.add_argument('--height', type=int, default=240)
+    parser.add_argument('--screen-width', type=int, default=1920)
+    parser.add_argument('--screen-height', type=int, default=1080)
+    parser.add_argument('--no-mirror', dest='mirror', action='store_false')
+    parser.add_argument('--roi', action='store_true', help="ROI takip modunu kullan")
+    parser.add_argument('--compare-roi', action='store_true',
+                        help="Tüm kare ve ROI yollarını aynı karelerle karşılaştır")
+    parser.add_argument('--filter', choices=('oneeuro', 'kalman', 'spring'), default='oneeuro',
+                        help="İmleç filtresi")
+    parser.add_argument('--filter-param', action='append', metavar='AD=DEĞER',
+                        help="Filtre parametresi (ör. min_cutoff=0.5)")
+    parser.add_argument('--no-predict', dest='predict', action='store_false',
+                        help="Gecikme kadar ileri kestirimi kapat")
+    parser.add_argument('--cursor-rate', type=int, default=0,
+                        help="İmleç iş parçacığı hızı Hz (0: her karede eşzamanlı, "
+                             "gecikme ölçümü için; pipeline modunda anlamlı)")
+    parser.add_argument('--motion-gate', action='store_true',
+                        help="Durağan karelerde el modelini atla")
+    parser.add_argument('--static', type=float, default=0.0,
+                        help="Sentetik karelerin bu oranı durağan olsun (ör. 0.8)")
+    parser.add_argument('--compare-filters', action='store_true',
+                        help="Tüm filtrelerin titreşim/gecikme değerlerini karşılaştır")
+    parser.add_argument('--idle', action='store_true',
+                        help="Boşta modunu ölç: CPU payı ve uyanma gecikmesi (sentetik el)")
+    parser.add_argument('--idle-after', type=float, default=1.0,
+                        help="Boşta moduna geçiş süresi (s)")
+    parser.add_argument('--idle-rate', type=float, default=4.0,
+                        help="Boşta modunda saniyedeki el varlığı kontrolü")
+    parser.add_argument('--idle-phase', type=float, default=3.0,
+                        help="Etkin ve boşta CPU ölçümü süresi (s)")
+    parser.add_argument('--json', help="Sonuçları JSON dosyasına yaz")
+    parser.add_argument('--max-p95-ms', type=float,
+                        help="p95 gecikme bu değeri aşarsa çıkış kodu 1")
+    args = parser.parse_args(argv)
+    if args.hands is None:
+        args.hands = 'mediapipe' if (args.video or args.replay) else 'synthetic'
+    if (args.mode == 'pipeline' or args.idle) and not args.fps:
+        args.fps = 60
+
+    recorder = install_standins()
+    if args.replay:
+        frames = replay_frames(args.replay, args.width, args.height)
+    elif args.video:
+        frames = video_frames(args.video, args.width, args.height, args.frames)
+    else:
+        frames = synthetic_frames(min(args.frames, 240), args.width, args.height,
+                                  static=args.static)
+
+    if args.idle:
+        if args.hands != 'synthetic':
+            parser.error("--idle sentetik el modeli gerektirir")
+        report = run_idle(args, frames, recorder)
+        print_idle_report(report)
+        if args.json:
+            with open(args.json, 'w', encoding='utf-8') as f:
+                json.dump(report, f, indent=2)
+        return 0
+
+    if args.compare_roi:
+        if args.hands == 'synthetic':
+            print("Uyarı: sentetik el modeli görüntüye bakmaz, ROI kaybı ölçülemez")
+        reports = []
+        for roi in (False, True):
+            args.roi = roi
+            reports.append(run_benchmark(args, frames, recorder))
+            print_report(reports[-1])
+            print()
+        print_roi_comparison(*reports)
+    elif args.compare_filters:
+        reports = []
+        for name in ('spring', 'oneeuro', 'kalman'):
+            args.filter = name
+            reports.append(run_benchmark(args, frames, recorder))
+        print_report(reports[-1])
+        print()
+        print_filter_comparison(reports)
+    else:
+        reports = [run_benchmark(args, frames, recorder)]
+        print_report(reports[0])
+
+    if args.json:
+        with open(args.json, 'w', encoding='utf-8') as f:
+            json.dump(reports if len(reports) > 1 else reports[0], f, indent=2)
+
+    status = 0
+    for report in reports:
+        p95 = report['latency_ms']['p95']
+        if args.max_p95_ms is not None and (p95 is None or p95 > args.max_p95_ms):
+            print(f"GERİLEME: p95 {p95} ms > {args.max_p95_ms} ms")
+            status = 1
+    return status
+
+
+def format_row(name, stats):
+    if stats['p50'] is None:
+        return f"{name:<16}{'-':>9}{'-':>9}{'-':>9}{'-':>9}"
+    return (f"{name:<16}{stats['mean']:9.2f}{stats['p50']:9.2f}"
+            f"{stats['p95']:9.2f}{stats['p99']:9.2f}")
+
+
+def print_report(report):
+    print(f"Mod: {report['mode']}  El modeli: {report['hands']}  "
+          f"Kare: {report['frames']}  Hareket: {report['actuated_frames']}")
+    print(f"Verim: {report['throughput_fps']:.1f} FPS")
+    if 'cursor_moves_per_s' in report:
+        print(f"İmleç: {report['cursor_moves_per_s']:.1f} hareket/s")
+    if 'frame_allocations' in report:
+        print(f"Kare tamponu: toplam {report['frame_allocations']} dizi ayrıldı")
+    if 'motion_gate' in report:
+        gate = report['motion_gate']
+        print(f"Hareket kapısı: {gate['checks']} karenin {gate['skipped']} tanesinde model atlandı "
+              f"(%{100 * gate['skip_rate']:.1f})")
+    injection = report['injection']
+    print(f"Girdi: {injection['sent']} olay gönderildi, en büyük kuyruk {injection['max_queue_depth']}, "
+          f"birleştirilen hareket {injection['dropped_moves']}, "
+          f"toplanan kaydırma {injection['merged_scrolls']}, hata {injection['errors']}")
+    if 'roi_stats' in report:
+        roi = report['roi_stats']
+        print(f"ROI: {roi['roi_frames']} kare, {roi['roi_losses']} kayıp "
+              f"(%{100 * roi['loss_rate']:.1f}), tüm kare arama {roi['full_frames']}")
+    print(f"{'(ms)':<16}{'ort':>9}{'p50':>9}{'p95':>9}{'p99':>9}")
+    print(format_row('uçtan uca', report['latency_ms']))
+    for name, stats in report['stages_ms'].items():
+        print(format_row(name, stats))
+    smoothing = report['smoothing']
+    if smoothing['jitter_px'] is not None:
+        print(f"Filtre {report['filter']}: titreşim {smoothing['jitter_px']:.2f} px "
+              f"(ham {smoothing['raw_jitter_px']:.2f} px), gecikme {smoothing['lag_ms']:.1f} ms")
+
+
+def print_roi_comparison(full, roi):
+    gain = roi['throughput_fps'] / full['throughput_fps'] if full['throughput_fps'] else 0.0
+    full_rate = full['actuated_frames'] / full['frames']
+    roi_rate = roi['actuated_frames'] / roi['frames']
+    print(f"{'':<16}{'tüm kare':>12}{'ROI':>12}")
+    print(f"{'FPS':<16}{full['throughput_fps']:12.1f}{roi['throughput_fps']:12.1f}")
+    print(f"{'tespit oranı':<16}{100 * full_rate:11.1f}%{100 * roi_rate:11.1f}%")
+    print(f"{'ROI kayıp oranı':<16}{'-':>12}{100 * roi['roi_stats']['loss_rate']:11.1f}%")
+    print(f"FPS kazancı: x{gain:.2f}")
+
+
+def print_filter_comparison(reports):
+    # Negatif gecikme: imleç elin önünde (kestirim aşırı)
+    print(f"{'filtre':<12}{'titreşim px':>13}{'ham px':>9}{'gecikme ms':>12}{'uçtan uca ms':>14}")
+    for report in reports:
+        smoothing = report['smoothing']
+        if smoothing['jitter_px'] is None:
+            print(f"{report['filter']:<12}{'-':>13}{'-':>9}{'-':>12}{'-':>14}")
+            continue
+        total = smoothing['lag_ms'] + (report['latency_ms']['mean'] or 0.0)
+        print(f"{report['filter']:<12}{smoothing['jitter_px']:13.2f}"
+              f"{smoothing['raw_jitter_px']:9.2f}{smoothing['lag_ms']:12.1f}{total:14.1f}")
+
+
+if __name__ == "__main__":
+    sys.exit(main())
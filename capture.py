@@ -0,0 +1,213 @@
+"""Kamera yakalama: biçim/çözünürlük/FPS anlaşması ve yeniden kullanılan kare tamponları
+
+Kameradan istenen ayar her zaman verilmez; negotiate() sırayla piksel biçimi
+(FOURCC), çözünürlük ve FPS ister, kameranın gerçekte verdiğini okur ve
+gerekirse diğer biçimi dener. 'auto' önce YUYV'yi (JPEG çözme maliyeti yok),
+istek karşılanmazsa MJPG'yi (USB bant genişliğine sığan yüksek çözünürlük/FPS)
+dener.
+
+Capture, okumaları FrameRing tamponlarına yapar (cap.read(dst)). Dönen kare
+sonraki read() çağrısına kadar geçerlidir (cv2.VideoCapture.read(dst) gibi);
+daha uzun tutulacaksa tüketici kendi halkasına kopyalamalıdır. Kararlı
+durumda kare başına yeni dizi ayrılmaz.
+"""
+import threading
+import time
+
+import numpy as np
+
+from warmstart import lazy_import
+
+cv2 = lazy_import('cv2')
+
+FOURCCS = ('YUYV', 'MJPG')  # 'auto' deneme sırası
+
+
+def fourcc_name(value):
+    value = int(value)
+    return ''.join(chr((value >> 8 * i) & 0xFF) for i in range(4)).strip('\0') if value else ''
+
+
+class FrameRing:
+    """Yeniden kullanılan dizi havuzu; tamponlar açıkça alınır ve bırakılır
+
+    acquire() boştaki bir tamponu kullanımda işaretleyip verir; kareyi alan
+    her tüketici (owners) işi bitince release() çağırır, sonuncusu tamponu
+    havuza döndürür. Boş tampon yoksa yenisi ayrılır (allocations sayacı);
+    havuzda en fazla size boş tampon tutulur. İş parçacıkları arasında
+    güvenlidir.
+    """
+    def __init__(self, size=3):
+        self.size = size
+        self.free = []
+        self.busy = {}  # id(tampon) -> [tampon, kalan sahip sayısı]
+        self.allocations = 0
+        self._lock = threading.Lock()
+
+    def acquire(self, shape, dtype=np.uint8, owners=1):
+        with self._lock:
+            for index, buffer in enumerate(self.free):
+                if buffer.shape == shape and buffer.dtype == dtype:
+                    del self.free[index]
+                    break
+            else:
+                buffer = np.empty(shape, dtype)
+                self.allocations += 1
+            self.busy[id(buffer)] = [buffer, owners]
+        return buffer
+
+    def adopt(self, array, owners=1):
+        # Dışarıda ayrılmış diziyi havuza kat (ör. kaynak ilk kareyi kendisi ayırdı)
+        with self._lock:
+            self.busy[id(array)] = [array, owners]
+        return array
+
+    def release(self, buffer):
+        # Havuza ait olmayan diziler (ör. kaynağın kendi karesi) yok sayılır
+        with self._lock:
+            entry = self.busy.get(id(buffer))
+            if entry is None or entry[0] is not buffer:
+                return
+            entry[1] -= 1
+            if entry[1] > 0:
+                return
+            del self.busy[id(buffer)]
+            self.free.append(buffer)
+            if len(self.free) > self.size:
+                del self.free[0]  # En eski (belki eski boyutlu) boş tampon bırakılır
+
+    def in_use(self):
+        with self._lock:
+            return len(self.busy)
+
+
+def negotiate(cap, width=None, height=None, fps=None, fourcc='auto'):
+    """İstenen ayarları uygula, kameranın verdiklerini döner
+
+    fourcc: 'auto', belirli bir biçim (ör. 'MJPG') ya da None (sürücüye bırak).
+    """
+    requested = {'width': width, 'height': height, 'fps': fps}
+    if fourcc == 'auto':
+        candidates = FOURCCS
+    else:
+        candidates = (fourcc,)
+
+    best = None
+    for name in candidates:
+        granted = _apply(cap, name, width, height, fps)
+        score = _score(granted, width, height, fps)
+        if best is None or score > best[0]:
+            best = (score, name, granted)
+        if score[0]:
+            break
+    if best[1] != name:
+        granted = _apply(cap, best[1], width, height, fps)  # En iyi biçime geri dön
+    granted['requested'] = requested
+    return granted
+
+
+def _apply(cap, fourcc, width, height, fps):
+    # V4L2 sırası: önce biçim, sonra boyut, en son FPS (FPS biçime ve boyuta bağlı)
+    if fourcc:
+        cap.set(cv2.CAP_PROP_FOURCC, cv2.VideoWriter_fourcc(*fourcc))
+    if width:
+        cap.set(cv2.CAP_PROP_FRAME_WIDTH, width)
+    if height:
+        cap.set(cv2.CAP_PROP_FRAME_HEIGHT, height)
+    if fps:
+        cap.set(cv2.CAP_PROP_FPS, fps)
+    return {
+        'fourcc': fourcc_name(cap.get(cv2.CAP_PROP_FOURCC)),
+        'width': int(cap.get(cv2.CAP_PROP_FRAME_WIDTH)),
+        'height': int(cap.get(cv2.CAP_PROP_FRAME_HEIGHT)),
+        'fps': float(cap.get(cv2.CAP_PROP_FPS)),
+    }
+
+
+def _score(granted, width, height, fps):
+    # (istek tam karşılandı, boyut karşılandı, FPS, piksel sayısı): büyük olan iyi
+    size_ok = granted['width'] >= (width or 0) and granted['height'] >= (height or 0)
+    # Bazı sürücüler FPS'i 0 bildirir: bilinmiyorsa karşılanmış say
+    fps_ok = not fps or not granted['fps'] or granted['fps'] >= 0.95 * fps
+    return (size_ok and fps_ok, size_ok, granted['fps'], granted['width'] * granted['height'])
+
+
+class Capture:
+    """cv2.VideoCapture sarmalayıcı: anlaşılan ayarlar ve tampon halkasına okuma
+
+    VideoCapture arayüzünü (read, set, get, isOpened, release) sunar.
+    """
+    def __init__(self, cap, granted=None, ring_size=3):
+        self.cap = cap
+        self.granted = granted or {}
+        self.ring = FrameRing(ring_size)
+        self.current = None  # Son dönen kare; sonraki read() ile halkaya döner
+        self.shape = None  # Son karenin boyutu ve türü; tampon bu boyutta istenir
+        self.dtype = None
+        self.frames = 0
+        self.measured_fps = 0.0
+        self.last_read = None
+
+    def read(self):
+        if self.current is not None:
+            self.ring.release(self.current)
+            self.current = None
+        buffer = None
+        if self.shape is not None:
+            buffer = self.ring.acquire(self.shape, self.dtype)
+        ret, frame = self.cap.read(buffer) if buffer is not None else self.cap.read()
+        if not ret:
+            if buffer is not None:
+                self.ring.release(buffer)
+            return ret, frame
+        if frame is not buffer:
+            # İlk kare ya da boyut değişti: kaynağın ayırdığı diziyi havuza kat
+            if buffer is not None:
+                self.ring.release(buffer)
+            self.ring.adopt(frame)
+            self.ring.allocations += 1
+            self.shape, self.dtype = frame.shape, frame.dtype
+        self.current = frame
+
+        now = time.perf_counter()
+        if self.last_read is not None:
+            interval = now - self.last_read
+            if interval > 0:
+                rate = 1.0 / interval
+                self.measured_fps += 0.1 * (rate - self.measured_fps) if self.measured_fps else rate
+        self.last_read = now
+        self.frames += 1
+        return ret, frame
+
+    def describe(self):
+        granted = self.granted
+        if not granted:
+            return "Kamera: ayar anlaşması yapılmadı"
+        requested = granted['requested']
+        wanted = (f"{requested['width'] or '?'}x{requested['height'] or '?'}"
+                  f" @ {requested['fps'] or '?'}")
+        return (f"Kamera: {granted['fourcc'] or '?'} {granted['width']}x{granted['height']}"
+                f" @ {granted['fps']:.1f} FPS (istenen {wanted})")
+
+    def stats(self):
+        return {
+            'fourcc': self.granted.get('fourcc'),
+            'width': self.granted.get('width'),
+            'height': self.granted.get('height'),
+            'fps': self.granted.get('fps'),
+            'measured_fps': self.measured_fps,
+            'frames': self.frames,
+            'allocations': self.ring.allocations,
+        }
+
+    def set(self, prop, value):
+        return self.cap.set(prop, value)
+
+    def get(self, prop):
+        return self.cap.get(prop)
+
+    def isOpened(self):
+        return self.cap.isOpened()
+
+    def release(self):
+        self.cap.release()
@@ -0,0 +1,224 @@
+"""İmleç hedefi filtreleri: One-Euro, sabit hızlı Kalman ve yay-sönümleyici
+
+Tüm filtreler aynı arayüzü sunar:
+    filtre.update((x, y), zaman)   # ölçümü işle, filtrelenmiş konumu döner
+    filtre.predict(ileri)          # son durumu 'ileri' saniye öteye kestir
+
+predict() ile imleç, boru hattı gecikmesi kadar ileri taşınır; böylece el
+hareketinin gerisinde kalmak yerine onunla aynı anda ilerler.
+"""
+import math
+
+import numpy as np
+
+
+class OneEuroFilter:
+    """Hıza göre kesim frekansını uyarlayan alçak geçiren filtre (Casiez vd. 2012)
+
+    Yavaş harekette titreşimi bastırır, hızlı harekette gecikmeyi azaltır.
+    min_cutoff (Hz) duran eldeki titreşimi, beta (1/piksel) hızlı hareketteki
+    gecikmeyi ayarlar.
+    """
+    def __init__(self, min_cutoff=1.0, beta=0.0005, d_cutoff=1.0):
+        self.min_cutoff = float(min_cutoff)
+        self.beta = float(beta)
+        self.d_cutoff = float(d_cutoff)
+        self.reset()
+
+    def reset(self):
+        self.position = None
+        self.velocity = np.zeros(2)  # Kesim frekansı için (ölçüm - filtre) hızı
+        self.trend = np.zeros(2)     # Kestirim için filtre çıktısının hızı
+        self.last_time = None
+        self.interval = None  # Kareler arası süre (üstel ortalama)
+
+    @staticmethod
+    def _alpha(cutoff, dt):
+        tau = 1.0 / (2 * math.pi * cutoff)
+        return 1.0 / (1.0 + tau / dt)
+
+    def update(self, point, timestamp):
+        point = np.asarray(point, dtype=np.float64)
+        if self.position is None:
+            self.position = point
+            self.last_time = timestamp
+            return self.position
+        dt = timestamp - self.last_time
+        if dt <= 0:
+            return self.position
+        self.last_time = timestamp
+        # Kamera kareleri düzenli aralıkla gelir; zaman damgasındaki oynama
+        # (okuma, zamanlayıcı) hıza gürültü olarak girmesin. Atlanan kareden
+        # sonraki uzun aralık ise olduğu gibi kullanılır.
+        if self.interval is None:
+            self.interval = dt
+        elif dt < 1.5 * self.interval:
+            self.interval += 0.05 * (dt - self.interval)
+            dt = self.interval
+
+        # Hız tahmini de filtrelenir, kesim frekansı hız büyüklüğüne göre artar
+        raw_velocity = (point - self.position) / dt
+        a_d = self._alpha(self.d_cutoff, dt)
+        self.velocity = self.velocity + a_d * (raw_velocity - self.velocity)
+        cutoff = self.min_cutoff + self.beta * float(np.hypot(*self.velocity))
+        a = self._alpha(cutoff, dt)
+        step = a * (point - self.position)
+        self.position = self.position + step
+        # Ölçüm - filtre farkı gecikmeyi de içerir, ileri kestirimde hızı abartır
+        self.trend = self.trend + a_d * (step / dt - self.trend)
+        return self.position
+
+    def predict(self, lead):
+        return self.position + self.trend * lead
+
+
+class KalmanFilter:
+    """Sabit hız modelli Kalman filtresi, durum [x, y, vx, vy]
+
+    process_noise ivme gürültüsünün spektral yoğunluğu (piksel²/s³),
+    measurement_noise ölçüm varyansıdır (piksel²).
+    """
+    def __init__(self, process_noise=5e5, measurement_noise=100.0):
+        self.process_noise = float(process_noise)
+        self.measurement_noise = float(measurement_noise)
+        self.H = np.array([[1.0, 0, 0, 0], [0, 1.0, 0, 0]])
+        self.R = np.eye(2) * self.measurement_noise
+        self.reset()
+
+    def reset(self):
+        self.state = None
+        self.P = None
+        self.last_time = None
+
+    @property
+    def position(self):
+        return None if self.state is None else self.state[:2]
+
+    @property
+    def velocity(self):
+        return np.zeros(2) if self.state is None else self.state[2:]
+
+    def update(self, point, timestamp):
+        point = np.asarray(point, dtype=np.float64)
+        if self.state is None:
+            self.state = np.concatenate((point, np.zeros(2)))
+            # Hız bilinmiyor: büyük başlangıç belirsizliği
+            self.P = np.diag([self.measurement_noise] * 2 + [1e6] * 2)
+            self.last_time = timestamp
+            return self.position
+        dt = timestamp - self.last_time
+        if dt <= 0:
+            return self.position
+        self.last_time = timestamp
+
+        # Tahmin
+        F = np.eye(4)
+        F[0, 2] = F[1, 3] = dt
+        q = self.process_noise
+        Q = np.zeros((4, 4))
+        Q[0, 0] = Q[1, 1] = q * dt ** 3 / 3
+        Q[0, 2] = Q[2, 0] = Q[1, 3] = Q[3, 1] = q * dt ** 2 / 2
+        Q[2, 2] = Q[3, 3] = q * dt
+        state = F @ self.state
+        P = F @ self.P @ F.T + Q
+
+        # Düzeltme
+        S = self.H @ P @ self.H.T + self.R
+        K = P @ self.H.T @ np.linalg.inv(S)
+        self.state = state + K @ (point - self.H @ state)
+        self.P = (np.eye(4) - K @ self.H) @ P
+        return self.position
+
+    def predict(self, lead):
+        return self.state[:2] + self.state[2:] * lead
+
+
+class SpringFilter:
+    """Eski SmoothMouseController davranışı: yay-sönümleyici (karşılaştırma için)
+
+    Hız kare başına tutulur, bu yüzden ileri kestirim yapmaz.
+    """
+    def __init__(self, damping=0.6, spring=0.4):
+        self.damping = float(damping)
+        self.spring = float(spring)
+        self.reset()
+
+    def reset(self):
+        self.position = None
+        self.velocity = np.zeros(2)
+
+    def update(self, point, timestamp):
+        point = np.asarray(point, dtype=np.float64)
+        if self.position is None:
+            self.position = point
+            return self.position
+        delta = point - self.position
+        acceleration = min(float(np.hypot(*delta)) / 500, 2.0)
+        self.velocity = self.velocity * self.damping + delta * self.spring * acceleration
+        self.position = self.position + self.velocity
+        return self.position
+
+    def predict(self, lead):
+        return self.position
+
+
+FILTERS = {
+    'oneeuro': OneEuroFilter,
+    'kalman': KalmanFilter,
+    'spring': SpringFilter,
+}
+
+
+def make_filter(name='oneeuro', **params):
+    if name not in FILTERS:
+        raise ValueError(f"Bilinmeyen filtre: {name} (seçenekler: {', '.join(FILTERS)})")
+    return FILTERS[name](**params)
+
+
+def parse_params(items):
+    # ['min_cutoff=0.5', 'beta=0.01'] -> {'min_cutoff': 0.5, 'beta': 0.01}
+    params = {}
+    for item in items or ():
+        key, _, value = item.partition('=')
+        params[key.strip()] = float(value)
+    return params
+
+
+def jitter_lag(raw, filtered, interval, max_shift=15):
+    """Ham ve filtrelenmiş imleç izlerinden titreşim/gecikme ölçüleri
+
+    raw, filtered: (N, 2) piksel konumları; interval: örnekler arası süre (s).
+    Titreşim ikinci farkların RMS değeridir (piksel). Gecikme, filtre çıktısını
+    ham ize en iyi oturtan zaman kaymasıdır; negatif değer imlecin elin önünde
+    gittiğini gösterir.
+    """
+    raw = np.asarray(raw, dtype=np.float64)
+    filtered = np.asarray(filtered, dtype=np.float64)
+    if len(raw) < 2 * max_shift + 3:
+        return {'jitter_px': None, 'raw_jitter_px': None, 'lag_ms': None}
+
+    def jitter(track):
+        second = np.diff(track, n=2, axis=0)
+        return float(np.sqrt(np.mean(np.sum(second * second, axis=1))))
+
+    # filtered[i] ile raw[i - k] arasındaki hata, k = -max_shift..max_shift
+    n = len(raw)
+    shifts = np.arange(-max_shift, max_shift + 1)
+    errors = np.empty(len(shifts))
+    for j, k in enumerate(shifts):
+        out = filtered[max_shift:n - max_shift]
+        ref = raw[max_shift - k:n - max_shift - k]
+        errors[j] = np.mean(np.sum((out - ref) ** 2, axis=1))
+    best = int(errors.argmin())
+    shift = float(shifts[best])
+    if 0 < best < len(shifts) - 1:
+        # Parabol ile alt-örnek çözünürlüğü
+        e0, e1, e2 = errors[best - 1:best + 2]
+        denom = e0 - 2 * e1 + e2
+        if denom > 0:
+            shift += 0.5 * (e0 - e2) / denom
+    return {
+        'jitter_px': jitter(filtered),
+        'raw_jitter_px': jitter(raw),
+        'lag_ms': shift * interval * 1000,
+    }
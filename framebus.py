@@ -0,0 +1,352 @@
+"""Paylaşılan bellek kare yolu: tek kamera, birden fazla takip süreci
+
+Yayıncı (bu dosya komut olarak çalıştırılır) kamerayı açar ve kareleri
+multiprocessing.shared_memory üzerindeki bir halkaya yazar. İstemciler
+(SharedFrameSource) aynı belleği kopyalamadan okur; parmakkontrol.py,
+yuztakip.py ve test1.py aynı kamerayı ayrı süreçlerde kullanabilir.
+
+    python framebus.py --resolution 640x480 --fps 30
+    python parmakkontrol.py --frame-bus kamera
+    python yuztakip.py --frame-bus kamera
+    python test1.py --sources bus:kamera
+
+Bellek düzeni: başlık (int64), yuva başına sıra numarası ve yakalama zamanı,
+ardından (yuva, yükseklik, genişlik, kanal) kareler. Tek yazar her karede:
+yuva sırasını -1 yapar, kareyi yazar, yuva sırasını ve en son başlık sırasını
+günceller. Okuyucu en yeni sırayı alır ve yuvanın sırası tutuyorsa karenin
+görünümünü döner.
+
+Dönen kare paylaşılan belleğin görünümüdür; yazar halkayı dolaşıp aynı yuvaya
+gelene kadar (yuva sayısı - 1 kare) geçerlidir. Uygulamalar kareyi hemen
+çevirip küçülttüğü için bu süre yeterlidir; daha uzun tutulacaksa kopyalanmalıdır.
+"""
+import os
+import threading
+import time
+from contextlib import contextmanager
+from multiprocessing import shared_memory
+
+import numpy as np
+
+DEFAULT_NAME = 'kamera'
+MAGIC = 0x464D4246  # 'FBMF'
+# Başlık alanları
+MAGIC_FIELD, SEQ, WIDTH, HEIGHT, CHANNELS, SLOTS, CLOSED = range(7)
+HEADER_FIELDS = 8
+
+
+def _offsets(shape, slots):
+    # Başlık, yuva sıraları, yakalama zamanları ve kareler (64 bayt hizalı)
+    seq_offset = HEADER_FIELDS * 8
+    stamp_offset = seq_offset + slots * 8
+    frame_offset = (stamp_offset + slots * 8 + 63) // 64 * 64
+    return seq_offset, stamp_offset, frame_offset, frame_offset + slots * int(np.prod(shape))
+
+
+def _layout(buf, shape, slots):
+    seq_offset, stamp_offset, frame_offset, _ = _offsets(shape, slots)
+    return (np.ndarray((HEADER_FIELDS,), np.int64, buf, 0),
+            np.ndarray((slots,), np.int64, buf, seq_offset),
+            np.ndarray((slots,), np.float64, buf, stamp_offset),
+            np.ndarray((slots,) + shape, np.uint8, buf, frame_offset))
+
+
+_attach_lock = threading.Lock()
+
+
+@contextmanager
+def _untracked():
+    # Python < 3.13: SharedMemory açılışta izleyiciye kaydeder, unlink() kaydı siler.
+    # Kayıt hiç yapılmamalı: sonradan unregister, izleyiciyi paylaşan alt süreçte
+    # (spawn) yayıncının kaydını siler; kaydı olmayan unlink ise izleyicide KeyError verir
+    from multiprocessing import resource_tracker
+    with _attach_lock:
+        register, unregister = resource_tracker.register, resource_tracker.unregister
+        resource_tracker.register = resource_tracker.unregister = lambda name, rtype: None
+        try:
+            yield
+        finally:
+            resource_tracker.register, resource_tracker.unregister = register, unregister
+
+
+def _attach(name):
+    # İstemci belleği yalnızca kullanır; kapanışta silmesin (resource_tracker)
+    try:
+        return shared_memory.SharedMemory(name=name, track=False)
+    except TypeError:  # Python < 3.13
+        pass
+    if os.name != 'posix':
+        return shared_memory.SharedMemory(name=name)
+    with _untracked():
+        return shared_memory.SharedMemory(name=name)
+
+
+def _unlink_attached(shm):
+    # _attach ile açılmış (izleyiciye kayıtsız) belleği sil
+    if hasattr(shm, '_track') or os.name != 'posix':  # Python >= 3.13: track=False ile açıldı
+        shm.unlink()
+        return
+    with _untracked():
+        shm.unlink()
+
+
+class FrameBusWriter:
+    def __init__(self, name, shape, slots=8):
+        shape = tuple(shape) if len(shape) == 3 else tuple(shape) + (1,)
+        size = _offsets(shape, slots)[-1]
+        try:
+            self.shm = shared_memory.SharedMemory(name=name, create=True, size=size)
+        except FileExistsError:
+            # Önceki yayıncıdan kalan bellek: bağlı istemcilere kapandığını bildir, yeniden kur
+            stale = _attach(name)
+            np.ndarray((HEADER_FIELDS,), np.int64, stale.buf)[CLOSED] = 1
+            stale.close()
+            _unlink_attached(stale)
+            self.shm = shared_memory.SharedMemory(name=name, create=True, size=size)
+        self.name = name
+        self.shape = shape
+        self.slots = slots
+        self.header, self.slot_seq, self.stamps, self.frames = _layout(self.shm.buf, shape, slots)
+        self.slot_seq[:] = -1
+        self.header[:] = 0
+        self.header[SEQ] = -1
+        self.header[WIDTH], self.header[HEIGHT], self.header[CHANNELS] = shape[1], shape[0], shape[2]
+        self.header[SLOTS] = slots
+        self.header[MAGIC_FIELD] = MAGIC  # En son: istemciler bundan önce bağlanmaz
+        self.seq = -1
+
+    def next_slot(self):
+        # Yazılacak yuvayı açar (okuyucular yarım kareyi görmez) ve görünümünü döner
+        slot = (self.seq + 1) % self.slots
+        self.slot_seq[slot] = -1
+        return self.frames[slot]
+
+    def commit(self, captured):
+        self.seq += 1
+        slot = self.seq % self.slots
+        self.stamps[slot] = captured
+        self.slot_seq[slot] = self.seq
+        self.header[SEQ] = self.seq
+
+    def publish(self, frame, captured):
+        target = self.next_slot()
+        target[...] = frame.reshape(self.shape)
+        self.commit(captured)
+
+    def close(self):
+        self.header[CLOSED] = 1
+        self.header = self.slot_seq = self.stamps = self.frames = None
+        try:
+            self.shm.close()
+        except BufferError:
+            pass  # Son yuvanın görünümü hâlâ tutuluyor; süreç çıkınca bırakılır
+        self.shm.unlink()
+
+
+class SharedFrameSource:
+    """Kare yolu istemcisi; cv2.VideoCapture arayüzü (read, set, get, isOpened, release)
+
+    read() yeni kare gelene kadar en fazla read_timeout saniye bekler ve her
+    zaman en yenisini verir; geride kalınırsa aradaki kareler atlanır
+    (skipped). Kare gelmezse (False, None) döner, böylece okuyan iş parçacığı
+    durdurulabilir. Yayıncı yeniden başlarsa ya da timeout saniye boyunca kare
+    yayınlamazsa (çöktü, takıldı) bağlantı bırakılır ve sonraki çağrılarda
+    yeniden bağlanılır.
+    """
+    def __init__(self, name=DEFAULT_NAME, timeout=5.0, copy=False, read_timeout=0.5):
+        self.name = name
+        self.timeout = timeout
+        self.read_timeout = read_timeout
+        self.copy = copy
+        self.shm = None
+        self.last_seq = -1
+        self.last_stamp = None
+        self.interval = 1.0 / 30  # Kareler arası süre (üstel ortalama), bekleme için
+        self.frames = 0
+        self.skipped = 0
+        self.latency = 0.0  # Yayından okumaya son gecikme (s)
+        self.last_frame_time = None  # Son yeni karenin (ya da bağlantının) zamanı
+        self.opened = self._connect(timeout)
+
+    def _connect(self, timeout):
+        deadline = time.perf_counter() + timeout
+        while True:
+            try:
+                shm = _attach(self.name)
+                header = np.ndarray((HEADER_FIELDS,), np.int64, shm.buf)
+                if header[MAGIC_FIELD] == MAGIC and not header[CLOSED]:
+                    break
+                del header
+                shm.close()
+            except FileNotFoundError:
+                pass
+            if time.perf_counter() >= deadline:
+                return False
+            time.sleep(0.05)
+        shape = (int(header[HEIGHT]), int(header[WIDTH]), int(header[CHANNELS]))
+        slots = int(header[SLOTS])
+        del header
+        self.shm = shm
+        self.shape = shape
+        self.header, self.slot_seq, self.stamps, self.frames_view = _layout(shm.buf, shape, slots)
+        self.slots = slots
+        self.last_seq = -1
+        self.last_frame_time = time.perf_counter()
+        return True
+
+    def _disconnect(self):
+        self.header = self.slot_seq = self.stamps = self.frames_view = None
+        if self.shm is not None:
+            try:
+                self.shm.close()
+            except BufferError:
+                pass  # Uygulama hâlâ bir kare görünümü tutuyor; bellek GC ile bırakılır
+            self.shm = None
+
+    def read(self):
+        if self.shm is None and not (self.opened and self._connect(0)):
+            time.sleep(0.1)
+            return False, None
+        deadline = time.perf_counter() + self.read_timeout
+        while True:
+            if self.header[CLOSED]:
+                # Yayıncı kapandı ya da yeniden başladı: sonraki çağrıda yeniden bağlan
+                self._disconnect()
+                return False, None
+            seq = int(self.header[SEQ])
+            if seq > self.last_seq:
+                slot = seq % self.slots
+                stamp = float(self.stamps[slot])
+                # Yeniden bağlandıktan sonra takılı yayıncının eski karesi tekrar verilmez
+                if (self.slot_seq[slot] == seq and
+                        (self.last_stamp is None or stamp > self.last_stamp)):
+                    frame = self.frames_view[slot]
+                    if self.copy:
+                        frame = frame.copy()
+                    break
+            now = time.perf_counter()
+            if now >= deadline:
+                if now - self.last_frame_time >= self.timeout:
+                    # Yayıncı CLOSED yazmadan durdu: bağlantıyı bırak, sonraki çağrıda yeniden dene
+                    self._disconnect()
+                return False, None
+            # Sonraki karenin beklenen zamanına kadar uyu, sonra kısa aralıklarla yokla
+            delay = 0.001
+            if self.last_stamp is not None:
+                delay = max(delay, self.last_stamp + self.interval - now)
+            time.sleep(min(delay, 0.05, deadline - now))
+
+        if self.last_seq >= 0:
+            self.skipped += seq - self.last_seq - 1
+            if self.last_stamp is not None and stamp > self.last_stamp:
+                gap = (stamp - self.last_stamp) / (seq - self.last_seq)
+                self.interval += 0.1 * (min(gap, 0.25) - self.interval)
+        self.last_seq = seq
+        self.last_stamp = stamp
+        self.last_frame_time = time.perf_counter()
+        self.latency = self.last_frame_time - stamp
+        self.frames += 1
+        return True, frame if self.shape[2] > 1 else frame[:, :, 0]
+
+    def read_seq(self, seq):
+        # Belirli sıradaki kare (ör. model işçileri); yuva üzerine yazıldıysa (False, None)
+        if self.shm is None:
+            return False, None
+        slot = seq % self.slots
+        if self.slot_seq[slot] != seq:
+            return False, None
+        frame = self.frames_view[slot]
+        return True, frame if self.shape[2] > 1 else frame[:, :, 0]
+
+    def describe(self):
+        if self.shm is None:
+            return f"Kare yolu '{self.name}': bağlı değil"
+        height, width, channels = self.shape
+        return (f"Kare yolu '{self.name}': {width}x{height}x{channels}, "
+                f"{self.slots} yuva, ~{1 / self.interval:.0f} FPS")
+
+    def stats(self):
+        return {'frames': self.frames, 'skipped': self.skipped,
+                'latency_ms': 1000 * self.latency, 'fps': 1 / self.interval}
+
+    def set(self, prop, value):
+        return False
+
+    def get(self, prop):
+        import cv2
+        if self.shm is None:
+            return 0.0
+        if prop == cv2.CAP_PROP_FRAME_WIDTH:
+            return float(self.shape[1])
+        if prop == cv2.CAP_PROP_FRAME_HEIGHT:
+            return float(self.shape[0])
+        if prop == cv2.CAP_PROP_FPS:
+            return 1 / self.interval
+        return 0.0
+
+    def isOpened(self):
+        return self.opened
+
+    def release(self):
+        self.opened = False
+        self._disconnect()
+
+
+def serve(source, name=DEFAULT_NAME, slots=8, report_interval=5.0):
+    """Kaynaktan okuyup yolda yayınla; Ctrl+C ile durur"""
+    from capture import Capture
+    ret, frame = source.read()
+    if not ret:
+        raise RuntimeError("Kaynaktan kare okunamadı")
+    writer = FrameBusWriter(name, frame.shape, slots)
+    # Canlı kamerada kareler doğrudan paylaşılan belleğe okunur (ara kopya yok)
+    direct = source.cap if isinstance(source, Capture) and frame.ndim == 3 else None
+    describe = getattr(source, 'describe', None)
+    print(f"Yayın '{name}': {frame.shape[1]}x{frame.shape[0]}, {slots} yuva"
+          + (f" | {describe()}" if describe and describe() else ""))
+    writer.publish(frame, time.perf_counter())
+    published, mark = 1, time.perf_counter()
+    try:
+        while True:
+            if direct is not None:
+                target = writer.next_slot()
+                ret, frame = direct.read(target)
+                if ret and frame is not target:
+                    target[...] = frame.reshape(writer.shape)  # Boyut değişti: kopyala
+            else:
+                ret, frame = source.read()
+                if ret:
+                    writer.next_slot()[...] = frame.reshape(writer.shape)
+            if not ret:
+                if direct is None:
+                    break  # Kayıt bitti
+                time.sleep(0.005)
+                continue
+            writer.commit(time.perf_counter())
+            published += 1
+            now = time.perf_counter()
+            if now - mark >= report_interval:
+                print(f"{published} kare yayınlandı, {published / (now - mark):.1f} FPS")
+                published, mark = 0, now
+    except KeyboardInterrupt:
+        pass
+    finally:
+        writer.close()
+        source.release()
+
+
+if __name__ == "__main__":
+    import argparse
+    from framesource import add_source_arguments, source_from_args
+    parser = argparse.ArgumentParser(description="Kamerayı paylaşılan bellek kare yolunda yayınla")
+    add_source_arguments(parser)
+    parser.add_argument('--name', default=DEFAULT_NAME, help="Paylaşılan bellek adı")
+    parser.add_argument('--resolution', default='640x480', help="Kamera çözünürlüğü (GxY)")
+    parser.add_argument('--fps', type=float, default=30)
+    parser.add_argument('--slots', type=int, default=8, help="Halkadaki kare sayısı")
+    args = parser.parse_args()
+    if args.frame_bus:
+        parser.error("--frame-bus yayıncıda kullanılamaz")
+    width, height = (int(v) for v in args.resolution.lower().split('x'))
+    serve(source_from_args(args, width=width, height=height, fps=args.fps),
+          name=args.name, slots=args.slots)
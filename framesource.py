@@ -0,0 +1,261 @@
+"""Kare kaynakları: canlı kamera, paylaşılan kare yolu, video dosyası, kayıt ve tekrar oynatma
+
+Tüm kaynaklar cv2.VideoCapture ile aynı arayüzü (read, set, get, isOpened,
+release) sunar, böylece uygulamalar hangisinin kullanıldığını bilmez.
+
+Kayıt biçimi bir klasördür:
+    meta.json       genişlik, yükseklik, kanal sayısı
+    frames.u8       ardışık ham BGR kareler (np.memmap ile açılır)
+    timestamps.f64  her kare için yakalama zamanı (saniye)
+"""
+import json
+import os
+import time
+
+import numpy as np
+
+from capture import Capture, negotiate
+from warmstart import lazy_import
+
+cv2 = lazy_import('cv2')  # Kaynak açılana kadar yüklenmez
+
+META_FILE = 'meta.json'
+FRAMES_FILE = 'frames.u8'
+TIMESTAMPS_FILE = 'timestamps.f64'
+
+
+def open_camera(index=0, width=None, height=None, fps=None, buffersize=1, fourcc='auto'):
+    # Biçim/boyut/FPS anlaşması yapılır; kareler yeniden kullanılan tamponlara okunur
+    cap = cv2.VideoCapture(index)
+    granted = negotiate(cap, width, height, fps, fourcc) if cap.isOpened() else None
+    if buffersize:
+        cap.set(cv2.CAP_PROP_BUFFERSIZE, buffersize)
+    return Capture(cap, granted)
+
+
+def open_source(camera=0, replay=None, record=None, speed='realtime', loop=False,
+                frame_bus=None, **camera_options):
+    # Komut satırı seçeneklerinden uygun kaynağı kur
+    if replay:
+        source = ReplaySource(replay, speed=speed, loop=loop)
+    elif frame_bus:
+        from framebus import SharedFrameSource
+        source = SharedFrameSource(frame_bus)
+    else:
+        source = open_camera(camera, **camera_options)
+    if record:
+        source = RecordingSource(source, record)
+    return source
+
+
+class RecordingSource:
+    """Başka bir kaynağı sarar, okunan her kareyi diske yazar"""
+    def __init__(self, source, path):
+        self.source = source
+        self.path = path
+        os.makedirs(path, exist_ok=True)
+        self.frames_file = open(os.path.join(path, FRAMES_FILE), 'wb')
+        self.timestamps_file = open(os.path.join(path, TIMESTAMPS_FILE), 'wb')
+        self.shape = None
+        self.count = 0
+
+    def read(self):
+        ret, frame = self.source.read()
+        if ret:
+            self.write(frame, time.time())
+        return ret, frame
+
+    def write(self, frame, timestamp):
+        if self.shape is None:
+            self.shape = frame.shape
+            self._write_meta()
+        elif frame.shape != self.shape:
+            # Çözünürlük değişirse kayıt tutarlı kalsın diye yeniden boyutlandır
+            frame = cv2.resize(frame, (self.shape[1], self.shape[0]))
+        self.frames_file.write(np.ascontiguousarray(frame, dtype=np.uint8).tobytes())
+        self.timestamps_file.write(np.float64(timestamp).tobytes())
+        self.count += 1
+
+    def _write_meta(self):
+        height, width = self.shape[:2]
+        channels = self.shape[2] if len(self.shape) > 2 else 1
+        meta = {'width': width, 'height': height, 'channels': channels, 'dtype': 'uint8'}
+        with open(os.path.join(self.path, META_FILE), 'w', encoding='utf-8') as f:
+            json.dump(meta, f)
+
+    def describe(self):
+        describe = getattr(self.source, 'describe', None)
+        return describe() if describe else None
+
+    def set(self, prop, value):
+        return self.source.set(prop, value)
+
+    def get(self, prop):
+        return self.source.get(prop)
+
+    def isOpened(self):
+        return self.source.isOpened()
+
+    def release(self):
+        if not self.frames_file.closed:
+            self.frames_file.close()
+            self.timestamps_file.close()
+        self.source.release()
+
+
+class ReplaySource:
+    """Kayıtlı kareleri gerçek zamanlı ya da azami hızda geri oynatır
+
+    Dönen kareler salt okunur memmap görünümleridir; üzerine çizim yapılacaksa
+    önce kopyalanmalıdır.
+    """
+    def __init__(self, path, speed='realtime', loop=False):
+        with open(os.path.join(path, META_FILE), encoding='utf-8') as f:
+            meta = json.load(f)
+        self.width = meta['width']
+        self.height = meta['height']
+        shape = (meta['height'], meta['width'], meta['channels'])
+        frame_size = int(np.prod(shape))
+
+        frames_path = os.path.join(path, FRAMES_FILE)
+        count = os.path.getsize(frames_path) // frame_size
+        self.frames = np.memmap(frames_path, dtype=np.uint8, mode='r',
+                                shape=(count,) + shape) if count else np.empty((0,) + shape, np.uint8)
+        timestamps = np.fromfile(os.path.join(path, TIMESTAMPS_FILE), dtype=np.float64)
+        self.timestamps = timestamps[:count] - (timestamps[0] if count else 0)
+
+        # 'realtime', 'max' ya da hız çarpanı (ör. 4.0 = dört kat hızlı)
+        if speed == 'realtime':
+            self.speed = 1.0
+        elif speed == 'max':
+            self.speed = None
+        else:
+            self.speed = float(speed)
+        self.loop = loop
+        self.index = 0
+        self.start_time = None
+        self.opened = count > 0
+
+    def __len__(self):
+        return len(self.frames)
+
+    def read(self):
+        if not self.opened:
+            return False, None
+        if self.index >= len(self.frames):
+            if not self.loop:
+                return False, None
+            self.index = 0
+            self.start_time = None
+
+        if self.speed is not None:
+            now = time.perf_counter()
+            if self.start_time is None:
+                self.start_time = now
+            due = self.start_time + self.timestamps[self.index] / self.speed
+            if due > now:
+                time.sleep(due - now)
+
+        frame = self.frames[self.index]
+        self.index += 1
+        return True, frame
+
+    def fps(self):
+        if len(self.timestamps) < 2 or self.timestamps[-1] <= 0:
+            return 0.0
+        return (len(self.timestamps) - 1) / self.timestamps[-1]
+
+    def set(self, prop, value):
+        return False
+
+    def get(self, prop):
+        if prop == cv2.CAP_PROP_FRAME_WIDTH:
+            return float(self.width)
+        if prop == cv2.CAP_PROP_FRAME_HEIGHT:
+            return float(self.height)
+        if prop == cv2.CAP_PROP_FPS:
+            return self.fps()
+        if prop == cv2.CAP_PROP_FRAME_COUNT:
+            return float(len(self.frames))
+        if prop == cv2.CAP_PROP_POS_FRAMES:
+            return float(self.index)
+        return 0.0
+
+    def isOpened(self):
+        return self.opened
+
+    def release(self):
+        self.opened = False
+        self.frames = self.frames[:0]
+
+
+class VideoFileSource:
+    """Video dosyasını kendi FPS'inde (CAP_PROP_FPS) ya da azami hızda okur
+
+    Hızsız okunan dosya disk hızında biter; en yeni kareyi alan tüketiciler
+    karelerin çoğunu hiç görmez. speed ReplaySource ile aynıdır.
+    """
+    def __init__(self, path, speed='realtime', default_fps=30.0):
+        self.cap = cv2.VideoCapture(path)
+        if speed == 'realtime':
+            self.speed = 1.0
+        elif speed == 'max':
+            self.speed = None
+        else:
+            self.speed = float(speed)
+        self.fps = self.cap.get(cv2.CAP_PROP_FPS) or default_fps
+        self.index = 0
+        self.start_time = None
+
+    def read(self):
+        if self.speed is not None:
+            now = time.perf_counter()
+            if self.start_time is None:
+                self.start_time = now
+            due = self.start_time + self.index / (self.fps * self.speed)
+            if due > now:
+                time.sleep(due - now)
+        ret, frame = self.cap.read()
+        if ret:
+            self.index += 1
+        return ret, frame
+
+    def describe(self):
+        pace = 'azami hız' if self.speed is None else f"x{self.speed:g}"
+        return f"Video: {self.fps:.1f} FPS ({pace})"
+
+    def set(self, prop, value):
+        return self.cap.set(prop, value)
+
+    def get(self, prop):
+        return self.cap.get(prop)
+
+    def isOpened(self):
+        return self.cap.isOpened()
+
+    def release(self):
+        self.cap.release()
+
+
+def add_source_arguments(parser):
+    group = parser.add_argument_group("kare kaynağı")
+    group.add_argument('--camera', type=int, default=0, help="Kamera numarası")
+    group.add_argument('--replay', help="Kamera yerine kayıt klasörünü oynat")
+    group.add_argument('--speed', default='realtime',
+                       help="Oynatma hızı: realtime, max ya da çarpan (ör. 4)")
+    group.add_argument('--loop', action='store_true', help="Kayıt bitince başa dön")
+    group.add_argument('--record', help="Okunan kareleri bu klasöre kaydet")
+    group.add_argument('--frame-bus', metavar='AD',
+                       help="Kamerayı açmak yerine framebus.py yayınını oku (ör. kamera)")
+    group.add_argument('--fourcc', default='auto',
+                       help="Kamera piksel biçimi: auto, MJPG, YUYV ya da none (sürücü seçer)")
+    return group
+
+
+def source_from_args(args, **camera_options):
+    fourcc = None if args.fourcc.lower() == 'none' else args.fourcc
+    if fourcc and fourcc != 'auto':
+        fourcc = fourcc.upper()
+    return open_source(camera=args.camera, replay=args.replay, record=args.record,
+                       speed=args.speed, loop=args.loop, frame_bus=args.frame_bus,
+                       fourcc=fourcc, **camera_options)
@@ -0,0 +1,195 @@
+"""Bildirimsel jest motoru: öznitelik vektörü üzerinde durum makineleri
+
+Her karede landmark dizisinden tek bir öznitelik vektörü çıkarılır; tüm
+jestlerin koşulları bu vektör üzerinde tek dizi işlemiyle değerlendirilir.
+Her jest iki durumlu (pasif/aktif) bir makinedir:
+    - histerezis: aktifken koşullar gevşek 'exit' eşikleriyle denetlenir,
+    - debounce: durum değişimi için koşul art arda birkaç kare sağlanmalı,
+    - cooldown: iki giriş arasında en az bu kadar süre geçmeli.
+
+Yeni jest eklemek için Gesture tanımı ve on() ile işleyici yeterlidir:
+
+    engine = GestureEngine(DEFAULT_GESTURES + (
+        Gesture('fist', [('index_up', '<', 0.0, 0.1), ('middle_up', '<', 0.0, 0.1)]),
+    ))
+    engine.on('fist', enter=lambda features: print("yumruk"))
+"""
+import time
+
+import numpy as np
+
+from landmarks import (THUMB_TIP, INDEX_PIP, INDEX_TIP, MIDDLE_PIP, MIDDLE_TIP,
+                       RING_PIP, RING_TIP, PINKY_PIP, PINKY_TIP, WRIST, MIDDLE_MCP,
+                       HAND_LANDMARKS)
+from pipeline import StageStats
+
+# Öznitelik vektörünün sırası; işleyiciler FEATURE_INDEX ile erişir.
+# index_y dışındaki tüm öznitelikler avuç boyuna bölünmüştür (ölçekten bağımsız).
+FEATURES = ('pinch_index', 'pinch_middle', 'index_up', 'middle_up', 'ring_up', 'pinky_up',
+            'index_y')
+FEATURE_INDEX = {name: i for i, name in enumerate(FEATURES)}
+
+PINCH_PAIRS = np.array([(THUMB_TIP, INDEX_TIP), (THUMB_TIP, MIDDLE_TIP)])
+FINGER_TIPS = np.array([INDEX_TIP, MIDDLE_TIP, RING_TIP, PINKY_TIP])
+FINGER_PIPS = np.array([INDEX_PIP, MIDDLE_PIP, RING_PIP, PINKY_PIP])
+
+
+class HandFeatures:
+    """(21, 3) landmark dizisi -> öznitelik vektörü (önceden ayrılmış tampona)
+
+    Mesafeler 3B (x, y, z) ölçülür ve avuç boyuna (bilek - orta parmak kökü)
+    bölünür; böylece el kameraya yaklaşıp uzaklaştıkça eşikler değişmez ve
+    düşük çözünürlükte de tıklama doğruluğu korunur. Avuç boyu el başına
+    kareler arasında üstel ortalamayla saklanır; çimdik sırasında avucun kısa
+    süreli bozulması eşikleri oynatmaz.
+    """
+    def __init__(self, aspect=4 / 3, smoothing=0.2, reset_ratio=0.4, min_palm=0.02):
+        self.aspect = aspect            # Kare genişliği / yüksekliği (x ve z'yi y birimine çevirir)
+        self.smoothing = smoothing      # Avuç boyu üstel ortalama katsayısı
+        self.reset_ratio = reset_ratio  # Bu orandan büyük sıçramada ortalama sıfırlanır (yeni el)
+        self.min_palm = min_palm
+        self.scales = {}                # el numarası -> avuç boyu
+        self.out = np.zeros(len(FEATURES), dtype=np.float32)
+        self._points = np.zeros((HAND_LANDMARKS, 3), dtype=np.float32)
+
+    def palm_size(self, points, hand=0):
+        delta = points[MIDDLE_MCP] - points[WRIST]
+        size = max(float(np.sqrt(delta @ delta)), self.min_palm)
+        cached = self.scales.get(hand)
+        if cached is None or abs(size - cached) > self.reset_ratio * cached:
+            cached = size
+        else:
+            cached += self.smoothing * (size - cached)
+        self.scales[hand] = cached
+        return cached
+
+    def extract(self, landmarks, hand=0):
+        # Normalize koordinatları en-boy oranına göre düzelt: x ve z genişliğe göre ölçekli
+        points = self._points
+        np.multiply(landmarks, (self.aspect, 1.0, self.aspect), out=points, casting='unsafe')
+        palm = self.palm_size(points, hand)
+
+        out = self.out
+        delta = points[PINCH_PAIRS[:, 0]] - points[PINCH_PAIRS[:, 1]]
+        out[0:2] = np.sqrt(np.einsum('ij,ij->i', delta, delta)) / palm
+        # Parmak kalkıksa ucu orta eklemin üstündedir (görüntüde y aşağı doğru artar)
+        out[2:6] = (points[FINGER_PIPS, 1] - points[FINGER_TIPS, 1]) / palm
+        out[6] = landmarks[INDEX_TIP, 1]
+        return out
+
+
+class Gesture:
+    """Koşullar: (öznitelik, '<' ya da '>', giriş eşiği, çıkış eşiği)"""
+    def __init__(self, name, conditions, enter_frames=2, exit_frames=2, cooldown=0.0):
+        self.name = name
+        self.conditions = conditions
+        self.enter_frames = enter_frames
+        self.exit_frames = exit_frames
+        self.cooldown = cooldown
+
+
+# Eşikler avuç boyu cinsindendir
+DEFAULT_GESTURES = (
+    # Baş-işaret parmağı çimdiği: sol tık (basılı tutulursa sürükleme)
+    Gesture('left_click', [('pinch_index', '<', 0.2, 0.28)], cooldown=0.03),
+    # Baş-orta parmak çimdiği: sağ tık
+    Gesture('right_click', [('pinch_middle', '<', 0.2, 0.28)], cooldown=0.03),
+    # İşaret ve orta parmak kalkık, yüzük ve serçe kapalı: kaydırma
+    Gesture('scroll', [('index_up', '>', 0.15, 0.05), ('middle_up', '>', 0.15, 0.05),
+                       ('ring_up', '<', 0.0, 0.08), ('pinky_up', '<', 0.0, 0.08)],
+            enter_frames=3),
+)
+
+
+class GestureEngine:
+    def __init__(self, gestures=DEFAULT_GESTURES, features=None):
+        self.features = features or HandFeatures()
+        self.gestures = list(gestures)
+        self.index = {g.name: i for i, g in enumerate(self.gestures)}
+        count = len(self.gestures)
+
+        # Tüm koşullar düz dizilerde: '>' koşulları işaret çevrilerek '<' yapılır
+        owner, feature, sign, enter, exit_ = [], [], [], [], []
+        for i, gesture in enumerate(self.gestures):
+            for name, op, enter_threshold, exit_threshold in gesture.conditions:
+                s = 1.0 if op == '<' else -1.0
+                owner.append(i)
+                feature.append(FEATURE_INDEX[name])
+                sign.append(s)
+                enter.append(s * enter_threshold)
+                exit_.append(s * exit_threshold)
+        self.owner = np.array(owner, dtype=np.intp)
+        self.feature = np.array(feature, dtype=np.intp)
+        self.sign = np.array(sign, dtype=np.float32)
+        self.enter = np.array(enter, dtype=np.float32)
+        self.exit = np.array(exit_, dtype=np.float32)
+        self.enter_frames = np.array([g.enter_frames for g in self.gestures])
+        self.exit_frames = np.array([g.exit_frames for g in self.gestures])
+        self.cooldown = np.array([g.cooldown for g in self.gestures])
+
+        self.active = np.zeros(count, dtype=bool)
+        self.pending = np.zeros(count, dtype=np.int32)  # Ters durumu isteyen ardışık kare
+        self.last_enter = np.full(count, -np.inf)
+        self.handlers = {g.name: ([], [], []) for g in self.gestures}
+        self.stats = StageStats()
+
+    def on(self, name, enter=None, exit=None, hold=None):
+        # İşleyiciler öznitelik vektörüyle çağrılır
+        for handlers, handler in zip(self.handlers[name], (enter, exit, hold)):
+            if handler is not None:
+                handlers.append(handler)
+        return self
+
+    def is_active(self, name):
+        return bool(self.active[self.index[name]])
+
+    def process(self, landmarks, timestamp=None):
+        # Öznitelik çıkarımı + değerlendirme; kare başına maliyet kaydedilir
+        start = time.perf_counter()
+        if timestamp is None:
+            timestamp = start
+        features = self.features.extract(landmarks)
+        events = self.update(features, timestamp)
+        self.stats.record('gestures', time.perf_counter() - start)
+        return events
+
+    def update(self, features, timestamp):
+        active = self.active
+        # Aktif jestlerde çıkış, pasiflerde giriş eşiği (histerezis)
+        thresholds = np.where(active[self.owner], self.exit, self.enter)
+        failed = self.sign * features[self.feature] >= thresholds
+        wanted = np.bincount(self.owner, weights=failed, minlength=len(active)) == 0
+
+        changing = wanted != active
+        self.pending = np.where(changing, self.pending + 1, 0)
+        needed = np.where(active, self.exit_frames, self.enter_frames)
+        flip = changing & (self.pending >= needed)
+        flip &= active | (timestamp - self.last_enter >= self.cooldown)
+
+        events = []
+        for i in np.flatnonzero(flip):
+            name = self.gestures[i].name
+            entering = not active[i]
+            active[i] = entering
+            self.pending[i] = 0
+            if entering:
+                self.last_enter[i] = timestamp
+            events.append((name, 'enter' if entering else 'exit'))
+            for handler in self.handlers[name][0 if entering else 1]:
+                handler(features)
+        for i in np.flatnonzero(active):
+            for handler in self.handlers[self.gestures[i].name][2]:
+                handler(features)
+        return events
+
+    def release_all(self, features=None):
+        # El kaybolunca aktif jestleri kapat (ör. basılı kalan tık bırakılır)
+        events = []
+        for i in np.flatnonzero(self.active):
+            name = self.gestures[i].name
+            self.active[i] = False
+            events.append((name, 'exit'))
+            for handler in self.handlers[name][1]:
+                handler(features)
+        self.pending[:] = 0
+        return events
@@ -0,0 +1,225 @@
+"""Fare girdisi gönderimi: birleştiren, bloklamayan kuyruk ve değiştirilebilir arka uç
+
+Olaylar kuyruğa eklenir ve ayrı bir iş parçacığında gönderilir; yavaş bir X
+sunucusu çağrısı takibi durdurmaz. Kuyrukta:
+    - art arda gelen hareketlerden yalnızca en yenisi tutulur,
+    - art arda gelen kaydırmalar tek kaydırmada toplanır,
+    - basma/bırakma olayları sırasıyla, araya giren hareketlerle birlikte korunur.
+
+Arka uçlar: pyautogui (varsayılan), xlib (python-xlib XTest, tek sync ile
+toplu gönderim) ve record (olayları belleğe yazar; testler ve ölçüm için).
+"""
+import threading
+import time
+
+from warmstart import lazy_import
+
+pyautogui = lazy_import('pyautogui')
+
+
+class PyAutoGUIBackend:
+    def __init__(self):
+        pyautogui.FAILSAFE = False
+        pyautogui.MINIMUM_DURATION = 0
+        pyautogui.MINIMUM_SLEEP = 0
+        pyautogui.PAUSE = 0
+
+    def move(self, x, y):
+        pyautogui.moveTo(x, y, _pause=False)
+
+    def down(self, button):
+        pyautogui.mouseDown(button=button, _pause=False)
+
+    def up(self, button):
+        pyautogui.mouseUp(button=button, _pause=False)
+
+    def scroll(self, amount):
+        pyautogui.scroll(amount, _pause=False)
+
+    def flush(self):
+        pass
+
+
+class XlibBackend:
+    """XTest ile doğrudan X sunucusuna gönderir; her toplu gönderimde tek sync"""
+    BUTTONS = {'left': 1, 'middle': 2, 'right': 3}
+    SCROLL_UP, SCROLL_DOWN = 4, 5
+
+    def __init__(self):
+        from Xlib import X, display
+        from Xlib.ext import xtest
+        self.X = X
+        self.xtest = xtest
+        self.display = display.Display()
+
+    def move(self, x, y):
+        self.xtest.fake_input(self.display, self.X.MotionNotify, x=int(x), y=int(y))
+
+    def down(self, button):
+        self.xtest.fake_input(self.display, self.X.ButtonPress, self.BUTTONS[button])
+
+    def up(self, button):
+        self.xtest.fake_input(self.display, self.X.ButtonRelease, self.BUTTONS[button])
+
+    def scroll(self, amount):
+        # pyautogui ile aynı: pozitif yukarı, her birim bir tekerlek adımı
+        button = self.SCROLL_UP if amount > 0 else self.SCROLL_DOWN
+        for _ in range(abs(int(amount))):
+            self.xtest.fake_input(self.display, self.X.ButtonPress, button)
+            self.xtest.fake_input(self.display, self.X.ButtonRelease, button)
+
+    def flush(self):
+        self.display.sync()
+
+
+class RecordingBackend:
+    """Olayları (tür, değer, zaman) olarak kaydeder, hiçbir şey göndermez"""
+    def __init__(self):
+        self.events = []
+
+    def move(self, x, y):
+        self.events.append(('move', (x, y), time.perf_counter()))
+
+    def down(self, button):
+        self.events.append(('down', button, time.perf_counter()))
+
+    def up(self, button):
+        self.events.append(('up', button, time.perf_counter()))
+
+    def scroll(self, amount):
+        self.events.append(('scroll', amount, time.perf_counter()))
+
+    def flush(self):
+        pass
+
+
+BACKENDS = {
+    'pyautogui': PyAutoGUIBackend,
+    'xlib': XlibBackend,
+    'record': RecordingBackend,
+}
+
+
+def make_backend(name='pyautogui'):
+    if name not in BACKENDS:
+        raise ValueError(f"Bilinmeyen girdi arka ucu: {name} (seçenekler: {', '.join(BACKENDS)})")
+    return BACKENDS[name]()
+
+
+class InputInjector:
+    """Fare olayları kuyruğu; threaded=False ise olaylar hemen gönderilir"""
+    def __init__(self, backend=None, threaded=True):
+        self.backend = backend or PyAutoGUIBackend()
+        self.threaded = threaded
+        self._cond = threading.Condition()
+        self._queue = []  # [tür, değer] listeleri; birleştirme yerinde yapılır
+
+        self.queued = 0
+        self.sent = 0
+        self.dropped_moves = 0
+        self.merged_scrolls = 0
+        self.errors = 0
+        self.max_depth = 0
+
+        self.running = False
+        self.thread = None
+
+    def start(self):
+        if self.running or not self.threaded:
+            return
+        self.running = True
+        self.thread = threading.Thread(target=self._loop, daemon=True)
+        self.thread.start()
+
+    def stop(self, timeout=1.0):
+        with self._cond:
+            self.running = False
+            self._cond.notify_all()
+        if self.thread is not None:
+            self.thread.join(timeout)
+            self.thread = None
+        self._dispatch(self._take())
+
+    def move(self, x, y):
+        self._put('move', (x, y))
+
+    def press(self, button):
+        self._put('down', button)
+
+    def release(self, button):
+        self._put('up', button)
+
+    def scroll(self, amount):
+        if amount:
+            self._put('scroll', amount)
+
+    def _put(self, kind, value):
+        if not self.running:
+            self.queued += 1
+            self._dispatch([[kind, value]])
+            return
+        with self._cond:
+            self.queued += 1
+            queue = self._queue
+            last = queue[-1] if queue else None
+            if last is not None and last[0] == kind == 'move':
+                last[1] = value  # Gönderilmemiş eski hareket atılır
+                self.dropped_moves += 1
+            elif last is not None and last[0] == kind == 'scroll':
+                last[1] += value
+                self.merged_scrolls += 1
+            else:
+                queue.append([kind, value])
+                self.max_depth = max(self.max_depth, len(queue))
+            self._cond.notify()
+
+    def _take(self):
+        with self._cond:
+            events, self._queue = self._queue, []
+        return events
+
+    def _dispatch(self, events):
+        backend = self.backend
+        for kind, value in events:
+            try:
+                if kind == 'move':
+                    backend.move(*value)
+                elif kind == 'down':
+                    backend.down(value)
+                elif kind == 'up':
+                    backend.up(value)
+                else:
+                    backend.scroll(value)
+                self.sent += 1
+            except Exception:
+                self.errors += 1
+        if events:
+            try:
+                backend.flush()
+            except Exception:
+                self.errors += 1
+
+    def _loop(self):
+        while True:
+            with self._cond:
+                while self.running and not self._queue:
+                    self._cond.wait()
+                if not self.running:
+                    return
+                events, self._queue = self._queue, []
+            self._dispatch(events)
+
+    def depth(self):
+        with self._cond:
+            return len(self._queue)
+
+    def stats(self):
+        return {
+            'queue_depth': self.depth(),
+            'max_queue_depth': self.max_depth,
+            'queued': self.queued,
+            'sent': self.sent,
+            'dropped_moves': self.dropped_moves,
+            'merged_scrolls': self.merged_scrolls,
+            'errors': self.errors,
+        }
@@ -0,0 +1,90 @@
+"""Kare içeriğine göre anahtarlanmış kalıcı landmark önbelleği
+
+Aynı kayıt tekrar oynatıldığında model çıkarımı yerine önceki sonuçlar
+kullanılır. Kayıtlar diske tek bir yapılandırılmış NumPy dizisi (.npy)
+olarak yazılır; bellekte en son kullanılan kayıtlar tutulur (LRU).
+"""
+import hashlib
+import os
+from collections import OrderedDict
+
+import numpy as np
+
+KEY_SIZE = 16
+
+
+class LandmarkCache:
+    def __init__(self, shape, path=None, max_entries=100000, max_mb=None):
+        self.shape = tuple(shape)
+        self.path = path
+        self.dtype = np.dtype([('key', 'u1', (KEY_SIZE,)), ('landmarks', '<f4', self.shape)])
+        if max_mb is not None:
+            max_entries = min(max_entries, int(max_mb * 1024 * 1024) // self.dtype.itemsize)
+        self.max_entries = max(1, max_entries)
+        self.entries = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.dirty = False
+        if path and os.path.exists(path):
+            self.load(path)
+
+    @staticmethod
+    def key(frame):
+        digest = hashlib.blake2b(digest_size=KEY_SIZE)
+        digest.update(repr(frame.shape).encode())
+        digest.update(np.ascontiguousarray(frame).data)
+        return digest.digest()
+
+    def get(self, key):
+        # (bulundu mu, landmark dizisi ya da tespit yoksa None)
+        landmarks = self.entries.get(key)
+        if landmarks is None:
+            self.misses += 1
+            return False, None
+        self.entries.move_to_end(key)
+        self.hits += 1
+        if np.isnan(landmarks[0, 0]):
+            return True, None
+        return True, landmarks
+
+    def put(self, key, landmarks):
+        if landmarks is None:
+            # Tespit olmayan kareler NaN ile saklanır
+            landmarks = np.full(self.shape, np.nan, dtype=np.float32)
+        elif landmarks.shape != self.shape:
+            return
+        self.entries[key] = np.asarray(landmarks, dtype=np.float32)
+        self.entries.move_to_end(key)
+        self.dirty = True
+        while len(self.entries) > self.max_entries:
+            self.entries.popitem(last=False)
+            self.evictions += 1
+
+    def load(self, path):
+        records = np.load(path, allow_pickle=False)
+        if records.dtype != self.dtype:
+            print(f"Önbellek biçimi uyumsuz, yok sayıldı: {path}")
+            return
+        for record in records[-self.max_entries:]:
+            self.entries[record['key'].tobytes()] = record['landmarks'].copy()
+
+    def save(self, path=None):
+        path = path or self.path
+        if not path or not self.dirty:
+            return
+        records = np.empty(len(self.entries), dtype=self.dtype)
+        if self.entries:
+            keys = b''.join(self.entries.keys())
+            records['key'] = np.frombuffer(keys, dtype=np.uint8).reshape(-1, KEY_SIZE)
+            records['landmarks'] = np.stack(list(self.entries.values()))
+        tmp_path = path + '.tmp'
+        with open(tmp_path, 'wb') as f:
+            np.save(f, records)
+        os.replace(tmp_path, path)
+        self.dirty = False
+
+    def stats(self):
+        total = self.hits + self.misses
+        return {'entries': len(self.entries), 'hits': self.hits, 'misses': self.misses,
+                'hit_rate': self.hits / total if total else 0.0, 'evictions': self.evictions}
@@ -0,0 +1,70 @@
+"""MediaPipe landmark sonuçlarını NumPy dizilerine dönüştürme
+
+Sonuç bir kez (N, 3) float32 diziye çevrilir; mesafe, göz oranı ve piksel
+izdüşümü hesapları dizi işlemleriyle yapılır. Fonksiyonlar baştaki ek
+boyutları (ör. (F, N, 3) kare yığını) da kabul eder.
+"""
+import numpy as np
+
+HAND_LANDMARKS = 21
+FACE_LANDMARKS = 478  # refine_landmarks=True ile
+
+# El landmark numaraları
+WRIST = 0
+THUMB_TIP = 4
+INDEX_PIP = 6
+INDEX_TIP = 8
+MIDDLE_MCP = 9
+MIDDLE_PIP = 10
+MIDDLE_TIP = 12
+RING_PIP = 14
+RING_TIP = 16
+PINKY_PIP = 18
+PINKY_TIP = 20
+
+# El iskeleti (mp.solutions.hands.HAND_CONNECTIONS ile aynı çiftler)
+HAND_CONNECTIONS = ((0, 1), (1, 2), (2, 3), (3, 4), (0, 5), (5, 6), (6, 7), (7, 8),
+                    (5, 9), (9, 10), (10, 11), (11, 12), (9, 13), (13, 14), (14, 15),
+                    (15, 16), (13, 17), (17, 18), (18, 19), (19, 20), (0, 17))
+
+# İris merkezleri (refine_landmarks=True) ve aynı gözün köşeleri: (iris, sol köşe, sağ köşe)
+# Köşe sırası iki gözde de aynı yönde; böylece iki gözün oranı ortalanabilir
+IRIS_EYES = ((468, 33, 133), (473, 362, 263))
+
+
+def to_array(landmark_list):
+    # landmark protobuf listesi -> (N, 3) float32 [x, y, z]
+    count = len(landmark_list)
+    values = np.fromiter((v for l in landmark_list for v in (l.x, l.y, l.z)),
+                         dtype=np.float32, count=3 * count)
+    return values.reshape(count, 3)
+
+
+def to_pixels(landmarks, width, height, out=None):
+    # Normalize koordinatlar -> (N, 2) int32 piksel koordinatları
+    scaled = landmarks[..., :2] * np.array([width, height], dtype=np.float32)
+    if out is None:
+        return scaled.astype(np.int32)
+    np.copyto(out, scaled, casting='unsafe')
+    return out
+
+
+def iris_ratios(face_points):
+    """(..., 478, 2) yüz noktaları -> (..., 2, 2) [göz, (x, y)] iris konumu
+
+    İris merkezi göz köşelerinin orta noktasına göre, köşeler arası eksende
+    (x) ve ona dik yönde (y) ölçülür, göz genişliğine bölünür. Baş dönmesi
+    ve kameraya uzaklık oranı değiştirmez; yalnızca göz hareketi değiştirir.
+    Piksel koordinatları verilmeli (normalize x, y farklı ölçeklidir).
+    """
+    points = np.asarray(face_points, dtype=np.float32)[..., :2]
+    index = np.array(IRIS_EYES)
+    iris = points[..., index[:, 0], :]
+    first = points[..., index[:, 1], :]
+    second = points[..., index[:, 2], :]
+    axis = second - first
+    offset = iris - (first + second) / 2
+    width_sq = np.maximum(np.einsum('...i,...i->...', axis, axis), 1e-6)
+    along = np.einsum('...i,...i->...', offset, axis) / width_sq
+    across = (axis[..., 0] * offset[..., 1] - axis[..., 1] * offset[..., 0]) / width_sq
+    return np.stack((along, across), axis=-1)
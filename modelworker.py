@@ -0,0 +1,354 @@
+"""Model işçi süreçleri: her MediaPipe modeli kendi uzun ömürlü sürecinde
+
+Ana süreçte Tk, PIL dönüşümü ve canvas güncellemesi model çağrılarıyla aynı
+GIL için yarışır. InferencePool her modeli (yüz ağı, eller) ayrı bir süreçte
+bir kez yükler; kareler framebus halkasıyla paylaşılan bellekten verilir,
+işçiler yalnızca kare sıra numarasını alır ve küçük landmark dizileri döner:
+    yüz: (478, 3) float32, eller: (N, 21, 3) float32, bulunamazsa None.
+
+face_model() ve hands_model() aynı sonuçları ana süreçte üreten model
+fonksiyonlarıdır; iş parçacıklı ve süreçli yollar aynı arayüzü kullanır.
+
+İki yolu aynı kareler üzerinde karşılaştırmak için:
+
+    python modelworker.py --replay kayitlar/oturum1 --seconds 10
+"""
+import multiprocessing
+import os
+import threading
+import time
+
+import numpy as np
+
+from framebus import FrameBusWriter, SharedFrameSource
+from landmarks import to_array
+
+# yuztakip.py'deki ayarlar
+FACE_OPTIONS = {'max_num_faces': 1, 'refine_landmarks': True,
+                'min_detection_confidence': 0.5, 'min_tracking_confidence': 0.5}
+HANDS_OPTIONS = {'max_num_hands': 2,
+                 'min_detection_confidence': 0.7, 'min_tracking_confidence': 0.7}
+
+
+def face_model(**options):
+    import mediapipe as mp
+    model = mp.solutions.face_mesh.FaceMesh(**{**FACE_OPTIONS, **options})
+
+    def run(rgb):
+        results = model.process(rgb)
+        if not results.multi_face_landmarks:
+            return None
+        return to_array(results.multi_face_landmarks[0].landmark)
+    return run
+
+
+def hands_model(**options):
+    import mediapipe as mp
+    model = mp.solutions.hands.Hands(**{**HANDS_OPTIONS, **options})
+
+    def run(rgb):
+        results = model.process(rgb)
+        if not results.multi_hand_landmarks:
+            return None
+        return np.stack([to_array(hand.landmark) for hand in results.multi_hand_landmarks])
+    return run
+
+
+MODELS = {
+    'face': face_model,
+    'hands': hands_model,
+}
+
+
+class WorkerDied(RuntimeError):
+    """İşçi süreci kapandı ya da kanal koptu; sonraki çağrılar da başarısız olur"""
+
+
+def _serve(kind, options, bus_name, conn):
+    # İşçi süreci: modeli yükle, sıra numarası geldikçe o kareyi işle
+    try:
+        model = MODELS[kind](**options)
+        source = SharedFrameSource(bus_name, timeout=10.0)
+        if not source.isOpened():
+            raise RuntimeError(f"kare yolu bulunamadı: {bus_name}")
+    except Exception as e:
+        conn.send(('error', repr(e)))
+        return
+    conn.send(('ready', time.process_time()))  # Yükleme CPU'su ölçümden düşülsün
+    while True:
+        try:
+            seq = conn.recv()
+        except EOFError:
+            break
+        if seq is None:
+            break
+        start = time.perf_counter()
+        result, error = None, None
+        try:
+            ok, rgb = source.read_seq(seq)
+            if ok:
+                result = model(rgb)
+        except Exception as e:
+            error = repr(e)
+        conn.send((result, time.perf_counter() - start, time.process_time(), error))
+    source.release()
+
+
+class ModelWorker:
+    """Tek modelin süreci; infer() sıra numarasını gönderir ve sonucu bekler"""
+    def __init__(self, kind, bus_name, context, **options):
+        self.kind = kind
+        self.conn, child = context.Pipe()
+        self.process = context.Process(target=_serve, args=(kind, options, bus_name, child),
+                                       name=f'model-{kind}', daemon=True)
+        self.process.start()
+        child.close()
+
+        self.calls = 0
+        self.model_time = 0.0   # İşçide geçen toplam süre
+        self.round_trip = 0.0   # Gönderimden sonuca toplam süre
+        self.cpu = 0.0          # İşçi sürecinin son bildirdiği CPU zamanı
+
+    def wait_ready(self, timeout=60.0):
+        if not self.conn.poll(timeout):
+            raise TimeoutError(f"{self.kind} işçisi {timeout:.0f} s içinde hazır olmadı")
+        status, detail = self.conn.recv()
+        if status != 'ready':
+            raise RuntimeError(f"{self.kind} işçisi başlatılamadı: {detail}")
+        self.cpu = detail
+
+    def infer(self, seq):
+        start = time.perf_counter()
+        try:
+            self.conn.send(seq)
+            # Süreç ölürse kanal EOF verir; yine de takılı kalmamak için yoklanır
+            while not self.conn.poll(0.5):
+                if not self.process.is_alive():
+                    raise EOFError
+            result, elapsed, cpu, error = self.conn.recv()
+        except (EOFError, OSError) as e:  # BrokenPipeError, ConnectionResetError
+            raise WorkerDied(f"{self.kind} işçisi durdu (çıkış kodu {self.process.exitcode}): "
+                             f"{e!r}") from e
+        if error:
+            raise RuntimeError(f"{self.kind} işçisi: {error}")
+        self.calls += 1
+        self.model_time += elapsed
+        self.round_trip += time.perf_counter() - start
+        self.cpu = cpu
+        return result
+
+    def stats(self):
+        calls = max(self.calls, 1)
+        return {
+            'calls': self.calls,
+            'model_ms': 1000 * self.model_time / calls,
+            # Kanal ve süreç geçişinin kare başına ek maliyeti
+            'overhead_ms': 1000 * (self.round_trip - self.model_time) / calls,
+            'cpu_s': self.cpu,
+        }
+
+    def stop(self, timeout=2.0):
+        try:
+            self.conn.send(None)
+        except (BrokenPipeError, OSError):
+            pass
+        self.process.join(timeout)
+        if self.process.is_alive():
+            self.process.terminate()
+        self.conn.close()
+
+
+class InferencePool:
+    """Model işçileri ve onları besleyen paylaşılan bellek karesi
+
+    Kare next_buffer() tamponuna yazılır (ör. cvtColor dst=), commit() ile
+    yayınlanır; model(kind) dönen fonksiyonlar son yayınlanan kareyi işletir.
+    İki yuva yeterlidir: sonraki kare ancak önceki sonuçlar gelince yazılır.
+    Bir işçi ölürse hata bir kez yazılır, işçi havuzdan çıkarılır ve o model bu
+    süreçte çalışmaya devam eder.
+    """
+    def __init__(self, shape, models=('face', 'hands'), options=None, slots=2):
+        # Tk ve iş parçacıkları olan süreçte fork güvenli değil
+        context = multiprocessing.get_context('spawn')
+        self.bus = FrameBusWriter(f'model_{os.getpid()}', shape, slots)
+        options = options or {}
+        self.options = options
+        self.fallback = {}  # Ölen işçinin yerine bu süreçte yüklenen model fonksiyonları
+        self.retired_cpu = 0.0  # Çıkarılan işçilerin son CPU zamanı (worker_cpu geri gitmesin)
+        self.workers = {kind: ModelWorker(kind, self.bus.name, context, **options.get(kind, {}))
+                        for kind in models}
+        try:
+            for worker in self.workers.values():  # Modeller paralel yüklenir
+                worker.wait_ready()
+        except Exception:
+            self.close()
+            raise
+        self.seq = -1
+
+    def next_buffer(self):
+        return self.bus.next_slot()
+
+    def commit(self):
+        self.bus.commit(time.perf_counter())
+        self.seq = self.bus.seq
+        return self.seq
+
+    def model(self, kind):
+        # Ana süreç model fonksiyonlarıyla aynı imza; kare zaten paylaşılan bellekte
+        def run(rgb):
+            local = self.fallback.get(kind)
+            if local is None:
+                worker = self.workers.get(kind)
+                if worker is not None:
+                    try:
+                        return worker.infer(self.seq)
+                    except WorkerDied as e:
+                        print(f"{e}; {kind} modeli bu süreçte çalışmaya devam edecek")
+                        self._retire(kind)
+                local = self.fallback[kind] = MODELS[kind](**self.options.get(kind, {}))
+            return local(rgb)
+        return run
+
+    def _retire(self, kind):
+        # Ölen işçiyi çıkar: istatistikler, CPU ölçümü ve close() onu bir daha görmez
+        worker = self.workers.pop(kind)
+        self.retired_cpu += worker.cpu
+        worker.stop(timeout=0)
+
+    def worker_cpu(self):
+        # Diğer iş parçacığı bir işçiyi çıkarabilir: sözlüğün kopyası üzerinde dolaş
+        return self.retired_cpu + sum(worker.cpu for worker in list(self.workers.values()))
+
+    def stats(self):
+        return {kind: worker.stats() for kind, worker in list(self.workers.items())}
+
+    def close(self):
+        for worker in list(self.workers.values()):
+            worker.stop()
+        self.workers.clear()
+        self.bus.close()
+
+
+class CpuMeter:
+    """Son örnekten bu yana CPU payı (100 = bir çekirdek); işçiler dahil"""
+    def __init__(self, pool=None):
+        self.pool = pool
+        self.last = self._read()
+
+    def _read(self):
+        workers = self.pool.worker_cpu() if self.pool is not None else 0.0
+        return time.perf_counter(), time.process_time(), workers
+
+    def sample(self):
+        wall, cpu, workers = self._read()
+        last_wall, last_cpu, last_workers = self.last
+        self.last = wall, cpu, workers
+        elapsed = max(wall - last_wall, 1e-9)
+        return {'process': 100 * (cpu - last_cpu) / elapsed,
+                'workers': 100 * (workers - last_workers) / elapsed,
+                'total': 100 * (cpu - last_cpu + workers - last_workers) / elapsed}
+
+
+def _render_load(frames, size, stop, counter):
+    # Tk tarafının yükü: PIL dönüşümü ve ekran boyutuna ölçekleme (GIL tutan iş)
+    from PIL import Image
+    index = 0
+    while not stop.is_set():
+        Image.fromarray(frames[index % len(frames)]).resize(size).tobytes()
+        index += 1
+        counter[0] += 1
+        time.sleep(0.01)  # yuztakip.MainApp.render_interval_ms
+
+
+def compare(frames, seconds=10.0, render_size=(1280, 720)):
+    """İş parçacıklı ve süreçli yolları aynı RGB kareler üzerinde ölç
+
+    Her karede yüz ağı ve eller paralel çalışır (zamanlayıcının en yoğun hali);
+    arka planda gösterim yükü çalışır. Dönen: mod -> FPS, gösterim hızı, CPU %.
+    """
+    from concurrent.futures import ThreadPoolExecutor
+    results = {}
+    for mode in ('thread', 'process'):
+        pool = None
+        if mode == 'thread':
+            face, hands = face_model(), hands_model()
+        else:
+            pool = InferencePool(frames[0].shape)
+            face, hands = pool.model('face'), pool.model('hands')
+        executor = ThreadPoolExecutor(max_workers=2)
+        stop, rendered = threading.Event(), [0]
+        renderer = threading.Thread(target=_render_load, args=(frames, render_size, stop, rendered),
+                                    daemon=True)
+        renderer.start()
+
+        meter = CpuMeter(pool)
+        count, start = 0, time.perf_counter()
+        while time.perf_counter() - start < seconds:
+            rgb = frames[count % len(frames)]
+            if pool is not None:
+                pool.next_buffer()[...] = rgb  # Uygulamada cvtColor doğrudan buraya yazar
+                pool.commit()
+            face_future = executor.submit(face, rgb)
+            hands_future = executor.submit(hands, rgb)
+            face_future.result()
+            hands_future.result()
+            count += 1
+        elapsed = time.perf_counter() - start
+        cpu = meter.sample()
+        stop.set()
+        renderer.join()
+        executor.shutdown()
+        results[mode] = {
+            'fps': count / elapsed,
+            'render_fps': rendered[0] / elapsed,
+            'cpu_process_pct': cpu['process'],
+            'cpu_total_pct': cpu['total'],
+        }
+        if pool is not None:
+            results[mode]['workers'] = pool.stats()
+            pool.close()
+    return results
+
+
+def print_comparison(results):
+    print(f"{'':<10}{'FPS':>8}{'gösterim':>10}{'CPU ana %':>11}{'CPU toplam %':>14}")
+    for mode, label in (('thread', 'iş parç.'), ('process', 'süreç')):
+        r = results[mode]
+        print(f"{label:<10}{r['fps']:8.1f}{r['render_fps']:10.1f}"
+              f"{r['cpu_process_pct']:11.1f}{r['cpu_total_pct']:14.1f}")
+    for kind, stats in results['process'].get('workers', {}).items():
+        print(f"  {kind}: model {stats['model_ms']:.1f} ms, "
+              f"süreç geçişi +{stats['overhead_ms']:.2f} ms/kare")
+
+
+if __name__ == "__main__":
+    import argparse
+    import json
+    import cv2
+    from framesource import add_source_arguments, source_from_args
+    parser = argparse.ArgumentParser(description="Model işçileri: iş parçacığı / süreç karşılaştırması")
+    add_source_arguments(parser)
+    parser.add_argument('--width', type=int, default=640, help="Çıkarım karesi genişliği")
+    parser.add_argument('--frames', type=int, default=120, help="Belleğe alınacak kare sayısı")
+    parser.add_argument('--seconds', type=float, default=10.0, help="Mod başına ölçüm süresi")
+    parser.add_argument('--json', help="Sonuçları JSON dosyasına yaz")
+    args = parser.parse_args()
+
+    source = source_from_args(args)
+    frames = []
+    while len(frames) < args.frames:
+        ret, frame = source.read()
+        if not ret:
+            break
+        height = max(1, round(args.width * frame.shape[0] / frame.shape[1]))
+        small = cv2.resize(frame, (args.width, height), interpolation=cv2.INTER_AREA)
+        frames.append(cv2.cvtColor(small, cv2.COLOR_BGR2RGB))
+    source.release()
+    if not frames:
+        raise SystemExit("Kaynaktan kare okunamadı")
+
+    results = compare(frames, args.seconds)
+    print_comparison(results)
+    if args.json:
+        with open(args.json, 'w', encoding='utf-8') as f:
+            json.dump(results, f, indent=2)
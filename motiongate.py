@@ -0,0 +1,74 @@
+"""Hareket kapısı: sahne değişmediyse model çağrısını atla
+
+Kare küçük bir gri görüntüye indirgenir ve modelin son çalıştığı karenin
+küçük görüntüsüyle karşılaştırılır. Belirgin şekilde değişen piksel sayısı
+eşiğin altındaysa önceki sonuç (landmark ya da tespitler) yeniden kullanılır.
+Yavaş kaymaların birikmemesi için karşılaştırma her zaman son çalıştırmaya
+göre yapılır ve refresh_interval karede bir model zorla çalıştırılır.
+Küçük görüntüde bir pikselden küçük kalan hareketler (göz bebeği, kısa bir
+çimdik) görülmez; bunlar önemliyse check() daha kısa bir aralıkla çağrılır.
+
+Hareket varken kapının maliyeti kare başına yalnızca bir küçültme ve bir
+fark işlemidir, yani aktif kullanımda gecikme değişmez.
+"""
+from warmstart import lazy_import
+
+cv2 = lazy_import('cv2')
+
+
+class MotionGate:
+    def __init__(self, size=(40, 30), pixel_threshold=8, min_changed=2, refresh_interval=15):
+        self.size = size                        # Karşılaştırma görüntüsü (genişlik, yükseklik)
+        self.pixel_threshold = pixel_threshold  # Bu kadar gri seviye değişen piksel "değişmiş" sayılır
+        self.min_changed = min_changed          # En az bu kadar değişmiş piksel varsa model çalışır
+        self.refresh_interval = refresh_interval
+        self.reference = None
+        self._small = None
+        self._gray = None
+        self._diff = None
+        self.since_refresh = 0
+
+        self.checks = 0
+        self.skipped = 0
+        self.last_changed = 0
+
+    def _thumbnail(self, frame):
+        # Önce küçült (INTER_AREA gürültüyü de ortalar), sonra griye çevir
+        self._small = cv2.resize(frame, self.size, dst=self._small, interpolation=cv2.INTER_AREA)
+        if self._small.ndim == 2:
+            return self._small
+        self._gray = cv2.cvtColor(self._small, cv2.COLOR_BGR2GRAY, dst=self._gray)
+        return self._gray
+
+    def check(self, frame, refresh_interval=None):
+        """Model çalışmalıysa True; False ise önceki sonuç kullanılmalı
+
+        refresh_interval bu çağrı için zorla çalıştırma aralığını değiştirir.
+        """
+        self.checks += 1
+        gray = self._thumbnail(frame)
+        if refresh_interval is None:
+            refresh_interval = self.refresh_interval
+        if self.reference is not None and self.since_refresh < refresh_interval:
+            self._diff = cv2.absdiff(gray, self.reference, dst=self._diff)
+            self.last_changed = cv2.countNonZero(
+                cv2.threshold(self._diff, self.pixel_threshold, 255, cv2.THRESH_BINARY,
+                              dst=self._diff)[1])
+            if self.last_changed < self.min_changed:
+                self.since_refresh += 1
+                self.skipped += 1
+                return False
+        self.reference = gray.copy()
+        self.since_refresh = 0
+        return True
+
+    def reset(self):
+        # Sonraki karede model kesin çalışsın (ör. kaynak değişti)
+        self.reference = None
+
+    def stats(self):
+        return {
+            'checks': self.checks,
+            'skipped': self.skipped,
+            'skip_rate': self.skipped / self.checks if self.checks else 0.0,
+        }
@@ -1,14 +1,27 @@
+from warmstart import lazy_import, report, WarmStart
 import tkinter as tk
 from tkinter import ttk
-from PIL import Image, ImageTk, ImageDraw, ImageFont
-from threading import Thread
 import time
-import cv2
-import mediapipe as mp
-import pyautogui
-from screeninfo import get_monitors
-import math
-from collections import deque
+import argparse
+import numpy as np
+from pipeline import HandPipeline, IdleMonitor
+from framesource import open_camera, add_source_arguments, source_from_args
+from landmarks import to_array, HAND_LANDMARKS, INDEX_TIP
+from landmarkcache import LandmarkCache
+from filters import FILTERS, make_filter, parse_params
+from actuator import CursorActuator
+from injection import BACKENDS as INPUT_BACKENDS, make_backend
+from gestures import GestureEngine, FEATURE_INDEX
+from motiongate import MotionGate
+
+# Ağır modüller ilk kullanımda yüklenir; pencere bunları beklemeden açılır
+cv2 = lazy_import('cv2')
+mp = lazy_import('mediapipe')
+pyautogui = lazy_import('pyautogui')  # Sadece injection.py kullanır; burada önceden yüklenir
+Image = lazy_import('PIL.Image')
+ImageTk = lazy_import('PIL.ImageTk')
+ImageDraw = lazy_import('PIL.ImageDraw')
+ImageFont = lazy_import('PIL.ImageFont')
 
 class TutorialOverlay:
     def __init__(self, root, screen_width, screen_height):
@@ -55,8 +68,8 @@ class TutorialOverlay:
                 'image': 'images/right_click.png'
             },
             {
-                'title': 'İşaret Parmağı Yukarı/Aşağı - Kaydırma',
-                'text': 'İşaret parmağınızı yukarı/aşağı hareket ettirin.\nBu hareket sayfayı kaydırır.',
+                'title': 'İki Parmak Yukarı/Aşağı - Kaydırma',
+                'text': 'İşaret ve orta parmağınızı kaldırın, diğer parmaklarınızı kapatın.\nElinizi yukarı/aşağı hareket ettirmek sayfayı kaydırır.',
                 'image': 'images/scroll.png'
             }
         ]
@@ -215,134 +228,245 @@ class TutorialOverlay:
         self.window.destroy()
 
 class SmoothMouseController:
-    def __init__(self):
-        self.pos_history = deque(maxlen=3)
-        self.last_update = time.time()
-        self.velocity = [0, 0]
-        self.damping = 0.6
-        self.spring = 0.4
-        
-    def update_target(self, target_x, target_y):
-        current_time = time.time()
-        dt = current_time - self.last_update
-        self.last_update = current_time
-        
-        if not self.pos_history:
-            self.pos_history.append((pyautogui.position()))
-            return target_x, target_y
-        
-        current_pos = self.pos_history[-1]
-        
-        dist_x = target_x - current_pos[0]
-        dist_y = target_y - current_pos[1]
-        dist = math.sqrt(dist_x**2 + dist_y**2)
-        
-        acceleration = min(dist / 500, 2.0)
-        
-        force_x = dist_x * self.spring * acceleration
-        force_y = dist_y * self.spring * acceleration
-        
-        self.velocity[0] = self.velocity[0] * self.damping + force_x
-        self.velocity[1] = self.velocity[1] * self.damping + force_y
-        
-        new_x = int(current_pos[0] + self.velocity[0])
-        new_y = int(current_pos[1] + self.velocity[1])
-        
-        self.pos_history.append((new_x, new_y))
-        return new_x, new_y
+    """Ham imleç hedefini filtreler ve boru hattı gecikmesi kadar ileri kestirir"""
+    def __init__(self, filter_name='oneeuro', predict=True, max_lead=0.1, **filter_params):
+        self.filter = make_filter(filter_name, **filter_params)
+        self.predict = predict
+        self.max_lead = max_lead      # Aşırı kestirimi önlemek için üst sınır (s)
+        self.latency = 0.0            # Yakalama -> eylem gecikmesi (üstel ortalama)
+        
+    def update_target(self, target_x, target_y, captured=None):
+        # captured: karenin yakalandığı an (perf_counter); yoksa şimdiki zaman
+        now = time.perf_counter()
+        timestamp = now if captured is None else captured
+        self.filter.update((target_x, target_y), timestamp)
+        
+        lead = 0.0
+        if self.predict:
+            self.latency += 0.2 * ((now - timestamp) - self.latency)
+            lead = min(self.latency, self.max_lead)
+        x, y = self.filter.predict(lead)
+        return float(x), float(y)  # Yuvarlama actuator gönderirken yapılır
+
+MIRROR_SCALE = np.array((-1, 1), dtype=np.float32)
+MIRROR_OFFSET = np.array((1, 0), dtype=np.float32)
+
+class HandRegionTracker:
+    """Önceki karedeki el kutusunun etrafında kırpma bölgesi (ROI) tutar"""
+    def __init__(self, margin=0.6, min_size=96, recenter=0.15):
+        self.margin = margin      # Kutu boyutuna oranla her yöne pay
+        self.min_size = min_size  # Piksel cinsinden en küçük ROI kenarı
+        self.recenter = recenter  # El kenara bu orandan yakınsa ROI taşınır
+        self.roi = None
+        
+        self.roi_frames = 0
+        self.roi_losses = 0
+        self.full_frames = 0
+    
+    def crop(self, frame):
+        if self.roi is None:
+            return None
+        x0, y0, x1, y1 = self.roi
+        return frame[y0:y1, x0:x1]
+    
+    def to_frame(self, landmarks, width, height):
+        # Kırpılmış normalize koordinatları tüm kareye çevir
+        x0, y0, x1, y1 = self.roi
+        landmarks[:, 0] = (landmarks[:, 0] * (x1 - x0) + x0) / width
+        landmarks[:, 1] = (landmarks[:, 1] * (y1 - y0) + y0) / height
+        landmarks[:, 2] *= (x1 - x0) / width
+        return landmarks
+    
+    def update(self, landmarks, width, height):
+        if landmarks is None:
+            self.roi = None
+            return
+        xs = landmarks[:, 0] * width
+        ys = landmarks[:, 1] * height
+        bx0, bx1 = float(xs.min()), float(xs.max())
+        by0, by1 = float(ys.min()), float(ys.max())
+        
+        # El hâlâ ROI'nin iç bölgesindeyse ROI sabit kalsın (takip tutarlı olsun)
+        if self.roi is not None:
+            x0, y0, x1, y1 = self.roi
+            pad_x = (x1 - x0) * self.recenter
+            pad_y = (y1 - y0) * self.recenter
+            size = max(bx1 - bx0, by1 - by0) * (1 + 2 * self.margin)
+            if (bx0 > x0 + pad_x and bx1 < x1 - pad_x and
+                    by0 > y0 + pad_y and by1 < y1 - pad_y and
+                    size > 0.5 * (x1 - x0)):
+                return
+        
+        side = max(bx1 - bx0, by1 - by0) * (1 + 2 * self.margin)
+        side = int(min(max(side, self.min_size), width, height))
+        cx = (bx0 + bx1) / 2
+        cy = (by0 + by1) / 2
+        x0 = int(min(max(cx - side / 2, 0), width - side))
+        y0 = int(min(max(cy - side / 2, 0), height - side))
+        self.roi = (x0, y0, x0 + side, y0 + side)
+    
+    def stats(self):
+        return {
+            'roi_frames': self.roi_frames,
+            'roi_losses': self.roi_losses,
+            'full_frames': self.full_frames,
+            'loss_rate': self.roi_losses / self.roi_frames if self.roi_frames else 0.0,
+        }
 
 class HandMouseController:
-    def __init__(self, screen_width, screen_height):
-        self.mp_hands = mp.solutions.hands
-        self.hands = self.mp_hands.Hands(
-            max_num_hands=1,
-            min_detection_confidence=0.5,
-            min_tracking_confidence=0.5,
-            model_complexity=0
-        )
+    def __init__(self, screen_width, screen_height, landmark_cache=None, roi_mode=False,
+                 smoothing='oneeuro', predict=True, filter_params=None, cursor_rate=120,
+                 input_backend='pyautogui', motion_gate=None, hands=None):
+        # hands: process(rgb) sunan el modeli; verilmezse MediaPipe yüklenir (ölçümde sentetik)
+        if hands is None:
+            hands = mp.solutions.hands.Hands(
+                max_num_hands=1,
+                min_detection_confidence=0.5,
+                min_tracking_confidence=0.5,
+                model_complexity=0
+            )
+        self.hands = hands
         
         self.screen_width = screen_width
         self.screen_height = screen_height
-        pyautogui.FAILSAFE = False
-        pyautogui.MINIMUM_DURATION = 0
-        pyautogui.MINIMUM_SLEEP = 0
-        pyautogui.PAUSE = 0
-        
-        self.mouse_controller = SmoothMouseController()
+        self.screen_size = np.array((screen_width, screen_height), dtype=np.float32)
+        # İmleç, tıklama ve kaydırma ayrı iş parçacığında, ekran hızında uygulanır
+        self.actuator = CursorActuator(screen_width, screen_height, rate=cursor_rate,
+                                       backend=make_backend(input_backend))
+        
+        self.landmark_cache = landmark_cache
+        # ROI modu: tüm kare yerine önceki el çevresini işle
+        self.region = HandRegionTracker() if roi_mode else None
+        # Sahne durağansa model yerine son landmarklar kullanılır; el görünürken
+        # küçük görüntüde kaybolan çimdikler en fazla hand_refresh kare gecikir
+        self.motion_gate = motion_gate
+        self.hand_refresh = 2
+        self.last_landmarks = None
+        self.rgb_buffer = None
+        self.mouse_controller = SmoothMouseController(smoothing, predict, **(filter_params or {}))
         self.movement_scale = 3.5
         
-        self.click_cooldown = 0.03
-        self.last_click_time = 0
-        self.is_clicking = False
-        self.is_dragging = False
         self.scroll_threshold = 0.008
         self.scroll_speed = 300
         self.prev_scroll_y = None
         
-    def process_hand(self, frame):
-        results = self.hands.process(cv2.cvtColor(frame, cv2.COLOR_BGR2RGB))
+        # Tık ve kaydırma jestleri (bkz. gestures.py); yeni jestler burada bağlanır
+        actuator = self.actuator
+        self.gestures = GestureEngine()
+        self.gestures.on('left_click', enter=lambda f: actuator.press('left'),
+                         exit=lambda f: actuator.release('left'))
+        self.gestures.on('right_click', enter=lambda f: actuator.press('right'),
+                         exit=lambda f: actuator.release('right'))
+        self.gestures.on('scroll', enter=self.start_scroll, hold=self.scroll)
+    
+    def start(self):
+        self.actuator.start()
+    
+    def stop(self):
+        self.gestures.release_all()  # Basılı kalan düğmeleri bırak
+        self.actuator.stop()
         
-        if not results.multi_hand_landmarks:
+    def process_hand(self, frame, captured=None):
+        landmarks = self.detect(frame)
+        if landmarks is None:
+            self.hand_lost()
             return
+        self.act(landmarks, captured)
+    
+    def hand_lost(self):
+        # El kareden çıktı: basılı kalan tık ya da süren kaydırma el dönene kadar sürmesin
+        if self.gestures.active.any():
+            self.gestures.release_all()
+    
+    def detect(self, frame):
+        # Çıkarım aşaması: (21, 3) landmark dizisi, el bulunamazsa None
+        height, width = frame.shape[:2]
+        self.gestures.features.aspect = width / height  # Jest öznitelikleri için
+        gate = self.motion_gate
+        if gate is not None:
+            refresh = self.hand_refresh if self.last_landmarks is not None else None
+            if not gate.check(frame, refresh):
+                return self.last_landmarks
+        
+        cache = self.landmark_cache
+        if cache is not None:
+            key = cache.key(frame)
+            hit, landmarks = cache.get(key)
+            if hit:
+                self.last_landmarks = landmarks
+                return landmarks
+        
+        if self.region is not None:
+            landmarks = self.detect_region(frame)
+        else:
+            landmarks = self.run_hands(frame)
+        if cache is not None:
+            cache.put(key, landmarks)
+        self.last_landmarks = landmarks
+        return landmarks
+    
+    def detect_presence(self, frame):
+        # Boşta modu: küçültülmüş karede yalnızca el var mı (önbellek ve ROI atlanır)
+        if self.motion_gate is not None and not self.motion_gate.check(frame):
+            return None
+        landmarks = self.run_hands(frame)
+        self.last_landmarks = landmarks
+        return landmarks
+    
+    def run_hands(self, image):
+        # RGB tamponu yeniden kullanılır (boyut değişirse cv2 yenisini ayırır)
+        self.rgb_buffer = cv2.cvtColor(image, cv2.COLOR_BGR2RGB, dst=self.rgb_buffer)
+        results = self.hands.process(self.rgb_buffer)
+        if not results.multi_hand_landmarks:
+            return None
+        return to_array(results.multi_hand_landmarks[0].landmark)
+    
+    def detect_region(self, frame):
+        region = self.region
+        height, width = frame.shape[:2]
+        crop = region.crop(frame)
+        if crop is not None:
+            region.roi_frames += 1
+            landmarks = self.run_hands(crop)
+            if landmarks is not None:
+                landmarks = region.to_frame(landmarks, width, height)
+                region.update(landmarks, width, height)
+                return landmarks
+            # El ROI içinde kayboldu: aynı karede tüm kareye dön
+            region.roi_losses += 1
+        
+        region.full_frames += 1
+        landmarks = self.run_hands(frame)
+        region.update(landmarks, width, height)
+        return landmarks
+    
+    def act(self, landmarks, captured=None):
+        # Eylem aşaması: önce imleç hedefi, sonra jestler; bu karede başlayan tık
+        # bu karenin hedefine gider (press/release imleci son hedefe oturtur)
+        if not self.gestures.is_active('scroll'):  # Kaydırırken imleç yerinde kalır
+            raw = landmarks[INDEX_TIP, :2] * MIRROR_SCALE + MIRROR_OFFSET  # (1 - x, y)
+            mapped_x, mapped_y = (raw * raw * raw * self.screen_size * self.movement_scale).tolist()
             
-        landmarks = results.multi_hand_landmarks[0].landmark
-        
-        raw_x = (1 - landmarks[8].x)
-        raw_y = landmarks[8].y
-        
-        mapped_x = raw_x * (raw_x * raw_x) * self.screen_width * self.movement_scale
-        mapped_y = raw_y * (raw_y * raw_y) * self.screen_height * self.movement_scale
+            x, y = self.mouse_controller.update_target(mapped_x, mapped_y, captured)
+            self.actuator.set_target(x, y)
         
-        x, y = self.mouse_controller.update_target(mapped_x, mapped_y)
-        x = max(0, min(self.screen_width - 1, x))
-        y = max(0, min(self.screen_height - 1, y))
-        
-        try:
-            pyautogui.moveTo(x, y, _pause=False)
-        except:
-            pass
-        
-        thumb_tip = landmarks[4]
-        index_tip = landmarks[8]
-        middle_tip = landmarks[12]
-        
-        thumb_index_dist = math.hypot(thumb_tip.x - index_tip.x, thumb_tip.y - index_tip.y)
-        thumb_middle_dist = math.hypot(thumb_tip.x - middle_tip.x, thumb_tip.y - middle_tip.y)
-        
-        current_time = time.time()
-        
-        if thumb_index_dist < 0.03:
-            if not self.is_clicking and current_time - self.last_click_time > self.click_cooldown:
-                pyautogui.mouseDown(button='left', _pause=False)
-                self.is_clicking = True
-                self.last_click_time = current_time
-        elif self.is_clicking:
-            pyautogui.mouseUp(button='left', _pause=False)
-            self.is_clicking = False
-        
-        if thumb_middle_dist < 0.03:
-            if not self.is_dragging and current_time - self.last_click_time > self.click_cooldown:
-                pyautogui.mouseDown(button='right', _pause=False)
-                self.is_dragging = True
-                self.last_click_time = current_time
-        elif self.is_dragging:
-            pyautogui.mouseUp(button='right', _pause=False)
-            self.is_dragging = False
-        
-        if self.prev_scroll_y is None:
-            self.prev_scroll_y = index_tip.y
-        else:
-            scroll_diff = index_tip.y - self.prev_scroll_y
-            if abs(scroll_diff) > self.scroll_threshold:
-                scroll_amount = int(scroll_diff * self.scroll_speed)
-                try:
-                    pyautogui.scroll(-scroll_amount, _pause=False)
-                except:
-                    pass
-            self.prev_scroll_y = index_tip.y
+        self.gestures.process(landmarks)
+    
+    def start_scroll(self, features):
+        self.prev_scroll_y = float(features[FEATURE_INDEX['index_y']])
+    
+    def scroll(self, features):
+        index_y = float(features[FEATURE_INDEX['index_y']])
+        scroll_diff = index_y - self.prev_scroll_y
+        if abs(scroll_diff) > self.scroll_threshold:
+            scroll_amount = int(scroll_diff * self.scroll_speed)
+            self.actuator.scroll(-scroll_amount)
+        self.prev_scroll_y = index_y
 
 class App:
-    def __init__(self):
+    def __init__(self, frame_source=None, landmark_cache=None, roi_mode=False,
+                 smoothing='oneeuro', predict=True, filter_params=None, cursor_rate=120,
+                 input_backend='pyautogui', motion_gate=True, idle_after=10.0, idle_rate=4.0):
         self.root = tk.Tk()
         self.root.title("El Kontrollü Fare")
         
@@ -371,20 +495,64 @@ class App:
         
         self.root.configure(bg=self.colors['bg'])
         
-        # Kamera ve kontrol değişkenleri
+        # Kamera ve kontrol değişkenleri (arka planda hazırlanır)
         self.screen_width = screen_width
         self.screen_height = screen_height
-        self.cap = cv2.VideoCapture(0)
-        self.cap.set(cv2.CAP_PROP_FPS, 60)
-        self.cap.set(cv2.CAP_PROP_FRAME_WIDTH, 320)
-        self.cap.set(cv2.CAP_PROP_FRAME_HEIGHT, 240)
-        self.cap.set(cv2.CAP_PROP_BUFFERSIZE, 1)
-        
-        self.controller = HandMouseController(self.screen_width, self.screen_height)
+        if frame_source is None:
+            frame_source = lambda: open_camera(0, width=320, height=240, fps=60)
+        self.cap = None
+        self.controller = None
+        self.pipeline = None
+        
+        self.landmark_cache = landmark_cache
+        self.idle_after = idle_after  # 0: boşta moduna hiç geçme
+        self.idle_rate = idle_rate
         self.running = False
         self.mirror = tk.BooleanVar(value=True)
         
         self.setup_ui()
+        self.start_button.config(text="Yükleniyor...", state=tk.DISABLED)
+        self.status_label.config(text="Model yükleniyor")
+        self.root.after(0, lambda: report.mark('pencere açıldı'))
+        
+        # Kamera modelle aynı anda açılır; frame_source hazır bir kaynak da olabilir
+        self.warm = WarmStart()
+        self.warm.preload(cv2, mp, pyautogui)
+        if callable(frame_source):
+            self.warm.add('kamera açılışı', frame_source, parallel=True)
+        else:
+            self.cap = frame_source
+        self.warm.add('el modeli', HandMouseController, self.screen_width, self.screen_height,
+                      landmark_cache=landmark_cache, roi_mode=roi_mode,
+                      smoothing=smoothing, predict=predict, filter_params=filter_params,
+                      cursor_rate=cursor_rate, input_backend=input_backend,
+                      motion_gate=MotionGate() if motion_gate else None)
+        self.warm.start()
+        self.root.after(50, self.check_ready)
+    
+    def check_ready(self):
+        # Arka plan hazırlığı bitince düğmeyi etkinleştir (Tk iş parçacığında)
+        if not self.warm.ready.is_set():
+            self.root.after(50, self.check_ready)
+            return
+        try:
+            results = self.warm.wait()
+        except Exception as e:
+            self.status_label.config(text="Başlatma hatası", fg=self.colors['error'])
+            self.statusbar.config(text=str(e))
+            return
+        if self.cap is None:
+            self.cap = results['kamera açılışı']
+        self.controller = results['el modeli']
+        idle = IdleMonitor(self.idle_after, self.idle_rate) if self.idle_after else None
+        self.pipeline = HandPipeline(self.cap, self.controller, mirror=self.mirror_enabled,
+                                     idle=idle)
+        self.start_button.config(text="Başlat", state=tk.NORMAL)
+        self.status_label.config(text="Hazır")
+        report.print()
+        describe = getattr(self.cap, 'describe', None)
+        if describe is not None and describe():
+            print(describe())
     
     def check_tutorial_status(self):
         try:
@@ -503,31 +671,100 @@ class App:
             self.running = True
             self.start_button.config(text="Durdur", bg=self.colors['error'])
             self.status_label.config(text="Çalışıyor")
-            Thread(target=self.update, daemon=True).start()
+            self.controller.start()
+            self.pipeline.start()
+            self.update_stats()
         else:
             self.running = False
+            self.pipeline.stop()
+            self.controller.stop()
             self.start_button.config(text="Başlat", bg=self.colors['success'])
             self.status_label.config(text="Hazır")
+            self.statusbar.config(text="Hazır")
+    
+    def mirror_enabled(self):
+        return self.mirror.get()
     
-    def update(self):
-        while self.running:
-            ret, frame = self.cap.read()
-            if ret:
-                if self.mirror.get():
-                    frame = cv2.flip(frame, 1)
-                self.controller.process_hand(frame)
-            time.sleep(0.001)
+    def update_stats(self):
+        # Aşama sürelerini durum çubuğunda göster (Tk iş parçacığında)
+        if not self.running:
+            return
+        names = {'capture': 'Yakalama', 'inference': 'Çıkarım',
+                 'actuation': 'Eylem', 'latency': 'Gecikme'}
+        summary = self.pipeline.stats.summary()
+        parts = [f"{names[stage]} {summary[stage][0]:.1f} ms"
+                 for stage in HandPipeline.STAGES if stage in summary]
+        gesture_cost = self.controller.gestures.stats.summary().get('gestures')
+        if gesture_cost:
+            parts.append(f"Jest {gesture_cost[0]:.2f} ms")
+        if self.controller.motion_gate is not None:
+            gate = self.controller.motion_gate.stats()
+            parts.append(f"Durağan kare %{100 * gate['skip_rate']:.0f}")
+        if self.pipeline.idle is not None:
+            idle = self.pipeline.idle.stats()
+            state = "Boşta" if idle['state'] == IdleMonitor.IDLE else "Etkin"
+            wake = idle['wake_latency_ms']
+            parts.append(f"{state} (CPU %{idle['cpu_active_pct']:.0f}/%{idle['cpu_idle_pct']:.0f}"
+                         + (f", uyanma {wake:.0f} ms)" if wake is not None else ")"))
+        dropped = sum(self.pipeline.dropped_frames())
+        injection = self.controller.actuator.injector.stats()
+        parts += [f"Atlanan {dropped}",
+                  f"Girdi kuyruğu {injection['queue_depth']} "
+                  f"(birleştirilen hareket {injection['dropped_moves']})"]
+        self.statusbar.config(text=" | ".join(parts))
+        self.root.after(500, self.update_stats)
     
     def run(self):
         self.root.mainloop()
     
     def stop(self):
         self.running = False
-        self.cap.release()
+        if self.pipeline is not None:
+            self.pipeline.stop()
+            self.controller.stop()
+        # Hazırlık sürüyorsa kamerayı açık bırakmamak için kısa süre bekle
+        self.warm.ready.wait(2.0)
+        cap = self.cap or self.warm.results.get('kamera açılışı')
+        if cap is not None:
+            cap.release()
+        if self.landmark_cache is not None:
+            self.landmark_cache.save()
         self.root.destroy()
 
 if __name__ == "__main__":
-    app = App()
+    parser = argparse.ArgumentParser(description="El Kontrollü Fare")
+    add_source_arguments(parser)
+    parser.add_argument('--landmark-cache', help="El landmark önbelleği dosyası (.npy)")
+    parser.add_argument('--roi', action='store_true',
+                        help="Eli önceki karedeki bölgesinde ara (yüksek çözünürlük için)")
+    parser.add_argument('--resolution', default='320x240', help="Kamera çözünürlüğü (GxY)")
+    parser.add_argument('--filter', choices=FILTERS, default='oneeuro', help="İmleç filtresi")
+    parser.add_argument('--filter-param', action='append', metavar='AD=DEĞER',
+                        help="Filtre parametresi (ör. min_cutoff=0.5, beta=0.001)")
+    parser.add_argument('--no-predict', dest='predict', action='store_false',
+                        help="İmleci gecikme kadar ileri kestirme")
+    parser.add_argument('--cursor-rate', type=int, default=120,
+                        help="İmleç güncelleme hızı Hz (ekran yenileme hızı; 0: her karede)")
+    parser.add_argument('--input-backend', choices=INPUT_BACKENDS, default='pyautogui',
+                        help="Fare olaylarını gönderen arka uç (record: hiçbir şey göndermez)")
+    parser.add_argument('--no-motion-gate', dest='motion_gate', action='store_false',
+                        help="Durağan karelerde de el modelini çalıştır")
+    parser.add_argument('--idle-after', type=float, default=10.0,
+                        help="Bu kadar saniye el görünmezse boşta moduna geç (0: kapalı)")
+    parser.add_argument('--idle-rate', type=float, default=4.0,
+                        help="Boşta modunda saniyedeki el varlığı kontrolü")
+    args = parser.parse_args()
+    width, height = (int(v) for v in args.resolution.lower().split('x'))
+    
+    cache = None
+    if args.landmark_cache:
+        cache = LandmarkCache((HAND_LANDMARKS, 3), path=args.landmark_cache)
+    app = App(lambda: source_from_args(args, width=width, height=height, fps=60),
+              landmark_cache=cache, roi_mode=args.roi, smoothing=args.filter,
+              predict=args.predict, filter_params=parse_params(args.filter_param),
+              cursor_rate=args.cursor_rate, input_backend=args.input_backend,
+              motion_gate=args.motion_gate, idle_after=args.idle_after,
+              idle_rate=args.idle_rate)
     try:
         app.run()
     finally:
@@ -0,0 +1,293 @@
+import threading
+import time
+from collections import deque
+
+import numpy as np
+
+from capture import FrameRing
+from warmstart import lazy_import
+
+cv2 = lazy_import('cv2')  # İlk kare çevrilene kadar yüklenmez
+
+
+class LatestSlot:
+    """Tek elemanlı tampon: yeni değer bekleyen eskisinin üzerine yazılır"""
+    def __init__(self):
+        self._cond = threading.Condition()
+        self._item = None
+        self._has_item = False
+        self._closed = False
+        self.dropped = 0
+
+    def put(self, item):
+        # Tüketilmeden atılan eski değeri döner (yoksa None), ör. tamponu bırakmak için
+        with self._cond:
+            dropped = None
+            if self._has_item:
+                self.dropped += 1  # Tüketilmemiş eski değer atılıyor
+                dropped = self._item
+            self._item = item
+            self._has_item = True
+            self._cond.notify_all()
+            return dropped
+
+    def get(self, timeout=None):
+        # Değer yoksa bekle, zaman aşımında (False, None) döner
+        with self._cond:
+            if not self._has_item and not self._closed:
+                self._cond.wait(timeout)
+            if not self._has_item:
+                return False, None
+            item = self._item
+            self._item = None
+            self._has_item = False
+            return True, item
+
+    def close(self):
+        with self._cond:
+            self._closed = True
+            self._cond.notify_all()
+
+
+class StageStats:
+    """Aşama sürelerini kayan pencerede tutar"""
+    def __init__(self, window=120):
+        self.window = window
+        self._lock = threading.Lock()
+        self._samples = {}
+
+    def record(self, stage, seconds):
+        with self._lock:
+            samples = self._samples.get(stage)
+            if samples is None:
+                samples = self._samples[stage] = deque(maxlen=self.window)
+            samples.append(seconds)
+
+    def values(self, stage):
+        with self._lock:
+            return list(self._samples.get(stage, ()))
+
+    def reset(self):
+        with self._lock:
+            self._samples.clear()
+
+    def summary(self):
+        # Aşama -> (ortalama ms, en yüksek ms)
+        with self._lock:
+            return {stage: (1000 * sum(s) / len(s), 1000 * max(s))
+                    for stage, s in self._samples.items() if s}
+
+
+class IdleMonitor:
+    """Boşta modu durum makinesi: el uzun süre görünmezse seyrek ve küçük kontrol
+
+    ACTIVE: her kare tam çözünürlükte işlenir. idle_after saniye boyunca el
+    bulunamazsa IDLE'a geçilir; bu durumda saniyede idle_rate kare, idle_scale
+    oranında küçültülerek yalnızca el var mı diye bakılır. El görüldüğü anda
+    ACTIVE'e dönülür ve bulunan landmarklar hemen kullanılır.
+
+    Durum başına süreç CPU zamanı ve uyanma gecikmesi (eli bulan karenin
+    yakalanmasından ilk imleç hareketine) ölçülür.
+    """
+    ACTIVE = 'active'
+    IDLE = 'idle'
+
+    def __init__(self, idle_after=10.0, idle_rate=4.0, idle_scale=0.5):
+        self.idle_after = idle_after
+        self.idle_interval = 1.0 / idle_rate
+        self.idle_scale = idle_scale
+        self._lock = threading.Lock()
+        self.state = self.ACTIVE
+        self.last_seen = time.perf_counter()
+        self.last_check = None
+        self._small = None
+
+        self.wakeups = 0
+        self.wake_started = None
+        self.wake_latencies = deque(maxlen=20)
+        self.cpu = {self.ACTIVE: 0.0, self.IDLE: 0.0}
+        self.wall = {self.ACTIVE: 0.0, self.IDLE: 0.0}
+        self._cpu_mark = time.process_time()
+        self._wall_mark = time.perf_counter()
+
+    @property
+    def idle(self):
+        return self.state == self.IDLE
+
+    def due(self, now):
+        # Boşta iken kontrol zamanı geldi mi (aradaki kareler atılır)
+        if self.last_check is not None and now - self.last_check < self.idle_interval:
+            return False
+        self.last_check = now
+        return True
+
+    def shrink(self, frame):
+        height, width = frame.shape[:2]
+        size = (max(1, int(width * self.idle_scale)), max(1, int(height * self.idle_scale)))
+        self._small = cv2.resize(frame, size, dst=self._small, interpolation=cv2.INTER_AREA)
+        return self._small
+
+    def observe(self, found, captured):
+        now = time.perf_counter()
+        if found:
+            self.last_seen = now
+            if self.state == self.IDLE:
+                self._switch(self.ACTIVE)
+                self.wakeups += 1
+                self.wake_started = captured
+        elif self.state == self.ACTIVE and now - self.last_seen > self.idle_after:
+            self._switch(self.IDLE)
+            self.last_check = None
+
+    def actuated(self, done):
+        started = self.wake_started
+        if started is not None:
+            self.wake_started = None
+            self.wake_latencies.append(done - started)
+
+    def _switch(self, state):
+        with self._lock:
+            self._account()
+            self.state = state
+
+    def _account(self):
+        cpu, wall = time.process_time(), time.perf_counter()
+        self.cpu[self.state] += cpu - self._cpu_mark
+        self.wall[self.state] += wall - self._wall_mark
+        self._cpu_mark, self._wall_mark = cpu, wall
+
+    def stats(self):
+        with self._lock:
+            self._account()
+            cpu, wall = dict(self.cpu), dict(self.wall)
+        latencies = list(self.wake_latencies)
+        return {
+            'state': self.state,
+            'wakeups': self.wakeups,
+            # Çekirdek yüzdesi: 100 = bir çekirdek tamamen dolu
+            'cpu_active_pct': 100 * cpu[self.ACTIVE] / wall[self.ACTIVE] if wall[self.ACTIVE] else 0.0,
+            'cpu_idle_pct': 100 * cpu[self.IDLE] / wall[self.IDLE] if wall[self.IDLE] else 0.0,
+            'active_s': wall[self.ACTIVE],
+            'idle_s': wall[self.IDLE],
+            'wake_latency_ms': 1000 * latencies[-1] if latencies else None,
+            # El, boşta kontrolleri arasında görünürse buna kadar ek bekleme olabilir
+            'presence_interval_ms': 1000 * self.idle_interval,
+        }
+
+
+class HandPipeline:
+    """Kamera, çıkarım ve imleç aşamalarını ayrı iş parçacıklarında çalıştırır"""
+    STAGES = ('capture', 'inference', 'actuation', 'latency')
+
+    def __init__(self, cap, controller, mirror=None, poll_timeout=0.1, idle=None):
+        self.cap = cap
+        self.controller = controller
+        self.mirror = mirror
+        self.poll_timeout = poll_timeout
+        self.idle = idle  # IdleMonitor; boşta kontrolü için controller.detect_presence gerekir
+
+        # Aşamalar arası "en yeni kazanır" tamponları
+        self.frames = LatestSlot()
+        self.results = LatestSlot()
+        self.stats = StageStats()
+        self.flip_ring = FrameRing()  # Yazılan + bekleyen + işlenen kare; çıkarım bırakır
+
+        self.running = False
+        self.threads = []
+
+    def start(self):
+        if self.running:
+            return
+        self.running = True
+        self.threads = [
+            threading.Thread(target=self._grab_loop, daemon=True),
+            threading.Thread(target=self._inference_loop, daemon=True),
+            threading.Thread(target=self._actuation_loop, daemon=True),
+        ]
+        for thread in self.threads:
+            thread.start()
+
+    def stop(self, timeout=1.0):
+        self.running = False
+        self.frames.close()
+        self.results.close()
+        for thread in self.threads:
+            thread.join(timeout)
+        self.threads = []
+        ok, item = self.frames.get(0)
+        if ok:
+            self.flip_ring.release(item[1])
+        # Sonraki start() için tamponları yenile
+        self.frames = LatestSlot()
+        self.results = LatestSlot()
+
+    def _grab_loop(self):
+        frames = self.frames
+        while self.running:
+            start = time.perf_counter()
+            ret, frame = self.cap.read()
+            if not ret:
+                time.sleep(0.005)
+                continue
+            # Kaynağın karesi yalnızca sonraki okumaya kadar geçerli: çıkarım bitene
+            # kadar yaşaması için halka tampona (aynalı ya da düz) kopyalanır
+            buffer = self.flip_ring.acquire(frame.shape, frame.dtype)
+            if self.mirror is not None and self.mirror():
+                frame = cv2.flip(frame, 1, dst=buffer)
+            else:
+                np.copyto(buffer, frame)
+                frame = buffer
+            captured = time.perf_counter()
+            self.stats.record('capture', captured - start)
+            dropped = frames.put((captured, frame))
+            if dropped is not None:
+                self.flip_ring.release(dropped[1])
+
+    def _inference_loop(self):
+        frames, results = self.frames, self.results
+        found = False
+        while self.running:
+            ok, item = frames.get(self.poll_timeout)
+            if not ok:
+                continue
+            captured, frame = item
+            idle = self.idle
+            start = time.perf_counter()
+            try:
+                if idle is not None and idle.idle:
+                    if not idle.due(captured):
+                        continue
+                    landmarks = self.controller.detect_presence(idle.shrink(frame))
+                else:
+                    landmarks = self.controller.detect(frame)
+            finally:
+                self.flip_ring.release(frame)
+            self.stats.record('inference', time.perf_counter() - start)
+            if idle is not None:
+                idle.observe(landmarks is not None, captured)
+            if landmarks is not None or found:
+                # Elin kaybolduğu kare de iletilir (None): eylem aşaması basılı düğmeleri bırakır
+                results.put((captured, landmarks))
+            found = landmarks is not None
+
+    def _actuation_loop(self):
+        results = self.results
+        while self.running:
+            ok, item = results.get(self.poll_timeout)
+            if not ok:
+                continue
+            captured, landmarks = item
+            if landmarks is None:
+                self.controller.hand_lost()
+                continue
+            start = time.perf_counter()
+            self.controller.act(landmarks, captured)
+            done = time.perf_counter()
+            self.stats.record('actuation', done - start)
+            self.stats.record('latency', done - captured)
+            if self.idle is not None:
+                self.idle.actuated(done)
+
+    def dropped_frames(self):
+        return self.frames.dropped, self.results.dropped
+
@@ -1,76 +1,481 @@
-import cv2
-import torch
+import time
 import threading
 import numpy as np
-import pytesseract
-from ultralytics import YOLO
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor
+from pipeline import LatestSlot
+from warmstart import lazy_import, report, WarmStart
+from motiongate import MotionGate
+from capture import FrameRing
+from framesource import open_camera, VideoFileSource
 
-# 📌 OpenCV Optimizasyonu Aç
-cv2.setUseOptimized(True)
-cv2.setNumThreads(12)  # Ryzen 5 4600H için 12 mantıksal işlem birimini kullan
-
-# 📌 YOLOv8 Modelini CPU'da Optimize Et
-model = YOLO("yolov8n.pt").to("cpu")  # En küçük model (Nano) kullan
-model.fuse()  # Model optimizasyonu
+# Ağır modüller ilk kullanımda yüklenir; OCR süreçleri içe aktarırken de OpenCV'yi beklemez
+cv2 = lazy_import('cv2')
 
 # 📌 OCR için Tesseract Kurulumu (Eğer henüz kurulmadıysa yükle)
-pytesseract.pytesseract.tesseract_cmd = r"C:\Program Files\Tesseract-OCR\tesseract.exe"
-
-# 📌 Kamera Aç ve Çözünürlüğü Küçük Tut (Hız İçin)
-cap = cv2.VideoCapture(0)
-cap.set(3, 320)  # Genişlik (FPS'yi artırmak için düşük tut)
-cap.set(4, 240)  # Yükseklik
-
-# 📌 Frame İşleme Fonksiyonu (Çoklu İş Parçacığı İçin)
-def process_frame():
-    while True:
-        ret, frame = cap.read()
-        if not ret:
-            break
-
-        # 🔹 Görüntü Boyutunu Küçült (Daha Hızlı İşleme İçin)
-        frame = cv2.resize(frame, (320, 240))
-
-        # 🔹 YOLO ile Nesne Algılama (FP16 KAPALI, CPU İÇİN GEREKSİZ)
-        results = model(frame)  
-
-        # 🔹 Algılanan Nesneleri Çiz
-        for result in results:
-            for box in result.boxes:
-                x1, y1, x2, y2 = map(int, box.xyxy[0])  # Nesne Koordinatları
-                label = result.names[int(box.cls)]  # Nesne Adı
-                conf = box.conf.item()  # Güven Skoru
-
-                # 🔹 Nesne Çizimi
-                cv2.rectangle(frame, (x1, y1), (x2, y2), (0, 255, 0), 2)
-                cv2.putText(frame, f"{label} {conf:.2f}", (x1, y1 - 10),
-                            cv2.FONT_HERSHEY_SIMPLEX, 0.5, (0, 255, 0), 2)
-
-                # 🔹 OCR için Sadece Metin Olabilecek Nesnelerde İşleme Yap
-                if "text" in label.lower():  # Metin içeren nesneler için OCR
-                    roi = frame[y1:y2, x1:x2]  
-                    gray = cv2.cvtColor(roi, cv2.COLOR_BGR2GRAY)  # Siyah-Beyaz Dönüştürme
-                    
-                    # OCR ile Metin Okuma
-                    text = pytesseract.image_to_string(gray, lang="eng+tur").strip()
-                    if text:
-                        cv2.putText(frame, text, (x1, y2 + 20),
-                                    cv2.FONT_HERSHEY_SIMPLEX, 0.6, (0, 0, 255), 2)
-
-        # 🔹 Görüntüyü Göster
-        cv2.imshow("Nesne ve Metin Algılama (CPU Optimize)", frame)
-
-        # Çıkış için 'q' tuşuna bas
-        if cv2.waitKey(1) & 0xFF == ord('q'):
-            break
-
-# 📌 Thread Başlat (Daha Hızlı İşleme İçin)
-thread = threading.Thread(target=process_frame)
-thread.start()
-
-# 📌 Thread'in Bitmesini Bekle
-thread.join()
-
-# 📌 Kaynakları Serbest Bırak
-cap.release()
-cv2.destroyAllWindows()
+# pytesseract yalnızca OCR süreçlerinde içe aktarılır
+TESSERACT_CMD = r"C:\Program Files\Tesseract-OCR\tesseract.exe"
+
+OCR_WORKERS = 2  # OCR süreç havuzu boyutu
+
+
+# 📌 OCR İşçisi (Ayrı Süreçte Çalışır)
+def init_ocr_worker(tesseract_cmd):
+    import pytesseract
+    pytesseract.pytesseract.tesseract_cmd = tesseract_cmd
+
+
+def read_text(gray):
+    import pytesseract
+    return pytesseract.image_to_string(gray, lang="eng+tur").strip()
+
+
+def iou(a, b):
+    # İki kutunun kesişim / birleşim oranı
+    x1, y1 = max(a[0], b[0]), max(a[1], b[1])
+    x2, y2 = min(a[2], b[2]), min(a[3], b[3])
+    inter = max(0, x2 - x1) * max(0, y2 - y1)
+    area_a = (a[2] - a[0]) * (a[3] - a[1])
+    area_b = (b[2] - b[0]) * (b[3] - b[1])
+    union = area_a + area_b - inter
+    return inter / union if union > 0 else 0.0
+
+
+def dhash(gray, size=8):
+    # Fark hash'i: küçültülmüş görüntüde yan yana piksel karşılaştırması (64 bit)
+    small = cv2.resize(gray, (size + 1, size), interpolation=cv2.INTER_AREA)
+    bits = small[:, 1:] > small[:, :-1]
+    return int.from_bytes(np.packbits(bits).tobytes(), "big")
+
+
+def hamming(a, b):
+    return bin(a ^ b).count("1")
+
+
+class OCRCache:
+    """İz ve içerik hash'ine göre OCR sonuçlarını saklar
+
+    Aynı izdeki kutunun içeriği değişmediyse (hash farkı eşik altında) eski
+    metin kullanılır; yeni bir iz daha önce okunmuş bir içeriğe benziyorsa
+    onun metni alınır. Kayıtlar ttl saniye sonra geçersiz olur, en eski
+    kullanılanlar max_entries aşılınca silinir.
+    """
+    def __init__(self, ttl=30.0, max_entries=256, max_distance=6):
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self.max_distance = max_distance
+        self.by_track = OrderedDict()    # iz no -> (hash, metin, zaman)
+        self.by_content = OrderedDict()  # hash -> (metin, zaman)
+        self.lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def lookup(self, track_id, phash):
+        # Bulunursa metin (boş olabilir), yoksa None
+        now = time.monotonic()
+        with self.lock:
+            entry = self.by_track.get(track_id)
+            if entry is not None:
+                cached_hash, text, stamp = entry
+                if now - stamp <= self.ttl and hamming(cached_hash, phash) <= self.max_distance:
+                    self.by_track.move_to_end(track_id)
+                    self.hits += 1
+                    return text
+            for cached_hash, (text, stamp) in reversed(self.by_content.items()):
+                if now - stamp <= self.ttl and hamming(cached_hash, phash) <= self.max_distance:
+                    self.by_content.move_to_end(cached_hash)
+                    self._put(self.by_track, track_id, (phash, text, stamp))
+                    self.hits += 1
+                    return text
+            self.misses += 1
+            return None
+
+    def store(self, track_id, phash, text):
+        now = time.monotonic()
+        with self.lock:
+            self._put(self.by_track, track_id, (phash, text, now))
+            self._put(self.by_content, phash, (text, now))
+
+    def _put(self, table, key, value):
+        table[key] = value
+        table.move_to_end(key)
+        while len(table) > self.max_entries:
+            table.popitem(last=False)
+
+
+class Track:
+    """Kareler arasında eşleştirilen bir nesne kutusu"""
+    def __init__(self, track_id, box, label, conf):
+        self.id = track_id
+        self.box = box
+        self.label = label
+        self.conf = conf
+        self.text = ""
+        self.ocr_pending = False
+        self.missed = 0
+
+
+class BoxTracker:
+    """Kutuları IoU ile önceki karedeki izlere bağlar"""
+    def __init__(self, iou_threshold=0.3, max_missed=5):
+        self.iou_threshold = iou_threshold
+        self.max_missed = max_missed
+        self.tracks = {}
+        self.next_id = 0
+        self.lock = threading.Lock()
+
+    def update(self, detections):
+        # detections: [(kutu, etiket, güven)] -> bu karede görülen izler
+        with self.lock:
+            unmatched = set(self.tracks)
+            seen = []
+            # Açgözlü eşleştirme: en yüksek IoU önce
+            pairs = sorted(((iou(t.box, box), tid, i)
+                            for tid, t in self.tracks.items()
+                            for i, (box, label, _) in enumerate(detections)
+                            if t.label == label), reverse=True)
+            used = set()
+            for score, tid, i in pairs:
+                if score < self.iou_threshold:
+                    break
+                if tid not in unmatched or i in used:
+                    continue
+                box, label, conf = detections[i]
+                track = self.tracks[tid]
+                track.box, track.conf, track.missed = box, conf, 0
+                unmatched.discard(tid)
+                used.add(i)
+                seen.append(track)
+
+            for i, (box, label, conf) in enumerate(detections):
+                if i not in used:
+                    track = Track(self.next_id, box, label, conf)
+                    self.tracks[self.next_id] = track
+                    self.next_id += 1
+                    seen.append(track)
+
+            for tid in unmatched:
+                track = self.tracks[tid]
+                track.missed += 1
+                if track.missed > self.max_missed:
+                    del self.tracks[tid]
+            return seen
+
+    def set_text(self, track_id, text):
+        with self.lock:
+            track = self.tracks.get(track_id)
+            if track is not None:
+                track.text = text
+                track.ocr_pending = False
+
+
+class Stream:
+    """Tek bir kamera/video kaynağı ve ona ait izler"""
+    def __init__(self, index, cap, name, motion_gate=True):
+        self.index = index
+        self.cap = cap
+        self.name = name
+        self.gate = MotionGate() if motion_gate else None  # Durağan karede YOLO atlanır
+        self.tracker = BoxTracker()
+        self.detect_frames = LatestSlot()   # YOLO her zaman en yeni kareyi alır
+        self.display_frames = LatestSlot()  # Gösterim kaynağın hızında
+        self.ring = FrameRing(size=5)       # Küçültülmüş kareler; algılama ve gösterim ayrı ayrı bırakır
+        self.tracks = []                    # Son algılamanın izleri (gösterim için)
+        self.active = True
+
+
+class DetectionPipeline:
+    """Kaynaklar, YOLO ve OCR aşamalarını birbirini beklemeden çalıştırır
+
+    Birden fazla kaynak varsa her kaynağın en yeni karesi toplanıp tek bir
+    toplu detector.detect([...]) çağrısıyla işlenir, sonuçlar kaynaklara dağıtılır.
+    """
+    def __init__(self, caps, detector, ocr_pool, max_pending_ocr=OCR_WORKERS * 2, names=None,
+                 motion_gate=True):
+        names = names or [str(i) for i in range(len(caps))]
+        self.streams = [Stream(i, cap, name, motion_gate)
+                        for i, (cap, name) in enumerate(zip(caps, names))]
+        self.detector = detector
+        self.ocr_pool = ocr_pool
+        self.max_pending_ocr = max_pending_ocr
+        self.pending_ocr = 0
+        self.ocr_lock = threading.Lock()
+        self.ocr_cache = OCRCache()
+        self.ocr_calls = 0
+
+        self.new_frame = threading.Event()
+        self.running = False
+        self.threads = []
+
+        self.detections = 0  # İşlenen toplam kare (tüm kaynaklar)
+        self.start_time = None
+
+    def start(self):
+        self.running = True
+        self.start_time = time.perf_counter()
+        self.threads = [threading.Thread(target=self.capture_loop, args=(stream,), daemon=True)
+                        for stream in self.streams]
+        self.threads.append(threading.Thread(target=self.detect_loop, daemon=True))
+        for thread in self.threads:
+            thread.start()
+
+    def stop(self):
+        self.running = False
+        self.new_frame.set()
+        for stream in self.streams:
+            stream.detect_frames.close()
+            stream.display_frames.close()
+        for thread in self.threads:
+            thread.join(1.0)
+
+    def capture_loop(self, stream):
+        while self.running:
+            ret, frame = stream.cap.read()
+            if not ret:
+                stream.active = False
+                if not any(s.active for s in self.streams):
+                    self.running = False
+                break
+            # 🔹 Görüntü Boyutunu Küçült (Daha Hızlı İşleme İçin)
+            frame = cv2.resize(frame, (320, 240), dst=stream.ring.acquire((240, 320, 3), owners=2))
+            for slot in (stream.detect_frames, stream.display_frames):
+                dropped = slot.put(frame)
+                if dropped is not None:
+                    stream.ring.release(dropped)
+            self.new_frame.set()
+
+    def detect_loop(self):
+        while self.running:
+            if not self.new_frame.wait(0.1):
+                continue
+            self.new_frame.clear()
+
+            # Her kaynağın bekleyen en yeni karesini topla
+            batch = []
+            for stream in self.streams:
+                ok, frame = stream.detect_frames.get(0)
+                if not ok:
+                    continue
+                # Sahne değişmediyse önceki tespitler (izler) geçerli kalır
+                if stream.gate is None or stream.gate.check(frame):
+                    batch.append((stream, frame))
+                else:
+                    stream.ring.release(frame)
+            if not batch:
+                continue
+
+            try:
+                # 🔹 YOLO ile Nesne Algılama (FP16 KAPALI, CPU İÇİN GEREKSİZ)
+                results = self.detector.detect([frame for _, frame in batch])
+
+                for (stream, frame), detections in zip(batch, results):
+                    tracks = stream.tracker.update(detections)
+                    for track in tracks:
+                        # 🔹 OCR için Sadece Metin Olabilecek Nesnelerde İşleme Yap
+                        if "text" in track.label.lower():
+                            self.submit_ocr(stream, frame, track)  # Kırpıntı gri kopya olarak gider
+                    stream.tracks = tracks
+            finally:
+                for stream, frame in batch:
+                    stream.ring.release(frame)
+            self.detections += len(batch)
+
+    def submit_ocr(self, stream, frame, track):
+        # İş bekliyorsa tekrar gönderme; havuz doluysa sonraki kareye bırak
+        if track.ocr_pending:
+            return
+        x1, y1, x2, y2 = track.box
+        roi = frame[max(y1, 0):y2, max(x1, 0):x2]
+        if roi.size == 0:
+            return
+        gray = cv2.cvtColor(roi, cv2.COLOR_BGR2GRAY)  # Siyah-Beyaz Dönüştürme
+
+        # İçerik değişmediyse Tesseract'ı tekrar çalıştırma
+        key = (stream.index, track.id)
+        phash = dhash(gray)
+        text = self.ocr_cache.lookup(key, phash)
+        if text is not None:
+            track.text = text
+            return
+
+        with self.ocr_lock:
+            if self.pending_ocr >= self.max_pending_ocr:
+                return
+            self.pending_ocr += 1
+            self.ocr_calls += 1
+        track.ocr_pending = True
+        future = self.ocr_pool.submit(read_text, gray)
+        future.add_done_callback(
+            lambda f, stream=stream, key=key, phash=phash: self.on_ocr_done(stream, key, phash, f))
+
+    def on_ocr_done(self, stream, key, phash, future):
+        with self.ocr_lock:
+            self.pending_ocr -= 1
+        try:
+            text = future.result()
+        except Exception as e:
+            print(f"OCR hatası: {e}")
+            stream.tracker.set_text(key[1], "")
+            return
+        self.ocr_cache.store(key, phash, text)
+        stream.tracker.set_text(key[1], text)
+
+    def detection_fps(self):
+        elapsed = time.perf_counter() - self.start_time
+        return self.detections / elapsed if elapsed > 0 else 0.0
+
+
+# 📌 Algılanan Nesneleri Çiz
+def draw_tracks(frame, tracks):
+    for track in tracks:
+        x1, y1, x2, y2 = track.box
+        cv2.rectangle(frame, (x1, y1), (x2, y2), (0, 255, 0), 2)
+        cv2.putText(frame, f"{track.label} {track.conf:.2f}", (x1, y1 - 10),
+                    cv2.FONT_HERSHEY_SIMPLEX, 0.5, (0, 255, 0), 2)
+        if track.text:
+            cv2.putText(frame, track.text, (x1, y2 + 20),
+                        cv2.FONT_HERSHEY_SIMPLEX, 0.6, (0, 0, 255), 2)
+    return frame
+
+
+# 📌 Kaynak Açma ("0" gibi sayılar kamera, "bus:ad" paylaşılan kare yolu, diğerleri video dosyası)
+def open_source(source, speed='realtime'):
+    if source.startswith('bus:'):
+        # framebus.py yayını: kamera başka süreçlerle paylaşılır
+        from framebus import SharedFrameSource
+        cap = SharedFrameSource(source[4:])
+        print(f"{source}: {cap.describe()}")
+        return cap
+    if source.isdigit():
+        # Kamera: biçim/boyut anlaşması, düşük çözünürlük FPS'yi artırır
+        cap = open_camera(int(source), width=320, height=240)
+        print(f"{source}: {cap.describe()}")
+        return cap
+    # Video dosyası kendi FPS'inde okunur (kamera gibi); 'max' ile disk hızında
+    cap = VideoFileSource(source, speed)
+    print(f"{source}: {cap.describe()}")
+    return cap
+
+
+# 📌 Toplu ve Sıralı Algılama Karşılaştırması
+def benchmark_batching(detector, caps, frames_per_source=50):
+    frames = []
+    for cap in caps:
+        stream_frames = []
+        while len(stream_frames) < frames_per_source:
+            ret, frame = cap.read()
+            if not ret:
+                break
+            stream_frames.append(cv2.resize(frame, (320, 240)))
+        frames.append(stream_frames)
+    count = min(len(f) for f in frames)
+    if count == 0:
+        print("Kaynaklardan kare okunamadı")
+        return
+    total = count * len(frames)
+
+    detector.detect([f[0] for f in frames])  # Isınma
+
+    start = time.perf_counter()
+    for i in range(count):
+        for stream_frames in frames:
+            detector.detect([stream_frames[i]])
+    sequential = total / (time.perf_counter() - start)
+
+    start = time.perf_counter()
+    for i in range(count):
+        detector.detect([stream_frames[i] for stream_frames in frames])
+    batched = total / (time.perf_counter() - start)
+
+    print(f"{len(frames)} kaynak, kaynak başına {count} kare")
+    print(f"Sıralı : {sequential:.1f} FPS (toplam)")
+    print(f"Toplu  : {batched:.1f} FPS (toplam)")
+    print(f"Kazanç : x{batched / sequential:.2f}")
+
+
+def main():
+    import argparse
+    from yolo_backend import BACKENDS, load_detector
+
+    parser = argparse.ArgumentParser(description="Nesne ve Metin Algılama")
+    parser.add_argument('--sources', nargs='+', default=['0'],
+                        help="Kamera numaraları, video dosyaları ya da bus:ad (framebus.py yayını)")
+    parser.add_argument('--benchmark', action='store_true',
+                        help="Toplu ve sıralı algılamayı karşılaştır ve çık")
+    parser.add_argument('--benchmark-frames', type=int, default=50)
+    parser.add_argument('--speed', default='realtime',
+                        help="Video dosyası hızı: realtime, max ya da çarpan (ör. 4)")
+    parser.add_argument('--backend', choices=BACKENDS, default='torch',
+                        help="Çıkarım arka ucu (dışa aktarılan model model_cache/ altında saklanır)")
+    parser.add_argument('--threads', type=int, help="Varsayılan: fiziksel çekirdek sayısı")
+    parser.add_argument('--imgsz', type=int, default=640, help="Model girdi boyutu")
+    parser.add_argument('--no-motion-gate', dest='motion_gate', action='store_false',
+                        help="Durağan karelerde de YOLO'yu çalıştır")
+    args = parser.parse_args()
+
+    # 📌 OpenCV Optimizasyonu Aç (iş parçacığı sayısını arka uç seçer)
+    cv2.setUseOptimized(True)
+
+    # 📌 YOLOv8 Modelini Yükle (Nano), Kaynaklar Bu Sırada Paralel Açılır
+    warm = WarmStart()
+    # Karşılaştırma kareleri önceden belleğe alır; orada beklemeye gerek yok
+    speed = 'max' if args.benchmark else args.speed
+    warm.add('kaynak açılışı', lambda: [open_source(source, speed) for source in args.sources],
+             parallel=True)
+    warm.add('YOLO modeli', load_detector, args.backend, "yolov8n.pt", args.threads, args.imgsz)
+    results = warm.start().wait()
+    caps = results['kaynak açılışı']
+    detector, timings = results['YOLO modeli']
+    report.record(f"model aktarımı ({args.backend})", timings['export'])
+    report.record(f"model açılışı ({args.backend})", timings['load'])
+    report.print()
+
+    if args.benchmark:
+        benchmark_batching(detector, caps, args.benchmark_frames)
+        for cap in caps:
+            cap.release()
+        return
+
+    # 📌 OCR Süreç Havuzu (Algılama ve Gösterimi Bloklamaz)
+    ocr_pool = ProcessPoolExecutor(max_workers=OCR_WORKERS, initializer=init_ocr_worker,
+                                   initargs=(TESSERACT_CMD,))
+    pipeline = DetectionPipeline(caps, detector, ocr_pool, names=args.sources,
+                                 motion_gate=args.motion_gate)
+    pipeline.start()
+
+    try:
+        while pipeline.running:
+            shown = False
+            for stream in pipeline.streams:
+                ok, frame = stream.display_frames.get(0)
+                if not ok:
+                    continue
+                shown = True
+
+                # 🔹 Görüntüyü Göster (Son Algılamanın Kutularıyla)
+                shown_frame = frame.copy()
+                stream.ring.release(frame)
+                frame = draw_tracks(shown_frame, stream.tracks)
+                cv2.putText(frame, f"YOLO {pipeline.detection_fps():.1f} FPS", (10, 20),
+                            cv2.FONT_HERSHEY_SIMPLEX, 0.5, (255, 255, 0), 1)
+                cv2.putText(frame, f"OCR {pipeline.ocr_calls} / onbellek {pipeline.ocr_cache.hits}",
+                            (10, 40), cv2.FONT_HERSHEY_SIMPLEX, 0.5, (255, 255, 0), 1)
+                if stream.gate is not None:
+                    cv2.putText(frame, f"Duragan kare %{100 * stream.gate.stats()['skip_rate']:.0f}",
+                                (10, 60), cv2.FONT_HERSHEY_SIMPLEX, 0.5, (255, 255, 0), 1)
+                cv2.imshow(f"Nesne ve Metin Algılama (CPU Optimize) - {stream.name}", frame)
+
+            # Çıkış için 'q' tuşuna bas
+            if cv2.waitKey(1 if shown else 5) & 0xFF == ord('q'):
+                break
+    finally:
+        # 📌 Kaynakları Serbest Bırak
+        pipeline.stop()
+        ocr_pool.shutdown(wait=False, cancel_futures=True)
+        for cap in caps:
+            cap.release()
+        cv2.destroyAllWindows()
+
+
+if __name__ == "__main__":
+    main()
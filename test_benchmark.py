@@ -0,0 +1,18 @@
+import json
+import sys
+
+import benchmark
+
+
+def test_idle_mode_reports_wake_latency(tmp_path, monkeypatch):
+    # main() pyautogui yerine kaydediciyi kurar; test bitince eski hâline dönsün
+    monkeypatch.setitem(sys.modules, 'pyautogui', None)
+    path = tmp_path / 'idle.json'
+    status = benchmark.main(['--idle', '--idle-after', '0.2', '--idle-phase', '0.3',
+                             '--warmup', '6', '--width', '160', '--height', '120',
+                             '--json', str(path)])
+    assert status == 0
+    report = json.loads(path.read_text(encoding='utf-8'))
+    assert report['wake_latency_ms'] is not None
+    assert 0 <= report['wake_latency_ms'] < 2000
+    assert report['idle']['model_calls_per_s'] < report['active']['model_calls_per_s']
@@ -0,0 +1,119 @@
+import numpy as np
+import pytest
+
+from landmarks import FACE_LANDMARKS, IRIS_EYES, iris_ratios
+from yuztakip import EyeTracker, fit_calibration, gaze_features, solve_gaze
+
+
+def synthetic_face(gaze_x, gaze_y, eye_width=30.0):
+    # İris köşelerin ortasından göz genişliği oranında kaydırılmış yüz noktaları
+    face = np.zeros((FACE_LANDMARKS, 2), dtype=np.float32)
+    for (iris, first, second), center_x in zip(IRIS_EYES, (250.0, 350.0)):
+        face[first] = (center_x - eye_width / 2, 200.0)
+        face[second] = (center_x + eye_width / 2, 200.0)
+        face[iris] = (center_x + gaze_x * eye_width, 200.0 + gaze_y * eye_width)
+    return face
+
+
+def test_iris_ratios_follow_iris():
+    ratios = iris_ratios(synthetic_face(0.1, -0.05))
+    np.testing.assert_allclose(ratios, [[0.1, -0.05], [0.1, -0.05]], atol=1e-5)
+
+
+def test_iris_ratios_ignore_head_scale():
+    near = iris_ratios(synthetic_face(0.08, 0.03, eye_width=60.0))
+    far = iris_ratios(synthetic_face(0.08, 0.03, eye_width=20.0))
+    np.testing.assert_allclose(near, far, atol=1e-5)
+
+
+@pytest.mark.parametrize('degree', [1, 2])
+def test_fit_recovers_known_mapping(degree):
+    rng = np.random.default_rng(0)
+    count = (degree + 1) * (degree + 2) // 2
+    true_coeffs = rng.normal(size=(count, 2))
+    samples = rng.uniform(-0.2, 0.2, size=(200, 2, 2)).astype(np.float32)
+    targets = gaze_features(samples, degree) @ true_coeffs
+
+    coeffs = fit_calibration(samples, targets, degree, ridge=1e-10)
+    np.testing.assert_allclose(coeffs, true_coeffs, atol=1e-4)
+
+    inside = rng.uniform(-0.2, 0.2, size=(20, 2, 2))
+    expected = np.clip(gaze_features(inside, degree) @ true_coeffs, 0, 1)
+    np.testing.assert_allclose(solve_gaze(inside, coeffs), expected, atol=1e-4)
+
+
+def test_fit_rejects_constant_features():
+    samples = np.full((50, 2, 2), 0.5, dtype=np.float32)
+    targets = np.random.default_rng(1).uniform(size=(50, 2))
+    with pytest.raises(ValueError):
+        fit_calibration(samples, targets, 1)
+
+
+def test_fit_rejects_rank_deficient_features():
+    # Yalnızca yatay hareket: y terimleri belirlenemez
+    x = np.linspace(-0.2, 0.2, 50)
+    samples = np.zeros((50, 2, 2))
+    samples[..., 0] = x[:, None]
+    targets = np.stack((x, np.zeros_like(x)), axis=-1)
+    with pytest.raises(ValueError):
+        fit_calibration(samples, targets, 1)
+
+
+def calibrated_tracker(gazes):
+    tracker = EyeTracker(640, 360)
+    for index, (gaze_x, gaze_y) in enumerate(gazes):
+        face = synthetic_face(gaze_x, gaze_y)
+        tracker.calibration_data[index] = np.stack([tracker.face_eye_ratios(face)] * 20)
+    tracker.current_point = len(tracker.calibration_points)
+    tracker.process_calibration()
+    return tracker
+
+
+def test_process_calibration_maps_calibration_points():
+    # Nokta konumuna doğrusal bağlı iris hareketi
+    points = np.array([(50, 50), (590, 50), (320, 180), (50, 310), (590, 310)], dtype=np.float64)
+    gazes = (points / [640, 360] - 0.5) * [0.3, 0.2]
+    tracker = calibrated_tracker(gazes)
+
+    assert tracker.is_calibrated
+    assert tracker.degree == 1  # 5 noktaya 6 terimli ikinci derece oturmaz
+    frame = np.zeros((360, 640, 3), dtype=np.uint8)
+    for point, (gaze_x, gaze_y) in zip(points, gazes):
+        gaze = tracker.get_gaze_point(frame, synthetic_face(gaze_x, gaze_y))
+        np.testing.assert_allclose(gaze, point, atol=2)
+
+
+def test_process_calibration_rejects_constant_gaze(tmp_path):
+    path = tmp_path / 'profile.npz'
+    tracker = EyeTracker(640, 360, str(path))
+    face = synthetic_face(0.0, 0.0)
+    for index in range(len(tracker.calibration_points)):
+        tracker.calibration_data[index] = np.stack([tracker.face_eye_ratios(face)] * 20)
+    tracker.current_point = len(tracker.calibration_points)
+    tracker.process_calibration()
+
+    assert not tracker.is_calibrated
+    assert tracker.current_point == 0
+    assert not path.exists()
+
+
+def test_process_calibration_needs_three_points():
+    tracker = calibrated_tracker([(-0.1, -0.1), (0.1, 0.1)])
+    assert not tracker.is_calibrated
+
+
+def test_profile_round_trip(tmp_path):
+    path = str(tmp_path / 'profile.npz')
+    gazes = [(-0.1, -0.08), (0.1, -0.08), (0.0, 0.0), (-0.1, 0.08), (0.1, 0.08)]
+    tracker = calibrated_tracker(gazes)
+    tracker.save_profile(path)
+
+    loaded = EyeTracker(640, 360, path)
+    assert loaded.is_calibrated
+    np.testing.assert_allclose(loaded.coeffs, tracker.coeffs)
+
+
+def test_old_profile_is_ignored(tmp_path):
+    path = str(tmp_path / 'profile.npz')
+    np.savez(path, coeffs=np.zeros((6, 2)), degree=2)
+    assert not EyeTracker(640, 360, path).is_calibrated
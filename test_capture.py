@@ -0,0 +1,70 @@
+import numpy as np
+
+from capture import Capture, FrameRing
+from pipeline import LatestSlot
+
+
+def test_held_buffer_is_not_reused():
+    ring = FrameRing(size=2)
+    first = ring.acquire((4, 4, 3))
+    second = ring.acquire((4, 4, 3))
+    assert second is not first
+    ring.release(first)
+    assert ring.acquire((4, 4, 3)) is first
+    assert ring.allocations == 2
+
+
+def test_buffer_returns_after_last_owner():
+    ring = FrameRing()
+    frame = ring.acquire((4, 4, 3), owners=2)
+    ring.release(frame)
+    assert ring.acquire((4, 4, 3)) is not frame  # Bir sahip hâlâ tutuyor
+    ring.release(frame)
+    assert ring.acquire((4, 4, 3)) is frame
+
+
+def test_view_keeps_nothing_and_foreign_arrays_are_ignored():
+    ring = FrameRing()
+    frame = ring.acquire((4, 4, 3))
+    view = frame[1:3]
+    ring.release(view)  # Yalnızca alınan dizinin kendisi bırakır
+    ring.release(np.zeros((4, 4, 3), np.uint8))
+    assert ring.in_use() == 1
+
+
+def test_free_list_is_bounded():
+    ring = FrameRing(size=2)
+    frames = [ring.acquire((4, 4, 3)) for _ in range(4)]
+    for frame in frames:
+        ring.release(frame)
+    assert len(ring.free) == 2
+    assert ring.in_use() == 0
+
+
+def test_latest_slot_returns_dropped_item():
+    slot = LatestSlot()
+    assert slot.put('a') is None
+    assert slot.put('b') == 'a'
+    assert slot.get(0) == (True, 'b')
+    assert slot.put('c') is None
+
+
+class FakeCamera:
+    def __init__(self):
+        self.count = 0
+
+    def read(self, dst=None):
+        self.count += 1
+        frame = np.empty((4, 4, 3), np.uint8) if dst is None else dst
+        frame[...] = self.count
+        return True, frame
+
+
+def test_capture_reuses_buffer_after_next_read():
+    capture = Capture(FakeCamera())
+    _, first = capture.read()
+    _, second = capture.read()
+    _, third = capture.read()
+    assert second is first and third is first
+    assert first[0, 0, 0] == 3
+    assert capture.ring.allocations == 1
@@ -0,0 +1,51 @@
+import math
+
+import numpy as np
+import pytest
+
+from filters import OneEuroFilter, jitter_lag, make_filter
+
+
+def circle_track(filt, noise=0.0, timing=0.0, lead=0.0, fps=60, count=600, seed=0):
+    # 2 saniyede bir tur atan imleç; ölçüm ve zaman damgası gürültüsüyle
+    rng = np.random.default_rng(seed)
+    raw, out = [], []
+    t = 0.0
+    for i in range(count):
+        phase = 2 * math.pi * i / (2 * fps)
+        point = (960 + 300 * math.cos(phase), 540 + 300 * math.sin(phase))
+        noisy = np.add(point, rng.normal(0.0, noise, 2)) if noise else point
+        t += (1 + timing * rng.normal()) / fps
+        filt.update(noisy, t)
+        raw.append(point)
+        out.append(filt.predict(lead))
+    return jitter_lag(raw[60:], out[60:], 1 / fps)
+
+
+def test_one_euro_suppresses_noise():
+    raw = circle_track(make_filter('oneeuro', beta=1e3), noise=5.0)  # Neredeyse süzgeçsiz
+    metrics = circle_track(OneEuroFilter(), noise=5.0)
+    assert metrics['jitter_px'] < 0.25 * raw['jitter_px']
+
+
+def test_prediction_does_not_add_jitter():
+    plain = circle_track(OneEuroFilter())
+    predicted = circle_track(OneEuroFilter(), lead=0.03)
+    assert predicted['jitter_px'] < 1.05 * plain['raw_jitter_px']
+    assert predicted['lag_ms'] < plain['lag_ms'] - 10
+
+
+def test_timestamp_jitter_does_not_become_cursor_jitter():
+    # Kareler düzenli, yalnızca zaman damgaları oynuyor
+    metrics = circle_track(OneEuroFilter(), timing=0.1, lead=0.03)
+    assert metrics['jitter_px'] < 1.1 * metrics['raw_jitter_px']
+
+
+def test_dropped_frame_keeps_real_interval():
+    filt = OneEuroFilter()
+    for i in range(30):
+        filt.update((i * 10.0, 0.0), i / 30)
+    interval = filt.interval
+    filt.update((320.0, 0.0), 32 / 30)  # İki kare atlandı
+    assert filt.interval == pytest.approx(interval)
+    assert filt.trend[0] == pytest.approx(300.0, rel=0.1)
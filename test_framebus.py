@@ -0,0 +1,57 @@
+import os
+import time
+
+import numpy as np
+import pytest
+
+from framebus import FrameBusWriter, SharedFrameSource
+
+
+@pytest.fixture
+def bus():
+    name = f'test_framebus_{os.getpid()}_{time.perf_counter_ns()}'
+    writer = FrameBusWriter(name, (4, 6, 3), slots=3)
+    source = SharedFrameSource(name, timeout=1.0, read_timeout=0.1)
+    yield writer, source
+    source.release()
+    writer.close()
+
+
+def publish(writer, value):
+    writer.publish(np.full(writer.shape, value, dtype=np.uint8), time.perf_counter())
+
+
+def test_read_returns_latest_frame(bus):
+    writer, source = bus
+    for value in range(3):
+        publish(writer, value)
+    ret, frame = source.read()
+    assert ret and frame[0, 0, 0] == 2
+    assert source.last_seq == 2
+    del frame
+
+
+def test_read_seq_fails_once_slot_is_overwritten(bus):
+    writer, source = bus
+    publish(writer, 10)
+    ret, frame = source.read_seq(0)
+    assert ret and frame[0, 0, 0] == 10
+    del frame
+
+    # Halka dolaşır: sıra 3 aynı yuvaya (0) yazılır
+    for value in (11, 12, 13):
+        publish(writer, value)
+    assert source.read_seq(0) == (False, None)
+    ret, frame = source.read_seq(3)
+    assert ret and frame[0, 0, 0] == 13
+    del frame
+
+
+def test_read_seq_fails_while_slot_is_written(bus):
+    writer, source = bus
+    publish(writer, 1)
+    for value in (2, 3):
+        publish(writer, value)
+    writer.next_slot()  # Sıra 3 için yuva 0 açıldı, henüz commit yok
+    assert source.read_seq(0) == (False, None)
+    assert source.read_seq(3) == (False, None)
@@ -0,0 +1,101 @@
+import time
+
+import numpy as np
+
+from gestures import FEATURES, FEATURE_INDEX, Gesture, GestureEngine
+from landmarks import HAND_LANDMARKS
+
+
+def features(**values):
+    vector = np.zeros(len(FEATURES), dtype=np.float32)
+    vector[FEATURE_INDEX['pinch_index']] = 1.0
+    vector[FEATURE_INDEX['pinch_middle']] = 1.0
+    for name, value in values.items():
+        vector[FEATURE_INDEX[name]] = value
+    return vector
+
+
+def click_engine(**options):
+    engine = GestureEngine([Gesture('left_click', [('pinch_index', '<', 0.2, 0.28)], **options)])
+    log = []
+    engine.on('left_click', enter=lambda f: log.append('down'), exit=lambda f: log.append('up'))
+    return engine, log
+
+
+def test_enter_needs_consecutive_frames():
+    engine, log = click_engine(enter_frames=2)
+    assert engine.update(features(pinch_index=0.1), 0.0) == []
+    # Tek karelik açılma sayaç sıfırlar
+    engine.update(features(pinch_index=0.5), 0.1)
+    assert engine.update(features(pinch_index=0.1), 0.2) == []
+    assert engine.update(features(pinch_index=0.1), 0.3) == [('left_click', 'enter')]
+    assert log == ['down']
+
+
+def test_hysteresis_keeps_gesture_between_thresholds():
+    engine, log = click_engine(enter_frames=1, exit_frames=2)
+    engine.update(features(pinch_index=0.1), 0.0)
+    # Giriş eşiğinin üstünde ama çıkış eşiğinin altında: aktif kalır
+    for t in range(1, 6):
+        assert engine.update(features(pinch_index=0.25), t) == []
+    assert engine.is_active('left_click')
+    engine.update(features(pinch_index=0.4), 6)
+    assert engine.is_active('left_click')  # Çıkış da debounce edilir
+    assert engine.update(features(pinch_index=0.4), 7) == [('left_click', 'exit')]
+    assert log == ['down', 'up']
+
+
+def test_cooldown_blocks_fast_reentry():
+    engine, _ = click_engine(enter_frames=1, exit_frames=1, cooldown=0.5)
+    engine.update(features(pinch_index=0.1), 0.0)
+    engine.update(features(pinch_index=0.5), 0.1)
+    assert engine.update(features(pinch_index=0.1), 0.2) == []
+    assert engine.update(features(pinch_index=0.1), 0.6) == [('left_click', 'enter')]
+
+
+def test_release_all_exits_active_gestures():
+    engine, log = click_engine(enter_frames=1)
+    engine.update(features(pinch_index=0.1), 0.0)
+    assert engine.release_all() == [('left_click', 'exit')]
+    assert log == ['down', 'up']
+    assert not engine.is_active('left_click')
+    assert engine.release_all() == []
+
+
+def pinch_hand(pinched):
+    # Avuç boyu 0.2; baş parmak ucu işaret parmağına yakın ya da uzak
+    hand = np.full((HAND_LANDMARKS, 3), 0.5, dtype=np.float32)
+    hand[:, 1] = 0.6
+    hand[0] = (0.5, 0.8, 0.0)
+    hand[9] = (0.5, 0.6, 0.0)
+    hand[8] = (0.5, 0.5, 0.0)
+    hand[4] = (0.51 if pinched else 0.6, 0.5, 0.0)
+    hand[12] = (0.42, 0.5, 0.0)
+    return hand
+
+
+def test_lost_hand_releases_held_click():
+    from injection import RecordingBackend
+    from parmakkontrol import HandMouseController
+    controller = HandMouseController(1920, 1080, hands=object(), cursor_rate=0,
+                                     input_backend='record')
+    backend = controller.actuator.injector.backend
+    assert isinstance(backend, RecordingBackend)
+    for _ in range(3):
+        controller.act(pinch_hand(True), time.perf_counter())
+    assert [e[:2] for e in backend.events if e[0] != 'move'] == [('down', 'left')]
+
+    controller.hand_lost()
+    assert [e[:2] for e in backend.events if e[0] != 'move'] == [('down', 'left'), ('up', 'left')]
+
+
+def test_click_lands_on_current_target():
+    from parmakkontrol import HandMouseController
+    controller = HandMouseController(1920, 1080, hands=object(), cursor_rate=0,
+                                     input_backend='record', predict=False)
+    backend = controller.actuator.injector.backend
+    for _ in range(3):
+        controller.act(pinch_hand(True), time.perf_counter())
+    events = backend.events
+    down = next(i for i, e in enumerate(events) if e[0] == 'down')
+    assert events[down - 1][0] == 'move'  # Tık, o karenin imleç hedefinden sonra gelir
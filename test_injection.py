@@ -0,0 +1,57 @@
+from injection import InputInjector, RecordingBackend
+
+
+def queued_injector():
+    # İş parçacığı başlatılmadan kuyruk açık: olaylar stop() gelene kadar bekler
+    injector = InputInjector(RecordingBackend())
+    injector.running = True
+    return injector
+
+
+def sent(injector):
+    return [(kind, value) for kind, value, _ in injector.backend.events]
+
+
+def test_consecutive_moves_keep_only_latest():
+    injector = queued_injector()
+    for x in range(5):
+        injector.move(x, 10)
+    assert injector.depth() == 1
+    injector.stop()
+    assert sent(injector) == [('move', (4, 10))]
+    assert injector.dropped_moves == 4
+    assert injector.sent == 1
+
+
+def test_consecutive_scrolls_are_summed():
+    injector = queued_injector()
+    injector.scroll(2)
+    injector.scroll(3)
+    injector.scroll(0)  # Sıfır kaydırma kuyruğa girmez
+    injector.stop()
+    assert sent(injector) == [('scroll', 5)]
+    assert injector.merged_scrolls == 1
+
+
+def test_buttons_keep_order_with_moves_between():
+    injector = queued_injector()
+    injector.move(1, 1)
+    injector.move(2, 2)
+    injector.press('left')
+    injector.move(3, 3)
+    injector.move(4, 4)
+    injector.release('left')
+    injector.move(5, 5)
+    injector.stop()
+    assert sent(injector) == [('move', (2, 2)), ('down', 'left'), ('move', (4, 4)),
+                              ('up', 'left'), ('move', (5, 5))]
+    assert injector.dropped_moves == 2
+
+
+def test_unthreaded_sends_immediately():
+    injector = InputInjector(RecordingBackend(), threaded=False)
+    injector.start()
+    injector.move(1, 2)
+    injector.move(3, 4)
+    assert sent(injector) == [('move', (1, 2)), ('move', (3, 4))]
+    assert injector.dropped_moves == 0
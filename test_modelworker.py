@@ -0,0 +1,59 @@
+import multiprocessing
+
+import numpy as np
+import pytest
+
+import modelworker
+from modelworker import InferencePool, MODELS, ModelWorker
+
+
+def mean_model(**options):
+    def run(rgb):
+        return rgb.reshape(-1, 3).mean(axis=0)
+    return run
+
+
+@pytest.fixture
+def pool(monkeypatch):
+    # Sahte model alt süreçte de kayıtlı olsun diye spawn yerine fork
+    fork = multiprocessing.get_context('fork')
+    monkeypatch.setattr(modelworker.multiprocessing, 'get_context', lambda method=None: fork)
+    monkeypatch.setitem(MODELS, 'mean', mean_model)
+    pool = InferencePool((8, 8, 3), models=('mean',))
+    yield pool
+    pool.close()
+
+
+def publish(pool, value):
+    pool.next_buffer()[...] = value
+    pool.commit()
+
+
+def test_worker_runs_model_on_shared_frame(pool):
+    run = pool.model('mean')
+    publish(pool, 7)
+    np.testing.assert_allclose(run(None), [7, 7, 7])
+    assert pool.stats()['mean']['calls'] == 1
+
+
+def test_dead_worker_falls_back_to_local_model(pool, monkeypatch):
+    run = pool.model('mean')
+    publish(pool, 3)
+    run(None)
+    worker = pool.workers['mean']
+    worker.process.kill()
+    worker.process.join()
+    cpu = pool.worker_cpu()
+
+    stops = []
+    monkeypatch.setattr(ModelWorker, 'stop', lambda self, timeout=2.0: stops.append(self))
+    publish(pool, 5)
+    rgb = np.full((8, 8, 3), 5, dtype=np.uint8)
+    np.testing.assert_allclose(run(rgb), [5, 5, 5])  # Hata yok, bu süreçte çalıştı
+    np.testing.assert_allclose(run(rgb), [5, 5, 5])
+
+    assert 'mean' not in pool.workers
+    assert 'mean' in pool.fallback
+    assert pool.stats() == {}
+    assert pool.worker_cpu() == cpu
+    assert stops == [worker]  # Bir kez durduruldu; havuzda olmadığı için close() onu görmez
@@ -0,0 +1,38 @@
+import numpy as np
+
+from yuztakip import InferenceScheduler
+
+
+def counting_scheduler(motion):
+    # Yüz ağı her çağrıda bir artan değer döner; kapı sıradaki hareket bilgisini verir
+    calls = []
+
+    def detect_face(frame, rgb):
+        calls.append(frame)
+        return np.full((4, 3), float(len(calls)))
+
+    moving = iter(motion)
+    scheduler = InferenceScheduler(detect_face, lambda rgb: None,
+                                   face_gate=lambda frame: next(moving))
+    return scheduler, calls
+
+
+def test_static_frames_skip_face_model():
+    scheduler, calls = counting_scheduler([True, True, False, False, True])
+    try:
+        faces = [scheduler.run(index, None)[0][0, 0] for index in range(5)]
+    finally:
+        scheduler.shutdown()
+    assert calls == [0, 1, 4]
+    # Atlanan karelerde son iki sonuçtan tahmin, en fazla bir aralık ileri
+    assert faces == [1.0, 2.0, 3.0, 3.0, 3.0]
+
+
+def test_gate_is_consulted_even_at_full_rate():
+    scheduler, calls = counting_scheduler([True, False, False])
+    try:
+        faces = [scheduler.run(index, None, full_rate_face=True)[0] for index in range(3)]
+    finally:
+        scheduler.shutdown()
+    assert calls == [0]
+    assert all(face is not None for face in faces)
@@ -0,0 +1,185 @@
+"""Hızlı açılış: tembel modül yükleme ve arka planda model hazırlığı
+
+Ağır modüller (mediapipe, torch, PIL, pyautogui) ilk kullanıldıkları anda
+yüklenir; modeller ve kamera ise arayüz açıldıktan sonra arka plan iş
+parçacığında hazırlanır. Her adımın süresi açılış raporuna yazılır.
+
+    mp = lazy_import('mediapipe')          # henüz yüklenmez
+    warm = WarmStart(report)
+    warm.add('kamera', open_camera, parallel=True)   # modelle aynı anda
+    warm.add('model', build_model)
+    warm.start()                           # arayüz bu sırada açılır
+    if warm.ready.is_set(): ...            # ya da warm.wait()
+"""
+import importlib
+import sys
+import threading
+import time
+from contextlib import contextmanager
+
+# Süreç başlangıcına yakın referans zamanı (ilk içe aktarıldığı an)
+PROCESS_START = time.perf_counter()
+
+
+class StartupReport:
+    """Açılış adımlarının sürelerini toplar"""
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.imports = {}   # modül -> saniye
+        self.steps = {}     # adım -> saniye
+        self.marks = {}     # olay -> süreç başından geçen saniye
+
+    def record_import(self, name, seconds):
+        with self._lock:
+            self.imports[name] = seconds
+
+    def record(self, step, seconds):
+        with self._lock:
+            self.steps[step] = seconds
+
+    def mark(self, event):
+        with self._lock:
+            self.marks[event] = time.perf_counter() - PROCESS_START
+
+    @contextmanager
+    def timed(self, step):
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.record(step, time.perf_counter() - start)
+
+    def lines(self):
+        with self._lock:
+            imports = dict(self.imports)
+            steps = dict(self.steps)
+            marks = dict(self.marks)
+        lines = ["Açılış raporu:"]
+        for name, seconds in imports.items():
+            lines.append(f"  içe aktarma {name:<18}{seconds * 1000:8.1f} ms")
+        for step, seconds in steps.items():
+            lines.append(f"  {step:<30}{seconds * 1000:8.1f} ms")
+        for event, seconds in marks.items():
+            lines.append(f"  {event:<30}{seconds * 1000:8.1f} ms (başlangıçtan)")
+        return lines
+
+    def print(self):
+        print("\n".join(self.lines()))
+
+
+# Varsayılan rapor: tembel modüller içe aktarma sürelerini buraya yazar
+report = StartupReport()
+
+
+class LazyModule:
+    """İlk öznitelik erişiminde gerçek modülü içe aktaran vekil
+
+    Yüklendikten sonra modülün öznitelikleri vekilin sözlüğüne kopyalanır,
+    böylece sonraki erişimler __getattr__ üzerinden geçmez.
+    """
+    def __init__(self, name, startup_report=None):
+        self.__dict__['_lazy_name'] = name
+        self.__dict__['_lazy_report'] = startup_report or report
+        self.__dict__['_lazy_lock'] = threading.Lock()
+        self.__dict__['_lazy_module'] = None
+
+    def load(self):
+        module = self.__dict__['_lazy_module']
+        if module is not None:
+            return module
+        with self.__dict__['_lazy_lock']:
+            module = self.__dict__['_lazy_module']
+            if module is None:
+                name = self.__dict__['_lazy_name']
+                already = name in sys.modules
+                start = time.perf_counter()
+                module = importlib.import_module(name)
+                if not already:
+                    self.__dict__['_lazy_report'].record_import(name, time.perf_counter() - start)
+                self.__dict__.update(module.__dict__)
+                self.__dict__['_lazy_module'] = module
+        return module
+
+    def loaded(self):
+        return self.__dict__['_lazy_module'] is not None
+
+    def __getattr__(self, attr):
+        return getattr(self.load(), attr)
+
+    def __setattr__(self, attr, value):
+        # pyautogui.PAUSE = 0 gibi atamalar gerçek modüle gitmeli
+        setattr(self.load(), attr, value)
+        self.__dict__[attr] = value
+
+    def __repr__(self):
+        state = 'yüklü' if self.loaded() else 'yüklenmedi'
+        return f"<LazyModule {self.__dict__['_lazy_name']} ({state})>"
+
+
+def lazy_import(name, startup_report=None):
+    return LazyModule(name, startup_report)
+
+
+class WarmStart:
+    """Açılış adımlarını arka planda çalıştırır, hepsi bitince ready kurulur
+
+    Adımlar eklendikleri sırayla çalışır; parallel=True verilenler (ör. kamera
+    açılışı) ayrı iş parçacığında diğerleriyle aynı anda yürür.
+    """
+    def __init__(self, startup_report=None):
+        self.report = startup_report or report
+        self.tasks = []
+        self.results = {}
+        self.error = None
+        self.ready = threading.Event()
+        self.thread = None
+
+    def add(self, step, func, *args, parallel=False, **kwargs):
+        self.tasks.append((step, func, args, kwargs, parallel))
+        return self
+
+    def preload(self, *modules):
+        # Tembel modülleri de arka planda içe aktar
+        for module in modules:
+            self.add(None, module.load)
+        return self
+
+    def start(self):
+        self.thread = threading.Thread(target=self._run, daemon=True)
+        self.thread.start()
+        return self
+
+    def _run_task(self, step, func, args, kwargs):
+        # Hata self.error içinde saklanır; wait() onu yeniden fırlatır
+        try:
+            if step is None:
+                func(*args, **kwargs)
+            else:
+                with self.report.timed(step):
+                    self.results[step] = func(*args, **kwargs)
+            return True
+        except Exception as e:
+            if self.error is None:
+                self.error = e
+            return False
+
+    def _run(self):
+        workers = [threading.Thread(target=self._run_task, args=task[:4], daemon=True)
+                   for task in self.tasks if task[4]]
+        for worker in workers:
+            worker.start()
+        for task in self.tasks:
+            if not task[4] and not self._run_task(*task[:4]):
+                break
+        for worker in workers:
+            worker.join()
+        self.report.mark('hazır')
+        self.ready.set()
+
+    def wait(self, timeout=None):
+        # Hazırsa adım sonuçlarını döner; arka planda hata olduysa yeniden fırlatır
+        if not self.ready.wait(timeout):
+            return None
+        if self.error is not None:
+            raise self.error
+        return self.results
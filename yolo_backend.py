@@ -0,0 +1,274 @@
+"""YOLO çıkarım arka uçları: PyTorch, ONNX Runtime ve OpenVINO
+
+Model bir kez dışa aktarılır ve model_cache/ altında saklanır; sonraki
+açılışlarda doğrudan bu dosya yüklenir. İş parçacığı sayısı makinenin
+çekirdek sayısından seçilir.
+
+Tüm arka uçlar aynı arayüzü sunar:
+    detector.detect([kare, ...]) -> [[((x1, y1, x2, y2), etiket, güven), ...], ...]
+
+Aynı kayıt üzerinde arka uçları karşılaştırmak için:
+    python yolo_backend.py --clip kayit.mp4
+    python yolo_backend.py --clip kayitlar/oturum1 --backends torch onnx
+"""
+import json
+import os
+import shutil
+import time
+
+import cv2
+import numpy as np
+
+BACKENDS = ('torch', 'onnx', 'openvino')
+CACHE_DIR = 'model_cache'
+
+
+def default_threads():
+    # Fiziksel çekirdek sayısı (psutil yoksa işleme açık mantıksal çekirdekler)
+    try:
+        import psutil
+        physical = psutil.cpu_count(logical=False)
+        if physical:
+            return physical
+    except ImportError:
+        pass
+    if hasattr(os, 'sched_getaffinity'):
+        return len(os.sched_getaffinity(0))
+    return os.cpu_count() or 1
+
+
+def configure_threads(threads):
+    # Çıkarım kütüphaneleri yüklenmeden önce çağrılmalı
+    for name in ('OMP_NUM_THREADS', 'MKL_NUM_THREADS', 'OPENBLAS_NUM_THREADS'):
+        os.environ.setdefault(name, str(threads))
+    cv2.setNumThreads(threads)
+
+
+def cached_model_path(weights, backend, imgsz, cache_dir=CACHE_DIR):
+    stem = os.path.splitext(os.path.basename(weights))[0]
+    if backend == 'onnx':
+        return os.path.join(cache_dir, f"{stem}_{imgsz}.onnx")
+    return os.path.join(cache_dir, f"{stem}_{imgsz}_openvino_model")
+
+
+def export_model(weights, backend, imgsz, cache_dir=CACHE_DIR):
+    """Modeli gerekiyorsa dışa aktarır; (yol, aktarım süresi) döner"""
+    path = cached_model_path(weights, backend, imgsz, cache_dir)
+    names_path = path + '.names.json'
+    if os.path.exists(path) and os.path.exists(names_path):
+        return path, 0.0
+
+    from ultralytics import YOLO
+    start = time.perf_counter()
+    model = YOLO(weights)
+    # Toplu çağrılar için değişken batch boyutu
+    exported = model.export(format=backend, imgsz=imgsz, dynamic=True)
+    os.makedirs(cache_dir, exist_ok=True)
+    if os.path.isdir(path):
+        shutil.rmtree(path)
+    elif os.path.exists(path):
+        os.remove(path)
+    shutil.move(str(exported), path)
+    with open(names_path, 'w', encoding='utf-8') as f:
+        json.dump({int(k): v for k, v in model.names.items()}, f)
+    return path, time.perf_counter() - start
+
+
+def load_names(path):
+    with open(path + '.names.json', encoding='utf-8') as f:
+        return {int(k): v for k, v in json.load(f).items()}
+
+
+class TorchDetector:
+    """Ultralytics/PyTorch ile CPU çıkarımı"""
+    def __init__(self, weights, threads, imgsz):
+        import torch
+        from ultralytics import YOLO
+        torch.set_num_threads(threads)
+        self.imgsz = imgsz
+        self.model = YOLO(weights).to("cpu")
+        self.model.fuse()  # Model optimizasyonu
+
+    def detect(self, frames):
+        results = self.model(frames, imgsz=self.imgsz, verbose=False)
+        return [self.parse(result) for result in results]
+
+    @staticmethod
+    def parse(result):
+        detections = []
+        for box in result.boxes:
+            x1, y1, x2, y2 = map(int, box.xyxy[0])  # Nesne Koordinatları
+            label = result.names[int(box.cls)]  # Nesne Adı
+            conf = box.conf.item()  # Güven Skoru
+            detections.append(((x1, y1, x2, y2), label, conf))
+        return detections
+
+
+class ExportedDetector:
+    """Dışa aktarılmış YOLOv8 modelleri için ortak ön/son işleme"""
+    conf_threshold = 0.25
+    iou_threshold = 0.45
+
+    def __init__(self, names, imgsz):
+        self.names = names
+        self.imgsz = imgsz
+
+    def preprocess(self, frames):
+        # Oranı koruyarak kare girdiye sığdır (sol üste yasla, kalan gri)
+        size = self.imgsz
+        batch = np.full((len(frames), size, size, 3), 114, dtype=np.uint8)
+        scales = []
+        for i, frame in enumerate(frames):
+            h, w = frame.shape[:2]
+            scale = min(size / h, size / w)
+            nh, nw = int(round(h * scale)), int(round(w * scale))
+            batch[i, :nh, :nw] = cv2.resize(frame, (nw, nh), interpolation=cv2.INTER_LINEAR)
+            scales.append(scale)
+        # BGR -> RGB, NHWC -> NCHW, [0, 1]
+        tensor = batch[..., ::-1].transpose(0, 3, 1, 2).astype(np.float32) / 255.0
+        return np.ascontiguousarray(tensor), scales
+
+    def postprocess(self, output, scales):
+        # output: (B, 4 + sınıf, N) -> her kare için tespit listesi
+        detections = []
+        for preds, scale in zip(output, scales):
+            preds = preds.T
+            scores = preds[:, 4:]
+            class_ids = scores.argmax(axis=1)
+            confs = scores[np.arange(len(scores)), class_ids]
+            keep = confs > self.conf_threshold
+            if not keep.any():
+                detections.append([])
+                continue
+            boxes, class_ids, confs = preds[keep, :4] / scale, class_ids[keep], confs[keep]
+            # cx, cy, w, h -> x, y, w, h; sınıflar ayrı NMS için kaydırılır
+            xywh = np.column_stack((boxes[:, 0] - boxes[:, 2] / 2, boxes[:, 1] - boxes[:, 3] / 2,
+                                    boxes[:, 2], boxes[:, 3]))
+            offset = xywh.copy()
+            offset[:, :2] += class_ids[:, None] * 4096
+            indices = cv2.dnn.NMSBoxes(offset.tolist(), confs.tolist(),
+                                       self.conf_threshold, self.iou_threshold)
+            frame_detections = []
+            for i in np.asarray(indices).reshape(-1):
+                x, y, w, h = xywh[i]
+                frame_detections.append(((int(x), int(y), int(x + w), int(y + h)),
+                                         self.names[int(class_ids[i])], float(confs[i])))
+            detections.append(frame_detections)
+        return detections
+
+    def detect(self, frames):
+        tensor, scales = self.preprocess(frames)
+        return self.postprocess(self.infer(tensor), scales)
+
+
+class ONNXDetector(ExportedDetector):
+    def __init__(self, path, threads, imgsz):
+        import onnxruntime as ort
+        super().__init__(load_names(path), imgsz)
+        options = ort.SessionOptions()
+        options.intra_op_num_threads = threads
+        options.inter_op_num_threads = 1
+        options.graph_optimization_level = ort.GraphOptimizationLevel.ORT_ENABLE_ALL
+        self.session = ort.InferenceSession(path, options, providers=['CPUExecutionProvider'])
+        self.input_name = self.session.get_inputs()[0].name
+
+    def infer(self, tensor):
+        return self.session.run(None, {self.input_name: tensor})[0]
+
+
+class OpenVINODetector(ExportedDetector):
+    def __init__(self, path, threads, imgsz):
+        import openvino as ov
+        super().__init__(load_names(path), imgsz)
+        xml = next(os.path.join(path, name) for name in os.listdir(path) if name.endswith('.xml'))
+        core = ov.Core()
+        self.compiled = core.compile_model(core.read_model(xml), 'CPU', {
+            'INFERENCE_NUM_THREADS': threads,
+            'PERFORMANCE_HINT': 'LATENCY',
+        })
+        self.output = self.compiled.output(0)
+
+    def infer(self, tensor):
+        return self.compiled(tensor)[self.output]
+
+
+def load_detector(backend='torch', weights='yolov8n.pt', threads=None, imgsz=640,
+                  cache_dir=CACHE_DIR):
+    """Seçilen arka ucu kurar; (dedektör, süreler sözlüğü) döner"""
+    if backend not in BACKENDS:
+        raise ValueError(f"Bilinmeyen arka uç: {backend} (seçenekler: {', '.join(BACKENDS)})")
+    threads = threads or default_threads()
+    configure_threads(threads)
+    timings = {'export': 0.0}
+    if backend == 'torch':
+        start = time.perf_counter()
+        detector = TorchDetector(weights, threads, imgsz)
+    else:
+        path, timings['export'] = export_model(weights, backend, imgsz, cache_dir)
+        start = time.perf_counter()
+        cls = ONNXDetector if backend == 'onnx' else OpenVINODetector
+        detector = cls(path, threads, imgsz)
+    timings['load'] = time.perf_counter() - start
+    return detector, timings
+
+
+def read_clip(path, limit, size=(320, 240)):
+    # Video dosyası ya da framesource kayıt klasörü
+    frames = []
+    if os.path.isdir(path):
+        from framesource import ReplaySource
+        cap = ReplaySource(path, speed='max')
+    else:
+        cap = cv2.VideoCapture(path)
+    while len(frames) < limit:
+        ret, frame = cap.read()
+        if not ret:
+            break
+        frames.append(cv2.resize(frame, size))
+    cap.release()
+    return frames
+
+
+def benchmark_backends(clip, backends=BACKENDS, weights='yolov8n.pt', threads=None,
+                       imgsz=640, frames=200, warmup=5):
+    clip_frames = read_clip(clip, frames)
+    if not clip_frames:
+        raise SystemExit(f"Kayıt okunamadı: {clip}")
+    threads = threads or default_threads()
+    print(f"{len(clip_frames)} kare, {threads} iş parçacığı, girdi {imgsz}px")
+    print(f"{'arka uç':<10}{'aktarım s':>11}{'açılış s':>10}{'ilk ms':>9}"
+          f"{'p50 ms':>9}{'p95 ms':>9}{'FPS':>8}")
+    for backend in backends:
+        try:
+            detector, timings = load_detector(backend, weights, threads, imgsz)
+        except ImportError as e:
+            print(f"{backend:<10} kullanılamıyor ({e.name} kurulu değil)")
+            continue
+        start = time.perf_counter()
+        detector.detect([clip_frames[0]])
+        first = time.perf_counter() - start
+        for frame in clip_frames[:warmup]:
+            detector.detect([frame])
+        latencies = []
+        for frame in clip_frames:
+            start = time.perf_counter()
+            detector.detect([frame])
+            latencies.append(time.perf_counter() - start)
+        p50, p95 = np.percentile(np.array(latencies) * 1000, [50, 95])
+        fps = len(latencies) / sum(latencies)
+        print(f"{backend:<10}{timings['export']:11.2f}{timings['load']:10.2f}{first * 1000:9.1f}"
+              f"{p50:9.1f}{p95:9.1f}{fps:8.1f}")
+
+
+if __name__ == "__main__":
+    import argparse
+    parser = argparse.ArgumentParser(description="YOLO arka uç karşılaştırması")
+    parser.add_argument('--clip', required=True, help="Video dosyası ya da kayıt klasörü")
+    parser.add_argument('--backends', nargs='+', choices=BACKENDS, default=list(BACKENDS))
+    parser.add_argument('--weights', default='yolov8n.pt')
+    parser.add_argument('--threads', type=int, help="Varsayılan: fiziksel çekirdek sayısı")
+    parser.add_argument('--imgsz', type=int, default=640)
+    parser.add_argument('--frames', type=int, default=200)
+    args = parser.parse_args()
+    benchmark_backends(args.clip, args.backends, args.weights, args.threads,
+                       args.imgsz, args.frames)
@@ -1,17 +1,87 @@
-import cv2
+from warmstart import lazy_import, report, WarmStart
 import webbrowser
 import os
-import mediapipe as mp
 import numpy as np
 import tkinter as tk
 from tkinter import ttk
-from PIL import Image, ImageTk
 import threading
 import time
 from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+import argparse
+from framesource import open_camera, add_source_arguments, source_from_args
+from landmarks import (to_pixels, iris_ratios, FACE_LANDMARKS,
+                       INDEX_PIP, INDEX_TIP, MIDDLE_PIP, MIDDLE_TIP,
+                       HAND_CONNECTIONS)
+from landmarkcache import LandmarkCache
+from pipeline import LatestSlot
+from capture import FrameRing
+from motiongate import MotionGate
+from modelworker import InferencePool, CpuMeter, face_model, hands_model
+
+# Ağır modüller ilk kullanımda yüklenir; pencere bunları beklemeden açılır
+cv2 = lazy_import('cv2')
+mp = lazy_import('mediapipe')
+Image = lazy_import('PIL.Image')
+ImageTk = lazy_import('PIL.ImageTk')
+
+# Kullanıcı/kamera başına kaydedilen kalibrasyon profilleri
+PROFILE_DIR = 'calibration_profiles'
+# Profildeki özniteliklerin türü; eski (göz kapağı oranlı) profiller yüklenmez
+PROFILE_FEATURES = 'iris'
+# Kalibrasyon için en az dolu nokta ve öznitelik başına en küçük yayılım (göz genişliği oranı)
+MIN_CALIBRATION_POINTS = 3
+MIN_FEATURE_SPREAD = 1e-3
+
+def gaze_features(ratios, degree=2):
+    """(..., 2, 2) iris oranlarından 2B polinom öznitelikleri: [1, x, y, x², xy, y², ...]"""
+    mean = np.asarray(ratios, dtype=np.float64).mean(axis=-2)
+    x, y = mean[..., 0], mean[..., 1]
+    terms = [x ** (total - j) * y ** j
+             for total in range(degree + 1) for j in range(total + 1)]
+    return np.stack(terms, axis=-1)
+
+def fit_calibration(samples, targets, degree=2, ridge=1e-4):
+    """Tüm örneklerden en küçük kareler ile bakış eşlemesi katsayıları
+
+    samples: (S, 2, 2) iris oranları, targets: (S, 2) [0, 1] ekran konumu.
+    Dönen (K, 2) matris ile bakış noktası = öznitelikler @ katsayılar.
+    Öznitelikler neredeyse sabitse ya da K terimi belirlemeye yetmiyorsa
+    ValueError; böyle bir eşleme her bakışı hedeflerin ortalamasına götürür.
+    """
+    features = gaze_features(samples, degree)
+    targets = np.asarray(targets, dtype=np.float64).reshape(-1, 2)
+    count = features.shape[-1]
+    spread = features[:, 1:].std(axis=0)
+    if (spread < MIN_FEATURE_SPREAD).any():
+        raise ValueError(f"iris öznitelikleri neredeyse sabit (yayılım {spread.min():.2g})")
+    rank = np.linalg.matrix_rank(features)
+    if rank < count:
+        raise ValueError(f"öznitelik rankı {rank} < {count} terim")
+    # Az sayıda nokta için küçük ridge terimi çözümü kararlı tutar
+    design = np.vstack((features, np.sqrt(ridge) * np.eye(count)))
+    padded = np.vstack((targets, np.zeros((count, 2))))
+    coeffs, *_ = np.linalg.lstsq(design, padded, rcond=None)
+    return coeffs
+
+def solve_gaze(ratios, coeffs):
+    # (..., 2, 2) oranlar -> (..., 2) [0, 1] aralığında bakış noktası
+    degree = calibration_degree(coeffs)
+    return np.clip(gaze_features(ratios, degree) @ coeffs, 0, 1)
+
+def calibration_degree(coeffs):
+    # K = (d + 1)(d + 2) / 2 terimden polinom derecesini bul
+    degree = 0
+    while (degree + 1) * (degree + 2) // 2 < len(coeffs):
+        degree += 1
+    return degree
+
+def profile_path(user, camera, directory=PROFILE_DIR):
+    safe = "".join(c if c.isalnum() or c in '-_' else '_' for c in f"{user}_{camera}")
+    return os.path.join(directory, f"{safe}.npz")
 
 class EyeTracker:
-    def __init__(self, screen_width, screen_height):
+    def __init__(self, screen_width, screen_height, profile_path=None, load_profile=True):
         # Ekran boyutuna göre kalibrasyon noktaları
         padding = 50  # Kenarlardan uzaklık
         self.calibration_points = [
@@ -29,29 +99,21 @@ class EyeTracker:
         self.point_start_time = None
         self.point_duration = 3
         
-    def calculate_eye_ratio(self, eye_points):
-        try:
-            # Göz köşe noktaları
-            left = eye_points[0]
-            right = eye_points[8]
-            top = eye_points[4]
-            bottom = eye_points[12]
-            
-            # Göz merkezi
-            center_x = (left[0] + right[0]) / 2
-            center_y = (top[1] + bottom[1]) / 2
-            
-            # Mesafeler
-            eye_width = max(abs(right[0] - left[0]), 1)  # Sıfıra bölünmeyi önle
-            eye_height = max(abs(bottom[1] - top[1]), 1)
-            
-            # Oranları hesapla
-            x_ratio = (center_x - left[0]) / eye_width
-            y_ratio = (center_y - top[1]) / eye_height
-            
-            return x_ratio, y_ratio
-        except (IndexError, ZeroDivisionError):
-            return None, None
+        # Bakış eşlemesi: [0, 1] ekran konumu = öznitelikler @ katsayılar
+        # Derece dolu nokta sayısına göre düşürülür (5 nokta: doğrusal)
+        self.screen_size = np.array([screen_width, screen_height], dtype=np.float64)
+        self.max_degree = 2
+        self.degree = 2
+        self.coeffs = None
+        self.profile_path = profile_path
+        if profile_path and load_profile and os.path.exists(profile_path):
+            self.load_profile(profile_path)
+        
+    def face_eye_ratios(self, face_landmarks):
+        # İki göz tek geçişte: (2, 2) dizi [[sol x, sol y], [sağ x, sağ y]]; iris noktaları gerekli
+        if len(face_landmarks) < FACE_LANDMARKS:
+            return None
+        return iris_ratios(face_landmarks)
     
     def calibrate(self, frame, face_landmarks):
         if not self.is_calibrated:
@@ -74,27 +136,16 @@ class EyeTracker:
                        (50, 30), cv2.FONT_HERSHEY_SIMPLEX, 1, (0, 255, 0), 2)
             
             if elapsed_time < self.point_duration:
-                try:
-                    # Göz verilerini topla
-                    left_eye = face_landmarks[33:46]
-                    right_eye = face_landmarks[263:276]
-                    
-                    left_ratio = self.calculate_eye_ratio(left_eye)
-                    right_ratio = self.calculate_eye_ratio(right_eye)
-                    
-                    if left_ratio[0] is not None and right_ratio[0] is not None:
-                        self.current_samples.append({
-                            'left': left_ratio,
-                            'right': right_ratio
-                        })
-                except (IndexError, TypeError):
-                    pass
+                # Göz verilerini topla
+                ratios = self.face_eye_ratios(face_landmarks)
+                if ratios is not None:
+                    self.current_samples.append(ratios)
                 
                 return frame, False
             else:
                 # Yeterli örnek toplandı mı kontrol et
                 if len(self.current_samples) > self.samples_per_point // 2:
-                    self.calibration_data[self.current_point] = self.current_samples
+                    self.calibration_data[self.current_point] = np.stack(self.current_samples)
                     self.current_point += 1
                     self.current_samples = []
                 
@@ -110,49 +161,57 @@ class EyeTracker:
     
     def process_calibration(self):
         try:
-            x_ratios_left = []
-            y_ratios_left = []
-            x_ratios_right = []
-            y_ratios_right = []
+            # Tüm örnekler tek dizide, her örneğin hedefi kendi kalibrasyon noktası
+            filled = [(i, samples) for i, samples in enumerate(self.calibration_data)
+                      if len(samples)]
+            if len(filled) < MIN_CALIBRATION_POINTS:
+                raise ValueError(f"yalnızca {len(filled)} noktada örnek toplandı")
+            # Terim sayısı nokta sayısını aşmasın
+            degree = self.max_degree
+            while degree > 1 and (degree + 1) * (degree + 2) // 2 > len(filled):
+                degree -= 1
+            samples = np.concatenate([s for _, s in filled])
+            point_ids = np.concatenate([np.full(len(s), i) for i, s in filled])
+            targets = np.asarray(self.calibration_points, dtype=np.float64)[point_ids]
+            self.coeffs = fit_calibration(samples, targets / self.screen_size, degree)
+            self.degree = degree
             
-            # Her kalibrasyon noktası için ortalama değerleri hesapla
-            for point_samples in self.calibration_data:
-                if point_samples:  # Boş olmayan örnekler için
-                    point_x_left = []
-                    point_y_left = []
-                    point_x_right = []
-                    point_y_right = []
-                    
-                    for sample in point_samples:
-                        left = sample['left']
-                        right = sample['right']
-                        if left[0] is not None and right[0] is not None:
-                            point_x_left.append(left[0])
-                            point_y_left.append(left[1])
-                            point_x_right.append(right[0])
-                            point_y_right.append(right[1])
-                    
-                    if point_x_left:  # Boş değilse ortalamaları al
-                        x_ratios_left.append(np.mean(point_x_left))
-                        y_ratios_left.append(np.mean(point_y_left))
-                        x_ratios_right.append(np.mean(point_x_right))
-                        y_ratios_right.append(np.mean(point_y_right))
-            
-            # Min-max değerlerini hesapla
-            if x_ratios_left:
-                self.x_min_left = min(x_ratios_left)
-                self.x_max_left = max(x_ratios_left)
-                self.y_min_left = min(y_ratios_left)
-                self.y_max_left = max(y_ratios_left)
-                
-                self.x_min_right = min(x_ratios_right)
-                self.x_max_right = max(x_ratios_right)
-                self.y_min_right = min(y_ratios_right)
-                self.y_max_right = max(y_ratios_right)
-                
-                self.is_calibrated = True
-        except (ValueError, AttributeError) as e:
-            print(f"Kalibrasyon işleme hatası: {e}")
+            self.is_calibrated = True
+            if self.profile_path:
+                self.save_profile(self.profile_path)
+        except (ValueError, AttributeError, np.linalg.LinAlgError) as e:
+            # Geçersiz eşleme kaydedilmez; kalibrasyon baştan başlar
+            print(f"Kalibrasyon işleme hatası: {e}; kalibrasyon yeniden başlıyor")
+            self.coeffs = None
+            self.is_calibrated = False
+            self.reset_calibration()
+    
+    def reset_calibration(self):
+        self.current_point = 0
+        self.current_samples = []
+        self.calibration_data = [[] for _ in range(len(self.calibration_points))]
+        self.point_start_time = None
+    
+    def save_profile(self, path):
+        try:
+            os.makedirs(os.path.dirname(path) or '.', exist_ok=True)
+            np.savez(path, coeffs=self.coeffs, degree=self.degree, features=PROFILE_FEATURES)
+        except OSError as e:
+            print(f"Kalibrasyon profili kaydedilemedi: {e}")
+    
+    def load_profile(self, path):
+        try:
+            with np.load(path) as data:
+                if 'features' not in data or str(data['features']) != PROFILE_FEATURES:
+                    raise ValueError("eski öznitelik türü, yeniden kalibrasyon gerekli")
+                self.coeffs = data['coeffs']
+                self.degree = int(data['degree'])
+            if self.coeffs.shape != ((self.degree + 1) * (self.degree + 2) // 2, 2):
+                raise ValueError(f"katsayı boyutu {self.coeffs.shape} derece {self.degree} ile uyumsuz")
+            self.is_calibrated = True
+        except (OSError, KeyError, ValueError) as e:
+            print(f"Kalibrasyon profili okunamadı ({path}): {e}")
+            self.coeffs = None
             self.is_calibrated = False
     
     def get_gaze_point(self, frame, face_landmarks):
@@ -160,33 +219,11 @@ class EyeTracker:
             if not self.is_calibrated or face_landmarks is None:
                return None
                
-            left_eye = face_landmarks[33:46]
-            right_eye = face_landmarks[263:276]
-           
-            left_ratio = self.calculate_eye_ratio(left_eye)
-            right_ratio = self.calculate_eye_ratio(right_eye)
-           
-            if None in (left_ratio[0], left_ratio[1], right_ratio[0], right_ratio[1]):
-                return None
-
-            denominator_x_left = self.x_max_left - self.x_min_left
-            denominator_y_left = self.y_max_left - self.y_min_left
-            denominator_x_right = self.x_max_right - self.x_min_right
-            denominator_y_right = self.y_max_right - self.y_min_right
-    
-            if min(denominator_x_left, denominator_y_left, denominator_x_right, denominator_y_right) < 1e-6:
+            ratios = self.face_eye_ratios(face_landmarks)
+            if ratios is None:
                 return None
 
-            x_left = (left_ratio[0] - self.x_min_left) / denominator_x_left
-            y_left = (left_ratio[1] - self.y_min_left) / denominator_y_left
-            x_right = (right_ratio[0] - self.x_min_right) / denominator_x_right
-            y_right = (right_ratio[1] - self.y_min_right) / denominator_y_right
-
-            x = (x_left + x_right) / 2
-            y = (y_left + y_right) / 2
-           
-            x = max(0, min(1, x))
-            y = max(0, min(1, y))
+            x, y = solve_gaze(ratios, self.coeffs).tolist()
            
             return (int(x * frame.shape[1]), int(y * frame.shape[0]))
         except Exception as e:
@@ -258,8 +295,125 @@ class YouTubePlayer(tk.Toplevel):
                 f.write(html)
             self.after(100, lambda: webbrowser.open('file://' + os.path.abspath('temp.html')))
 
+class InferenceScheduler:
+    """Yüz ağı ve el modelini paralel çalıştırır, hızlarını kare bütçesine göre ayarlar
+
+    Yüz ağı her face_interval karede bir çalışır, aradaki kareler son iki
+    sonuçtan doğrusal olarak tahmin edilir. Eller sürükleme sırasında her
+    karede, diğer zamanlarda hands_interval karede bir çalışır. Ortalama
+    kare süresi bütçeyi aşarsa aralıklar büyür, bütçenin altında kalırsa küçülür.
+    face_gate(kare) False dönerse (sahne durağan) yüz ağı o karede de atlanır.
+    """
+    def __init__(self, detect_face, detect_hands, target_fps=30,
+                 max_face_interval=4, max_hands_interval=3, adapt_every=15,
+                 face_gate=None):
+        self.detect_face = detect_face
+        self.detect_hands = detect_hands
+        self.face_gate = face_gate
+        self.pool = ThreadPoolExecutor(max_workers=2, thread_name_prefix='inference')
+        self.budget = 1.0 / target_fps
+        self.max_face_interval = max_face_interval
+        self.max_hands_interval = max_hands_interval
+        self.adapt_every = adapt_every
+        
+        self.face_interval = 1
+        self.hands_interval = 1
+        self.frame_index = 0
+        self.face_history = deque(maxlen=2)  # (kare no, landmark dizisi)
+        self.hands_result = None
+        self.last_hands_index = None
+        self.frame_time = None  # Kare süresinin üstel ortalaması
+    
+    def run(self, frame, rgb, dragging=False, full_rate_face=False):
+        # (yüz landmarkları ya da None, el sonuçları)
+        index = self.frame_index
+        self.frame_index += 1
+        start = time.perf_counter()
+        
+        run_face = (full_rate_face or not self.face_history or
+                    index - self.face_history[-1][0] >= self.face_interval)
+        if run_face and self.face_gate is not None and not self.face_gate(frame):
+            run_face = False
+        run_hands = (dragging or self.last_hands_index is None or
+                     index - self.last_hands_index >= self.hands_interval)
+        
+        face_future = self.pool.submit(self.detect_face, frame, rgb) if run_face else None
+        hands_future = self.pool.submit(self.detect_hands, rgb) if run_hands else None
+        
+        if face_future is not None:
+            face = face_future.result()
+            if face is None:
+                self.face_history.clear()
+            else:
+                self.face_history.append((index, face))
+        else:
+            face = self.interpolate_face(index)
+        if hands_future is not None:
+            self.hands_result = hands_future.result()
+            self.last_hands_index = index
+        
+        self.adapt(time.perf_counter() - start, dragging)
+        return face, self.hands_result
+    
+    def interpolate_face(self, index):
+        if not self.face_history:
+            return None
+        last_index, last = self.face_history[-1]
+        if len(self.face_history) < 2:
+            return last
+        prev_index, prev = self.face_history[0]
+        velocity = (last - prev) / (last_index - prev_index)
+        return last + velocity * min(index - last_index, self.face_interval)
+    
+    def adapt(self, elapsed, dragging):
+        if self.frame_time is None:
+            self.frame_time = elapsed
+        self.frame_time = 0.9 * self.frame_time + 0.1 * elapsed
+        if self.frame_index % self.adapt_every:
+            return
+        if self.frame_time > self.budget:
+            # Önce yüz ağını seyrelt, sürükleme yokken elleri de
+            if self.face_interval < self.max_face_interval:
+                self.face_interval += 1
+            elif not dragging and self.hands_interval < self.max_hands_interval:
+                self.hands_interval += 1
+        elif self.frame_time < 0.6 * self.budget:
+            if self.hands_interval > 1:
+                self.hands_interval -= 1
+            elif self.face_interval > 1:
+                self.face_interval -= 1
+    
+    def shutdown(self):
+        self.pool.shutdown(wait=False)
+
+class FrameRenderer:
+    """Kareleri tek bir canvas öğesine ve tek PhotoImage'a çizer"""
+    def __init__(self, canvas, width, height):
+        self.canvas = canvas
+        self.size = (width, height)
+        self.display_rgb = np.zeros((height, width, 3), dtype=np.uint8)
+        self.small_rgb = None
+        self.photo = ImageTk.PhotoImage('RGB', self.size)
+        self.item = canvas.create_image(0, 0, image=self.photo, anchor='nw')
+    
+    def show(self, frame):
+        # BGR->RGB küçük karede, ölçekleme önceden ayrılmış tampona
+        if self.small_rgb is None or self.small_rgb.shape != frame.shape:
+            self.small_rgb = np.empty_like(frame)
+        cv2.cvtColor(frame, cv2.COLOR_BGR2RGB, dst=self.small_rgb)
+        cv2.resize(self.small_rgb, self.size, dst=self.display_rgb,
+                   interpolation=cv2.INTER_LINEAR)
+        # paste mevcut Tk görüntüsünü günceller; yeni canvas öğesi oluşmaz
+        self.photo.paste(Image.fromarray(self.display_rgb))
+
 class MainApp:
-    def __init__(self):
+    inference_width = 640
+    target_fps = 30
+    render_interval_ms = 10
+    ring_size = 3
+    
+    def __init__(self, frame_source=None, landmark_cache=None, profile_path=None,
+                 load_profile=True, motion_gate=True, workers=False):
         self.root = tk.Tk()
         self.root.title("Göz Takip Sistemi")
         
@@ -269,31 +423,46 @@ class MainApp:
         self.screen_width = self.root.winfo_width()
         self.screen_height = self.root.winfo_height()
         
-        # MediaPipe başlatma
-        self.mp_face_mesh = mp.solutions.face_mesh
-        self.face_mesh = self.mp_face_mesh.FaceMesh(
-            max_num_faces=1,
-            refine_landmarks=True,
-            min_detection_confidence=0.5,
-            min_tracking_confidence=0.5
-        )
+        # Çıkarım küçük karede yapılır, sadece gösterim ekran boyutuna ölçeklenir
+        inference_width = min(self.inference_width, self.screen_width)
+        self.inference_size = (inference_width,
+                               max(1, round(inference_width * self.screen_height / self.screen_width)))
+        self.display_scale = self.screen_width / self.inference_size[0]
         
-        self.mp_hands = mp.solutions.hands
-        self.hands = self.mp_hands.Hands(
-            max_num_hands=2,
-            min_detection_confidence=0.7,
-            min_tracking_confidence=0.7
-        )
+        # MediaPipe modelleri ve kamera arka planda hazırlanır (bkz. load_models)
+        # workers=True ise modeller ayrı süreçlerde çalışır, bu süreç yalnızca gösterir
+        self.use_workers = workers
+        self.workers = None
+        self.face_model = None
+        self.hands_model = None
+        self.cap = None
+        if frame_source is None:
+            # Kamerayı mümkün olan en yüksek çözünürlüğe ayarla
+            frame_source = lambda: open_camera(0, width=1920, height=1080)
+        self.warm = WarmStart()
+        if workers:
+            self.warm.preload(cv2)
+        else:
+            self.warm.preload(cv2, mp)
+        if callable(frame_source):
+            self.warm.add('kamera açılışı', frame_source, parallel=True)
+        else:
+            self.cap = frame_source
+        self.warm.add('yüz ve el modelleri', self.load_models)
+        self.warm.start()
         
-        # Göz takip sistemi - ekran boyutlarını ilet
-        self.eye_tracker = EyeTracker(self.screen_width, self.screen_height)
+        # Yüz landmark önbelleği (kayıt tekrar oynatılırken)
+        self.landmark_cache = landmark_cache
+        # Yüz durağansa yüz ağı yerine son sonuçlardan tahmin kullanılır. Göz hareketi
+        # küçük görüntüde görünmez; gözler kullanılırken ağ en fazla gaze_refresh kare atlanır
+        self.face_gate = MotionGate() if motion_gate else None
+        self.gaze_refresh = 2
         
-        # Kamera ayarları
-        self.cap = cv2.VideoCapture(0)
-        # Kamerayı mümkün olan en yüksek çözünürlüğe ayarla
-        self.cap.set(cv2.CAP_PROP_FRAME_WIDTH, 1920)
-        self.cap.set(cv2.CAP_PROP_FRAME_HEIGHT, 1080)
-        self.cap.set(cv2.CAP_PROP_BUFFERSIZE, 1)
+        # Göz takip sistemi - çıkarım karesi boyutlarını ilet
+        # Kayıtlı profil varsa kalibrasyon atlanır (profil ekran oranlarıyla saklanır)
+        self.profile_path = profile_path
+        self.eye_tracker = EyeTracker(*self.inference_size, profile_path,
+                                      load_profile=load_profile)
         
         # Video gösterimi için canvas - tam ekran boyutunda
         self.canvas = tk.Canvas(self.root, 
@@ -302,16 +471,33 @@ class MainApp:
                               highlightthickness=0)
         self.canvas.pack(expand=True, fill='both')
         
+        # Tek canvas öğesi ve önceden ayrılmış gösterim tamponları
+        self.renderer = FrameRenderer(self.canvas, self.screen_width, self.screen_height)
+        
+        # Çalışan iş parçacığı -> Tk iş parçacığı kare kuyruğu (en yeni kazanır)
+        # Küçük kareler halkadan alınır; gösterildiğinde ya da atıldığında bırakılır
+        self.frame_queue = LatestSlot()
+        self.frame_ring = FrameRing(self.ring_size)
+        self.flip_buffer = None
+        self.rgb_buffer = None
+        
+        # Yüz ağı ve eller paralel, hızları kare bütçesine göre uyarlanır
+        self.scheduler = InferenceScheduler(self.detect_face, self.detect_hands,
+                                            target_fps=self.target_fps,
+                                            face_gate=self.face_changed)
+        self.drag_active = False
+        
         # YouTube penceresi
         self.youtube_window = YouTubePlayer(self.root)
         initial_yt_width = min(800, self.screen_width - 100)
         initial_yt_height = min(600, self.screen_height - 100)
         self.youtube_window.geometry(f"{initial_yt_width}x{initial_yt_height}+50+50")
         
-        # FPS sayacı
+        # FPS sayacı (çıkarım kapasitesi: kare başına işleme süresinden)
         self.fps_queue = deque(maxlen=30)
-        self.last_frame_time = time.time()
-        self.fps_label = tk.Label(self.root, text="FPS: 0",
+        self.cpu_meter = None
+        self.cpu_text = ""
+        self.fps_label = tk.Label(self.root, text="Yükleniyor...",
                                 bg='black', fg='green')
         self.fps_label.place(x=10, y=10)
         
@@ -324,129 +510,274 @@ class MainApp:
         self.root.bind('c', lambda e: self.toggle_calibration())
         self.root.bind('g', lambda e: self.toggle_gaze())
         
-        # Ana döngü
+        # Ana döngü: çıkarım ayrı iş parçacığında, gösterim Tk iş parçacığında
         self.update_thread = threading.Thread(target=self.update_frame)
         self.update_thread.daemon = True
         self.update_thread.start()
+        self.root.after(self.render_interval_ms, self.render_frame)
+        self.root.after(1000, self.update_cpu)
+        self.root.after(0, lambda: report.mark('pencere açıldı'))
+
+    def load_models(self):
+        # Her iki yolda da modeller (478, 3) yüz ve (N, 21, 3) el dizileri döner
+        if self.use_workers:
+            width, height = self.inference_size
+            self.workers = InferencePool((height, width, 3))
+            self.face_model = self.workers.model('face')
+            self.hands_model = self.workers.model('hands')
+        else:
+            self.face_model = face_model()
+            self.hands_model = hands_model()
+        self.cpu_meter = CpuMeter(self.workers)
+    
+    def wait_ready(self):
+        # Çalışan iş parçacığı modeller ve kamera hazır olana kadar bekler
+        while self.running:
+            try:
+                results = self.warm.wait(0.1)
+            except Exception as e:
+                print(f"Başlatma hatası: {e}")
+                return False
+            if results is not None:
+                if self.cap is None:
+                    self.cap = results['kamera açılışı']
+                report.print()
+                describe = getattr(self.cap, 'describe', None)
+                if describe is not None and describe():
+                    print(describe())
+                return True
+        return False
+
+    def detect_hands(self, rgb_frame):
+        return self.hands_model(rgb_frame)
 
-    def detect_hand_gestures(self, frame):
-        results = self.hands.process(cv2.cvtColor(frame, cv2.COLOR_BGR2RGB))
-        if results.multi_hand_landmarks:
-            for hand_landmarks in results.multi_hand_landmarks:
-                # İşaret ve orta parmak pozisyonları
-                index_tip = hand_landmarks.landmark[8]
-                middle_tip = hand_landmarks.landmark[12]
-                index_pip = hand_landmarks.landmark[6]
-                middle_pip = hand_landmarks.landmark[10]
+    def detect_hand_gestures(self, frame, hands):
+        # hands: (N, 21, 3) landmark dizisi ya da None
+        if hands is not None:
+            for hand in hands:
+                # İşaret ve orta parmak pozisyonları (uç ve orta eklem)
+                tips = hand[[INDEX_TIP, MIDDLE_TIP]]
+                pips = hand[[INDEX_PIP, MIDDLE_PIP]]
                 
                 h, w, _ = frame.shape
-                pos = (int((index_tip.x + middle_tip.x) * w / 2),
-                      int((index_tip.y + middle_tip.y) * h / 2))
+                tip_pixels = to_pixels(tips, w, h)
+                pos = tuple(to_pixels(tips.mean(axis=0), w, h).tolist())
                 
                 # İki parmak kalkık mı kontrol et
-                if (index_tip.y < index_pip.y and 
-                    middle_tip.y < middle_pip.y):
+                if (tips[:, 1] < pips[:, 1]).all():
                     
                     # Görselleştirme
                     cv2.circle(frame, pos, 10, (0, 255, 0), -1)
                     cv2.line(frame, 
-                            (int(index_tip.x * w), int(index_tip.y * h)),
-                            (int(middle_tip.x * w), int(middle_tip.y * h)),
+                            tuple(tip_pixels[0].tolist()),
+                            tuple(tip_pixels[1].tolist()),
                             (0, 255, 0), 2)
                     
                     return True, pos
                 
-                # El landmarkları görselleştirme
-                mp.solutions.drawing_utils.draw_landmarks(
-                    frame,
-                    hand_landmarks,
-                    self.mp_hands.HAND_CONNECTIONS,
-                    mp.solutions.drawing_styles.get_default_hand_landmarks_style(),
-                    mp.solutions.drawing_styles.get_default_hand_connections_style())
+                # El landmarkları görselleştirme (işçi sürecinde protobuf yok, diziden çizilir)
+                points = [tuple(p) for p in to_pixels(hand, w, h).tolist()]
+                for a, b in HAND_CONNECTIONS:
+                    cv2.line(frame, points[a], points[b], (255, 255, 255), 1)
+                for point in points:
+                    cv2.circle(frame, point, 2, (0, 0, 255), -1)
         
         return False, None
 
+    def face_changed(self, frame):
+        # Zamanlayıcının hareket kapısı: yüz ağı bu karede çalışmalı mı
+        gate = self.face_gate
+        if gate is None:
+            return True
+        eyes_used = not self.eye_tracker.is_calibrated or self.show_gaze
+        return gate.check(frame, self.gaze_refresh if eyes_used else None)
+    
+    def detect_face(self, frame, rgb_frame=None):
+        # (478, 3) normalize landmark dizisi, yüz yoksa None
+        cache = self.landmark_cache
+        if cache is not None:
+            key = cache.key(frame)
+            hit, landmarks = cache.get(key)
+            if hit:
+                return landmarks
+        
+        if rgb_frame is None:
+            rgb_frame = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
+        landmarks = self.face_model(rgb_frame)
+        if cache is not None:
+            cache.put(key, landmarks)
+        return landmarks
+
+    def next_buffer(self, frame):
+        # Küçük kare için boştaki halka tamponu (Tk hâlâ gösteriyorsa yenisi ayrılır)
+        width, height = self.inference_size
+        if self.rgb_buffer is None:
+            self.rgb_buffer = np.empty((height, width, 3), dtype=np.uint8)
+        if self.flip_buffer is None or self.flip_buffer.shape != frame.shape:
+            self.flip_buffer = np.empty_like(frame)
+        return self.frame_ring.acquire((height, width, 3))
+
     def update_frame(self):
+        if not self.wait_ready():
+            return
         while self.running:
+            small = None
             try:
                 ret, frame = self.cap.read()
                 if not ret:
                     continue
+                start = time.perf_counter()
                 
-                # Frame'i ekran boyutuna ölçekle
-                frame = cv2.flip(frame, 1)  # Ayna görüntüsü
-                frame = cv2.resize(frame, (self.screen_width, self.screen_height))
+                # Frame'i çıkarım boyutuna küçült (tamponlar yeniden kullanılır)
+                small = self.next_buffer(frame)
+                cv2.flip(frame, 1, dst=self.flip_buffer)  # Ayna görüntüsü
+                cv2.resize(self.flip_buffer, self.inference_size, dst=small,
+                           interpolation=cv2.INTER_AREA)
                 
-                # FPS hesaplama
-                current_time = time.time()
-                fps = 1 / (current_time - self.last_frame_time)
-                self.last_frame_time = current_time
-                self.fps_queue.append(fps)
-                avg_fps = sum(self.fps_queue) / len(self.fps_queue)
-                self.fps_label.config(text=f"FPS: {int(avg_fps)}")
-                
-                # Yüz landmark tespiti
-                rgb_frame = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
-                face_results = self.face_mesh.process(rgb_frame)
+                # Yüz ağı ve el tespiti (paralel, zamanlayıcı hangilerinin çalışacağını seçer)
+                # İşçi modunda RGB kare doğrudan paylaşılan belleğe yazılır
+                if self.workers is not None:
+                    rgb = cv2.cvtColor(small, cv2.COLOR_BGR2RGB, dst=self.workers.next_buffer())
+                    self.workers.commit()
+                else:
+                    rgb = cv2.cvtColor(small, cv2.COLOR_BGR2RGB, dst=self.rgb_buffer)
+                face_array, hand_results = self.scheduler.run(
+                    small, rgb, dragging=self.drag_active,
+                    full_rate_face=not self.eye_tracker.is_calibrated)
                 
-                if face_results.multi_face_landmarks:
-                    face_landmarks = [(int(l.x * frame.shape[1]), int(l.y * frame.shape[0])) 
-                                    for l in face_results.multi_face_landmarks[0].landmark]
+                if face_array is not None:
+                    # İris hareketi birkaç piksel: tamsayıya yuvarlamadan piksel koordinatları
+                    face_landmarks = face_array[:, :2] * np.array(
+                        [small.shape[1], small.shape[0]], dtype=np.float32)
                     
                     # Kalibrasyon veya göz takibi
                     if not self.eye_tracker.is_calibrated:
-                        frame, is_complete = self.eye_tracker.calibrate(frame, face_landmarks)
+                        small, is_complete = self.eye_tracker.calibrate(small, face_landmarks)
                     elif self.show_gaze:
-                        gaze_point = self.eye_tracker.get_gaze_point(frame, face_landmarks)
+                        gaze_point = self.eye_tracker.get_gaze_point(small, face_landmarks)
                         if gaze_point:
-                            cv2.circle(frame, gaze_point, 10, (0, 0, 255), -1)
-                            cv2.putText(frame, f"Gaze: {gaze_point}", 
-                                      (10, 60), cv2.FONT_HERSHEY_SIMPLEX, 
-                                      0.7, (0, 255, 0), 2)
+                            cv2.circle(small, gaze_point, 4, (0, 0, 255), -1)
+                            screen_point = tuple(int(v * self.display_scale) for v in gaze_point)
+                            cv2.putText(small, f"Gaze: {screen_point}", 
+                                      (10, 30), cv2.FONT_HERSHEY_SIMPLEX, 
+                                      0.5, (0, 255, 0), 1)
                 
-                # El hareketleri
-                drag_detected, hand_pos = self.detect_hand_gestures(frame)
+                # El hareketleri (konum ekran koordinatlarına ölçeklenir)
+                drag_detected, hand_pos = self.detect_hand_gestures(small, hand_results)
+                self.drag_active = drag_detected
                 if drag_detected and hand_pos:
-                    if not self.youtube_window.drag_data['dragging']:
-                        self.youtube_window.start_drag(hand_pos[0], hand_pos[1])
-                    else:
-                        self.youtube_window.on_drag(hand_pos[0], hand_pos[1])
-                else:
-                    self.youtube_window.stop_drag()
+                    hand_pos = (hand_pos[0] * self.display_scale, hand_pos[1] * self.display_scale)
                 
-                # Frame gösterimi - tam ekran boyutunda
-                image = Image.fromarray(cv2.cvtColor(frame, cv2.COLOR_BGR2RGB))
-                photo = ImageTk.PhotoImage(image=image)
-                self.canvas.create_image(0, 0, image=photo, anchor='nw')
-                self.canvas.image = photo
+                # FPS hesaplama: gösterim hariç kare başına işleme süresi
+                self.fps_queue.append(time.perf_counter() - start)
+                
+                dropped = self.frame_queue.put((small, drag_detected, hand_pos))
+                if dropped is not None:
+                    self.frame_ring.release(dropped[0])
                 
             except Exception as e:
                 print(f"Hata oluştu: {e}")
+                if small is not None:
+                    self.frame_ring.release(small)
                 continue
-                
+    
+    def render_frame(self):
+        # Tk iş parçacığında: en yeni kareyi göster, sürükleme ve FPS'i güncelle
+        if not self.running:
+            return
+        ok, item = self.frame_queue.get(0)
+        if ok:
+            frame, drag_detected, hand_pos = item
+            try:
+                self.renderer.show(frame)
+            except Exception as e:
+                print(f"Gösterim hatası: {e}")
+            self.frame_ring.release(frame)  # show() kopyaladı
+            
+            if drag_detected and hand_pos:
+                if not self.youtube_window.drag_data['dragging']:
+                    self.youtube_window.start_drag(hand_pos[0], hand_pos[1])
+                else:
+                    self.youtube_window.on_drag(hand_pos[0], hand_pos[1])
+            else:
+                self.youtube_window.stop_drag()
+            
+            if self.fps_queue:
+                avg_time = sum(self.fps_queue) / len(self.fps_queue)
+                self.fps_label.config(
+                    text=f"FPS: {int(1 / max(avg_time, 1e-6))} "
+                         f"(yüz 1/{self.scheduler.face_interval}, el 1/{self.scheduler.hands_interval})"
+                         f"{self.cpu_text}")
+        self.root.after(self.render_interval_ms, self.render_frame)
+    
+    def update_cpu(self):
+        # Saniyede bir: bu sürecin ve model işçilerinin CPU payı (100 = bir çekirdek)
+        if not self.running:
+            return
+        if self.cpu_meter is None:  # Modeller henüz yükleniyor
+            self.root.after(1000, self.update_cpu)
+            return
+        cpu = self.cpu_meter.sample()
+        if self.workers is not None:
+            self.cpu_text = f" | CPU %{cpu['process']:.0f} + işçiler %{cpu['workers']:.0f}"
+        else:
+            self.cpu_text = f" | CPU %{cpu['total']:.0f}"
+        self.root.after(1000, self.update_cpu)
                 
     def toggle_calibration(self):
         """Kalibrasyon modunu başlat/durdur"""
         if self.eye_tracker.is_calibrated:
-            self.eye_tracker = EyeTracker()
+            # Yeniden kalibre et, bitince profilin üzerine yazılır
+            self.eye_tracker = EyeTracker(*self.inference_size, self.profile_path,
+                                          load_profile=False)
         else:
             print("Kalibrasyon zaten devam ediyor...")
     
     def toggle_gaze(self):
         """Göz takibini aç/kapat"""
         self.show_gaze = not self.show_gaze
+        if self.face_gate is not None:
+            self.face_gate.reset()  # Kapı eski bir referansla devam etmesin
     
     def run(self):
         self.root.mainloop()
     
     def stop(self):
         self.running = False
-        if self.cap.isOpened():
-            self.cap.release()
+        self.scheduler.shutdown()
+        # Hazırlık sürüyorsa kamerayı açık bırakmamak için kısa süre bekle
+        self.warm.ready.wait(2.0)
+        cap = self.cap or self.warm.results.get('kamera açılışı')
+        if cap is not None and cap.isOpened():
+            cap.release()
+        if self.workers is not None:
+            self.workers.close()
+        if self.landmark_cache is not None:
+            self.landmark_cache.save()
         self.root.destroy()
 
 if __name__ == "__main__":
-    app = MainApp()
+    parser = argparse.ArgumentParser(description="Göz Takip Sistemi")
+    add_source_arguments(parser)
+    parser.add_argument('--landmark-cache', help="Yüz landmark önbelleği dosyası (.npy)")
+    parser.add_argument('--user', default='default', help="Kalibrasyon profili kullanıcı adı")
+    parser.add_argument('--recalibrate', action='store_true',
+                        help="Kayıtlı profili yok say ve yeniden kalibre et")
+    parser.add_argument('--no-motion-gate', dest='motion_gate', action='store_false',
+                        help="Durağan karelerde de yüz ağını çalıştır")
+    parser.add_argument('--workers', action='store_true',
+                        help="Yüz ve el modellerini ayrı süreçlerde çalıştır (GIL'den bağımsız)")
+    args = parser.parse_args()
+    
+    camera_name = 'replay' if args.replay else f"cam{args.camera}"
+    profile = profile_path(args.user, camera_name)
+    
+    cache = None
+    if args.landmark_cache:
+        cache = LandmarkCache((FACE_LANDMARKS, 3), path=args.landmark_cache)
+    app = MainApp(lambda: source_from_args(args, width=1920, height=1080), landmark_cache=cache,
+                  profile_path=profile, load_profile=not args.recalibrate,
+                  motion_gate=args.motion_gate, workers=args.workers)
     try:
         app.run()
     except Exception as e: